@@ -5,6 +5,7 @@ import os
 from datetime import datetime
 import plotly.express as px
 from src.utils.utils import load_css
+from src.utils.assets import get_asset_registry
 from src.pages.home import show_home
 from src.pages.nutrition_analysis import show_nutrition_analysis
 from src.pages.price_info import show_price_info
@@ -21,6 +22,9 @@ st.set_page_config(
 # CSS 스타일 로드
 load_css()
 
+# 과일 이미지 레지스트리 준비 (프로세스당 한 번 이미지 폴더 스캔)
+get_asset_registry()
+
 # 전역 스타일 - 사이드바 숨기기 및 메인 콘텐츠 최적화
 st.markdown("""
 <style>
@@ -1,8 +1,8 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-import os
 from src.utils.utils import get_seasonal_fruits
+from src.utils.thumbnails import SEASONAL_WIDTH, resolve_fruit_thumbnail
 
 def show_home():
     # 메인 타이틀
@@ -11,7 +11,7 @@ def show_home():
     
     # 현재 월의 계절 과일 추천
     current_month = datetime.now().month
-    seasonal_fruits = get_seasonal_fruits(current_month)
+    seasonal_fruits = get_seasonal_fruits(current_month, limit=4)
     
     if seasonal_fruits:
         st.markdown('<div class="highlight-box">', unsafe_allow_html=True)
@@ -201,169 +201,22 @@ def show_home():
     # 이달의 인기 과일 섹션
     st.markdown('<div class="seasonal-title">이달의 제철 과일</div>', unsafe_allow_html=True)
     
-    # 과일 이름을 이미지 파일명으로 매핑하는 딕셔너리
-    fruit_image_mapping = {
-        '사과': 'apple',
-        '살구': 'apricot',
-        '아보카도': 'avocado',
-        '바나나': 'banana',
-        '블루베리': 'blueberry',
-        '체리모야': 'cherimoya',
-        '체리': 'cherry',
-        '용과': 'dragonfruit',
-        '두리안': 'durian',
-        '무화과': 'fig',
-        '포도': 'grape',
-        '자몽': 'grapefruit',
-        '청포도': 'greengrape',
-        '구아바': 'guava',
-        '키위': 'kiwi',
-        '참외': 'koreamelon',
-        '자두': 'plum',
-        '한국 자두': 'koreanplum',
-        '레몬': 'lemon',
-        '리치': 'lychee',
-        '망고': 'mango',
-        '망고스틴': 'mangosteen',
-        '멜론': 'melon',
-        '오렌지': 'orange',
-        '파파야': 'papaya',
-        '복숭아': 'peach',
-        '배': 'pear',
-        '감': 'persimmon',
-        '파인애플': 'pineapple',
-        '석류': 'pomegranate',
-        '람부탄': 'rambutan',
-        '적포도': 'redgrape',
-        '스타프루트': 'starfruit',
-        '딸기': 'strawberry',
-        '귤': 'tangerine',
-        '감귤': 'tangerine',
-        '수박': 'watermelon',
-        '백포도': 'white',
-        '황금키위': 'yellow',
-        '유자': 'yuzu',
-        '매실': 'plum'
-    }
-
-    # 영어 과일 이름을 이미지 파일명에 직접 사용할 수 있는 매핑
-    english_fruit_mapping = {
-        'apple': 'apple',
-        'apricot': 'apricot',
-        'avocado': 'avocado',
-        'banana': 'banana',
-        'blueberry': 'blueberry',
-        'cherimoya': 'cherimoya',
-        'cherry': 'cherry',
-        'dragonfruit': 'dragonfruit',
-        'dragon fruit': 'dragonfruit',
-        'durian': 'durian',
-        'fig': 'fig',
-        'grape': 'grape',
-        'grapefruit': 'grapefruit',
-        'green grape': 'greengrape',
-        'guava': 'guava',
-        'kiwi': 'kiwi',
-        'korean melon': 'koreamelon',
-        'plum': 'plum',
-        'korean plum': 'koreanplum',
-        'lemon': 'lemon',
-        'lychee': 'lychee',
-        'mango': 'mango',
-        'mangosteen': 'mangosteen',
-        'melon': 'melon',
-        'orange': 'orange',
-        'papaya': 'papaya',
-        'peach': 'peach',
-        'pear': 'pear',
-        'persimmon': 'persimmon',
-        'pineapple': 'pineapple',
-        'pomegranate': 'pomegranate',
-        'rambutan': 'rambutan',
-        'red grape': 'redgrape',
-        'star fruit': 'starfruit',
-        'starfruit': 'starfruit',
-        'strawberry': 'strawberry',
-        'tangerine': 'tangerine',
-        'watermelon': 'watermelon',
-        'yuzu': 'yuzu'
-    }
-    
     # 계절 과일 표시
     if seasonal_fruits:
         cols = st.columns(4)
-        for idx, fruit in enumerate(seasonal_fruits[:4]):
+        for idx, fruit in enumerate(seasonal_fruits):
             with cols[idx % 4]:
                 # Streamlit expander를 사용하여 카드 형태 구현
                 fruit_name = fruit['Name']
                 fruit_kind = fruit['Kind']
                 with st.expander(f"**{fruit['Name']} ({fruit_kind})**", expanded=True):
-                    # 과일 이미지 표시 (로컬 이미지 폴더에서 가져오기)
-                    image_folder = 'assets/images'
-                    image_found = False
-                    
-                    # 매핑 딕셔너리를 사용하여 올바른 이미지 파일명 찾기
-                    image_filename = None
-                    
-                    # 한글 이름으로 매핑 시도
-                    if fruit['Name'] in fruit_image_mapping:
-                        image_filename = fruit_image_mapping[fruit['Name']]
-                    # 영어 이름으로 매핑 시도
-                    elif fruit_name.lower() in english_fruit_mapping:
-                        image_filename = english_fruit_mapping[fruit_name.lower()]
-                    # Kind 필드를 기반으로 이미지 매핑 시도
-                    elif fruit_kind:
-                        # Kind에서 언더스코어를 제거하고 첫 번째 단어만 사용
-                        kind_base = fruit_kind.split('_')[0]
-                        if kind_base in english_fruit_mapping:
-                            image_filename = english_fruit_mapping[kind_base]
-                        else:
-                            image_filename = kind_base
-                    # 그 외에는 원래 이름을 소문자로 변환하여 사용
+                    # 과일 이미지 표시 (이미지 레지스트리 조회 → 표시 폭에 맞춘 WebP 썸네일)
+                    image_path = resolve_fruit_thumbnail(fruit_name, fruit_kind, SEASONAL_WIDTH)
+                    if image_path:
+                        st.image(image_path, width=SEASONAL_WIDTH)
                     else:
-                        image_filename = fruit_name.lower()
-                    
-                    # 가능한 확장자 시도
-                    if image_filename:
-                        possible_extensions = ['.jpg', '.jpeg', '.png', '.gif']
-                        for ext in possible_extensions:
-                            image_path = os.path.join(image_folder, f"{image_filename}{ext}")
-                            if os.path.exists(image_path):
-                                st.image(image_path, width=180)
-                                image_found = True
-                                break
-                    
-                    # 이미지를 찾지 못한 경우, 각 단어 별로 매핑 시도
-                    if not image_found and ' ' in fruit_name:
-                        fruit_parts = fruit_name.lower().split()
-                        for part in fruit_parts:
-                            if part in english_fruit_mapping:
-                                image_filename = english_fruit_mapping[part]
-                                for ext in possible_extensions:
-                                    image_path = os.path.join(image_folder, f"{image_filename}{ext}")
-                                    if os.path.exists(image_path):
-                                        st.image(image_path, width=180)
-                                        image_found = True
-                                        break
-                            if image_found:
-                                break
-                    
-                    # 그래도 이미지를 찾지 못한 경우 기본 이미지나 메시지 표시
-                    if not image_found:
-                        # 대부분의 과일 이미지를 찾기 위한 마지막 시도
-                        fallback_image = None
-                        for img_file in os.listdir(image_folder):
-                            if img_file.lower().endswith(('.jpg', '.jpeg', '.png', '.gif')):
-                                base_name = os.path.splitext(img_file)[0].lower()
-                                if fruit_name.lower() in base_name or base_name in fruit_name.lower():
-                                    fallback_image = os.path.join(image_folder, img_file)
-                                    break
-                        
-                        if fallback_image and os.path.exists(fallback_image):
-                            st.image(fallback_image, width=180)
-                        else:
-                            # 아예 이미지를 찾지 못하면 기본 아이콘 표시
-                            st.markdown("## 🍎", unsafe_allow_html=True)
+                        # 아예 이미지를 찾지 못하면 기본 아이콘 표시
+                        st.markdown("## 🍎", unsafe_allow_html=True)
                     
                     # 과일 정보 (새로운 스키마에 맞게 수정)
                     if fruit['coupang_price'] and fruit['coupang_price'] > 0:
@@ -1,45 +1,28 @@
 import streamlit as st
 import pandas as pd
-import os
-import json
 import plotly.express as px
-from src.utils.utils import get_fruit_nutrition, get_fruit_varieties, search_fruits
+from src.utils.snapshot import get_fruit_snapshot
+from src.utils.search import get_search_index
+from src.utils.autocomplete import get_autocomplete_index
+from src.utils.similarity import similar_fruits
+from src.utils.nutrition import get_nutrition_repository
+from src.utils.thumbnails import CARD_WIDTH, resolve_fruit_thumbnail
 
 def load_fruit_data():
-    """data.json에서 과일 칼로리 정보를 로드합니다."""
-    try:
-        with open('static/data.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data
-    except FileNotFoundError:
-        return []
+    """data.json 영양 정보 저장소를 반환합니다. (파일이 바뀐 경우에만 다시 파싱)"""
+    return get_nutrition_repository()
 
 def get_fruit_info(fruit_name, fruit_data):
-    """특정 과일의 모든 정보를 반환합니다."""
-    fruit_info = [item for item in fruit_data if item.get('과일명') == fruit_name]
-    if fruit_info:
-        # 첫 번째 품종의 정보 반환 (일반적으로 '일반' 품종)
-        info = fruit_info[0]
-        return {
-            'calories': info.get('칼로리 (kcal/100g)', '정보 없음'),
-            'sweetness': info.get('당도 (°Brix)', '정보 없음'),
-            'origin': info.get('주요 원산지', '정보 없음'),
-            'season': info.get('재배 시기', '정보 없음')
-        }
-    return {
-        'calories': '정보 없음',
-        'sweetness': '정보 없음', 
-        'origin': '정보 없음',
-        'season': '정보 없음'
-    }
+    """특정 과일의 모든 정보를 반환합니다. (기본 품종, 일반적으로 '일반' 품종 기준)"""
+    return fruit_data.info(fruit_name)
 
 def get_fruit_calories(fruit_name, fruit_data):
     """특정 과일의 칼로리 정보를 반환합니다."""
-    fruit_info = [item for item in fruit_data if item.get('과일명') == fruit_name]
-    if fruit_info:
-        # 첫 번째 품종의 칼로리 정보 반환 (일반적으로 '일반' 품종)
-        return fruit_info[0].get('칼로리 (kcal/100g)', '정보 없음')
-    return '정보 없음'
+    return fruit_data.info(fruit_name)['calories']
+
+def apply_search_suggestion(name):
+    """자동완성 후보 버튼 콜백: 검색창 값을 후보 과일명으로 바꿉니다."""
+    st.session_state.fruit_search = name
 
 def show_nutrition_analysis():
     # CSS 스타일 추가
@@ -59,9 +42,9 @@ def show_nutrition_analysis():
     # 과일 칼로리 데이터 로드
     fruit_data = load_fruit_data()
     
-    # 영양 성분 데이터 가져오기
-    fruits = get_fruit_nutrition()
-    fruits_df = pd.DataFrame([dict(fruit) for fruit in fruits])
+    # 영양 성분 데이터 가져오기 (프로세스 공유 스냅샷)
+    snapshot = get_fruit_snapshot()
+    fruits_df = snapshot.frame
     
     # 세션 상태 초기화
     if 'selected_fruit' not in st.session_state:
@@ -73,8 +56,7 @@ def show_nutrition_analysis():
     # 선택된 과일 상세 정보 표시
     if st.session_state.selected_fruit:
         # 해당 과일의 모든 품종 가져오기
-        fruit_varieties_data = get_fruit_varieties(st.session_state.selected_fruit)
-        fruit_varieties_df = pd.DataFrame([dict(fruit) for fruit in fruit_varieties_data])
+        fruit_varieties_df = snapshot.varieties(st.session_state.selected_fruit)
         
         if not fruit_varieties_df.empty:
             # 과일 이름과 대표 이미지 (첫 번째 품종의 이미지 사용)
@@ -101,27 +83,10 @@ def show_nutrition_analysis():
             col1, col2 = st.columns([1, 3])
             
             with col1:
-                # 이미지 표시 로직 (기존과 동일하게 유지하되 fruit_name 대신 Name 사용)
-                fruit_name = first_variety['Name'].lower()
-                
-                # 과일 이름을 이미지 파일명으로 매핑하는 딕셔너리
-                fruit_image_mapping = {
-                    '사과': 'apple', '배': 'pear', '복숭아': 'peach', '포도': 'grape',
-                    '망고': 'mango', '키위': 'kiwi', '바나나': 'banana', '딸기': 'strawberry',
-                    '오렌지': 'orange', '레몬': 'lemon', '자두': 'plum', '체리': 'cherry',
-                    '블루베리': 'blueberry', '수박': 'watermelon', '멜론': 'melon', '참외': 'koreamelon',
-                    '파인애플': 'pineapple', '아보카도': 'avocado', '석류': 'pomegranate', '무화과': 'fig',
-                    '감': 'persimmon', '자몽': 'grapefruit', '용과': 'dragonfruit', '망고스틴': 'mangosteen',
-                    '두리안': 'durian', '스타프루트': 'starfruit', '구아바': 'guava', '리치': 'lychee',
-                    '파파야': 'papaya', '체리모야': 'cherimoya', '람부탄': 'rambutan', '살구': 'apricot',
-                    '유자': 'yuzu', '감귤': 'tangerine', '귤': 'tangerine', '청포도': 'greengrape',
-                    '적포도': 'redgrape', '매실': 'plum'
-                }
-                
-                image_filename = fruit_image_mapping.get(first_variety['Name'], fruit_name)
-                image_path = os.path.join('assets/images', f"{image_filename}.png")
+                # 이미지 표시 (이미지 레지스트리 조회 → WebP 썸네일)
+                image_path = resolve_fruit_thumbnail(first_variety['Name'], first_variety['Kind'], CARD_WIDTH)
                 
-                if os.path.exists(image_path):
+                if image_path:
                     st.image(image_path, caption=f"{first_variety['Name']}")
                 else:
                     st.info("이미지를 찾을 수 없습니다.")
@@ -240,7 +205,62 @@ def show_nutrition_analysis():
                             </table>
                         </div>
                         """, unsafe_allow_html=True)
-            
+
+            # 비슷한 과일 섹션 (칼로리/당도/재배 시기/가격 기준 최근접 이웃)
+            st.markdown('<div class="wiki-section">', unsafe_allow_html=True)
+            st.markdown('<div class="wiki-section-title">비슷한 과일</div>', unsafe_allow_html=True)
+            st.markdown('</div>', unsafe_allow_html=True)
+
+            similar_filter = st.radio(
+                "조건",
+                ["전체", "더 저렴한", "덜 단"],
+                horizontal=True,
+                key="similar_filter",
+                label_visibility="collapsed"
+            )
+            similar_df = similar_fruits(
+                first_variety['Name'],
+                k=cards_per_row,
+                cheaper=similar_filter == "더 저렴한",
+                less_sweet=similar_filter == "덜 단"
+            )
+
+            if similar_df.empty:
+                st.info("조건에 맞는 비슷한 과일이 없습니다.")
+            else:
+                cols = st.columns(cards_per_row)
+                for i, (_, similar) in enumerate(similar_df.iterrows()):
+                    with cols[i]:
+                        price_text = f"{similar['price']:.0f} 원/100g" if pd.notna(similar['price']) else "정보 없음"
+                        calories_text = f"{similar['calories']:.0f} kcal" if pd.notna(similar['calories']) else "정보 없음"
+                        sweetness_text = f"{similar['sweetness']} °Brix" if pd.notna(similar['sweetness']) else "정보 없음"
+                        st.markdown(f"""
+                        <div class="wiki-card" style="height: 100%;">
+                            <div class="wiki-title" style="font-size: 1.2rem; text-align: center;">{similar['Name']}</div>
+                            <table class="wiki-table">
+                                <tr>
+                                    <th>품종</th>
+                                    <td>{similar['Kind']}</td>
+                                </tr>
+                                <tr>
+                                    <th>가격</th>
+                                    <td>{price_text}</td>
+                                </tr>
+                                <tr>
+                                    <th>칼로리</th>
+                                    <td>{calories_text}</td>
+                                </tr>
+                                <tr>
+                                    <th>당도</th>
+                                    <td>{sweetness_text}</td>
+                                </tr>
+                            </table>
+                        </div>
+                        """, unsafe_allow_html=True)
+                        if st.button("상세 정보 보기", key=f"similar_{similar['id']}"):
+                            st.session_state.selected_fruit = similar['Name']
+                            st.rerun()
+
             # 위키 참고 자료 섹션
             st.markdown('<div class="wiki-section">', unsafe_allow_html=True)
             st.markdown('<div class="wiki-section-title">참고 자료</div>', unsafe_allow_html=True)
@@ -257,15 +277,29 @@ def show_nutrition_analysis():
     else:
         # 검색 기능 (선택된 과일이 없을 때만 표시)
         st.markdown('<div class="search-container">', unsafe_allow_html=True)
-        search_term = st.text_input("과일 이름 검색", "")
+        search_term = st.text_input("과일 이름 검색", key="fruit_search")
+        
+        # 자동완성 후보 (입력 중인 음절/초성/영어 품종 코드도 접두로 찾음), 클릭 시 검색어로 채움
+        suggestions = get_autocomplete_index(snapshot).suggest(search_term) if search_term else []
+        if suggestions and suggestions != [search_term.strip()]:
+            suggestion_cols = st.columns(len(suggestions))
+            for col, name in zip(suggestion_cols, suggestions):
+                col.button(name, key=f"suggest_{name}", on_click=apply_search_suggestion, args=(name,))
         st.markdown('</div>', unsafe_allow_html=True)
         
         # 과일 종류별로 중복 제거하여 대표 과일만 표시
         unique_fruits = fruits_df.drop_duplicates(subset=['Name'])
         
-        # 검색 결과 필터링
+        # 검색 결과 필터링 (검색 색인의 관련도 순서 유지)
         if search_term:
-            filtered_fruits = unique_fruits[unique_fruits['Name'].str.contains(search_term)]
+            search_index = get_search_index(snapshot)
+            ranked_names = search_index.search_names(search_term, fuzzy=False)
+            if not ranked_names:
+                # 일치 결과가 없으면 오타 허용 검색 (예: '파인에플' → 파인애플)
+                ranked_names = search_index.search_names(search_term)
+                if ranked_names:
+                    st.caption(f"'{search_term}'와(과) 일치하는 과일이 없어 비슷한 이름으로 찾은 결과입니다.")
+            filtered_fruits = unique_fruits.set_index('Name', drop=False).reindex(ranked_names).dropna(subset=['id'])
         else:
             filtered_fruits = unique_fruits
         
@@ -292,28 +326,13 @@ def show_nutrition_analysis():
                     with cols[j]:
                         fruit_id = fruit['id']
                         
-                        # 과일 이름을 이미지 파일명으로 매핑
-                        fruit_image_mapping = {
-                            '사과': 'apple', '배': 'pear', '복숭아': 'peach', '포도': 'grape',
-                            '망고': 'mango', '키위': 'kiwi', '바나나': 'banana', '딸기': 'strawberry',
-                            '오렌지': 'orange', '레몬': 'lemon', '자두': 'plum', '체리': 'cherry',
-                            '블루베리': 'blueberry', '수박': 'watermelon', '멜론': 'melon', '참외': 'koreamelon',
-                            '파인애플': 'pineapple', '아보카도': 'avocado', '석류': 'pomegranate', '무화과': 'fig',
-                            '감': 'persimmon', '자몽': 'grapefruit', '용과': 'dragonfruit', '망고스틴': 'mangosteen',
-                            '두리안': 'durian', '스타프루트': 'starfruit', '구아바': 'guava', '리치': 'lychee',
-                            '파파야': 'papaya', '체리모야': 'cherimoya', '람부탄': 'rambutan', '살구': 'apricot',
-                            '유자': 'yuzu', '감귤': 'tangerine', '귤': 'tangerine', '청포도': 'greengrape',
-                            '적포도': 'redgrape', '매실': 'plum'
-                        }
-                        
                         # 카드 스타일의 expander 사용
                         with st.expander(f"**{fruit['Name']}**", expanded=True):
                             # 이미지 표시
-                            image_filename = fruit_image_mapping.get(fruit['Name'], fruit['Name'].lower())
-                            image_path = os.path.join('assets/images', f"{image_filename}.png")
+                            image_path = resolve_fruit_thumbnail(fruit['Name'], fruit['Kind'], CARD_WIDTH)
                             
-                            if os.path.exists(image_path):
-                                st.image(image_path, width=200, use_container_width=True)
+                            if image_path:
+                                st.image(image_path, use_container_width=True)
                             else:
                                 st.info("이미지 없음")
                             
@@ -3,71 +3,46 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import sqlite3
-import os
 from datetime import datetime, timedelta
 import numpy as np
-
-def get_db_connection():
-    """데이터베이스 연결"""
-    db_path = os.path.join('database', 'a.sqlite3')
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    return conn
+from src.utils.utils import get_db_connection
+from src.utils.snapshot import get_fruit_snapshot
+from src.utils.taxonomy import get_taxonomy
+from src.utils.ranking import add_rank_columns, grouped_top_k
+from src.utils.price_trends import SEASONS, HistoricalAverageModel, SeasonalCurveModel, seasonal_price_trends
+from src.utils.price_history import has_price_history, load_rollup, seasonal_ratio_history
+from src.utils.retailers import RETAILER_LABELS, RETAILERS, TIE, compare_retailers, retailer_win_rates
+from src.utils.stats import load_category_stats, load_fruit_stats
 
 def get_all_fruits_with_prices():
-    """가격 정보가 있는 모든 과일 데이터 가져오기"""
-    conn = get_db_connection()
-    fruits = conn.execute('''
-        SELECT * FROM fruit 
-        WHERE coupang_price > 0
-        ORDER BY Name, coupang_price
-    ''').fetchall()
-    conn.close()
-    return fruits
+    """가격 정보가 있는 모든 과일 데이터 가져오기 (공유 스냅샷 기반 DataFrame)"""
+    df = get_fruit_snapshot().frame
+    df = df[df['coupang_price'] > 0]
+    df = df.sort_values(['Name', 'coupang_price'], kind='stable').reset_index(drop=True)
+    # 식물학적 분류는 공유 데이터셋에서 한 번만 계산 (고유 이름별 색인 조회 → Categorical)
+    df['botanical_type'] = get_taxonomy().classify(df['Name'])
+    # 전체/분류별 가격 순위는 정렬 한 번으로 미리 계산 (화면에서는 컬럼만 읽음)
+    return add_rank_columns(df)
+
+def get_retailer_comparison():
+    """판매처(쿠팡/네이버) 비교 DataFrame (가격이 하나라도 있는 품종, 최저가 기준 순위 포함)"""
+    df = get_fruit_snapshot().frame
+    df['botanical_type'] = get_taxonomy().classify(df['Name'])
+    comparison = compare_retailers(df)
+    comparison = comparison.sort_values(['Name', 'best_price'], kind='stable').reset_index(drop=True)
+    return add_rank_columns(comparison, column='best_price')
 
 def get_price_statistics():
-    """가격 통계 정보 가져오기"""
-    conn = get_db_connection()
-    stats = conn.execute('''
-        SELECT 
-            COUNT(*) as total_count,
-            AVG(coupang_price) as avg_price,
-            MIN(coupang_price) as min_price,
-            MAX(coupang_price) as max_price,
-            Name
-        FROM fruit 
-        WHERE coupang_price > 0
-        GROUP BY Name
-        ORDER BY avg_price DESC
-    ''').fetchall()
-    conn.close()
-    return stats
+    """가격 통계 정보 가져오기 (fruit_stats 요약 테이블, 없으면 스냅샷에서 같은 요약 계산)"""
+    stats = load_fruit_stats().rename(columns={'count': 'total_count'})
+    return stats[['total_count', 'avg_price', 'min_price', 'max_price', 'Name']].to_dict('records')
 
-def get_seasonal_price_trends():
-    """계절별 가격 트렌드 데이터 생성 (시뮬레이션)"""
-    fruits = get_all_fruits_with_prices()
-    df = pd.DataFrame([dict(fruit) for fruit in fruits])
-    
-    # 계절별 가격 변동 시뮬레이션 (실제 데이터가 없으므로)
-    seasons = ['봄', '여름', '가을', '겨울']
-    seasonal_data = []
-    
-    for _, fruit in df.iterrows():
-        base_price = fruit['coupang_price']
-        for i, season in enumerate(seasons):
-            # 계절별 가격 변동 (랜덤하게 생성)
-            variation = np.random.uniform(0.8, 1.2)
-            price = base_price * variation
-            seasonal_data.append({
-                'Name': fruit['Name'],
-                'Kind': fruit['Kind'],
-                'Season': season,
-                'Price': price,
-                'Base_Price': base_price
-            })
-    
-    return pd.DataFrame(seasonal_data)
+def get_seasonal_price_trends(model=None):
+    """계절별 가격 트렌드 데이터 생성 (시뮬레이션, 재배 시기 기반 + 고정 시드라 매 실행 동일)"""
+    df = get_all_fruits_with_prices()
+    trends = seasonal_price_trends(df, model)
+    trends['botanical_type'] = df['botanical_type'].repeat(len(SEASONS)).to_numpy()
+    return trends
 
 def create_premium_theme():
     """프리미엄 테마 설정"""
@@ -81,33 +56,11 @@ def create_premium_theme():
     }
 
 def get_fruit_category(fruit_name):
-    """과실의 식물학적 분류 함수"""
-    categories = {
-        '이과': ['사과', '배'],
-        '핵과': ['복숭아', '자두', '살구', '체리', '매실', '망고', '람부탄', '리치', '백도', '황도', '청도'],
-        '장과류': ['포도', '블루베리', '감', '구아바', '망고스틴', '바나나', '스타프루트', '아보카도', '용과', '적포도', '청포도', '파파야'],
-        '감과체': ['감귤', '레몬', '오렌지', '자몽', '유자'],
-        '박과열매': ['수박', '멜론', '참외'],
-        '취합과': ['딸기', '체리모야'],
-        '다화과': ['파인애플', '무화과'],
-        '석류과': ['석류'],
-        '삭과': ['두리안'],
-        '기타과실': []
-    }
-    
-    for category, fruits in categories.items():
-        if any(fruit in fruit_name for fruit in fruits):
-            return category
-    return '기타과실'
+    """과실의 식물학적 분류 함수 (컴파일된 분류 색인 조회)"""
+    return get_taxonomy().category(fruit_name)
 
-def create_category_overview_chart(df):
-    """식물학적 분류별 개요 차트 생성"""
-    # 식물학적 분류별 분류
-    df['botanical_type'] = df['Name'].apply(get_fruit_category)
-    
-    # 식물학적 분류별 통계 계산
-    category_stats = df.groupby('botanical_type')['coupang_price'].agg(['mean', 'min', 'max', 'count']).reset_index()
-    category_stats.columns = ['botanical_type', 'avg_price', 'min_price', 'max_price', 'count']
+def create_category_overview_chart(df, category_stats):
+    """식물학적 분류별 개요 차트 생성 (category_stats: 분류별 요약 테이블)"""
     category_stats = category_stats.sort_values('avg_price', ascending=False)
     
     theme = create_premium_theme()
@@ -173,7 +126,7 @@ def create_category_detail_chart(df, selected_category):
     category_df = df[df['botanical_type'] == selected_category].copy()
     
     if len(category_df) == 0:
-        return None, None
+        return None, None, None
     
     theme = create_premium_theme()
     
@@ -183,7 +136,8 @@ def create_category_detail_chart(df, selected_category):
     category_df_sorted = category_df.sort_values('coupang_price', ascending=True)
     
     fig1.add_trace(go.Bar(
-        x=category_df_sorted['Name'] + ' (' + category_df_sorted['Kind'] + ')',
+        # 스냅샷의 Name/Kind는 Categorical이므로 문자열로 바꾼 뒤 연결
+        x=category_df_sorted['Name'].astype(str) + ' (' + category_df_sorted['Kind'].astype(str) + ')',
         y=category_df_sorted['coupang_price'],
         name='가격',
         marker=dict(
@@ -232,11 +186,8 @@ def create_category_detail_chart(df, selected_category):
 
 def create_category_trend_chart(seasonal_trends):
     """식물학적 분류별 계절 트렌드 차트"""
-    # 식물학적 분류별 분류 추가
-    seasonal_trends['botanical_type'] = seasonal_trends['Name'].apply(get_fruit_category)
-    
     # 식물학적 분류별 계절 평균 계산
-    category_seasonal = seasonal_trends.groupby(['botanical_type', 'Season'])['Price'].mean().reset_index()
+    category_seasonal = seasonal_trends.groupby(['botanical_type', 'Season'], observed=True)['Price'].mean().reset_index()
     
     theme = create_premium_theme()
     fig = go.Figure()
@@ -267,6 +218,67 @@ def create_category_trend_chart(seasonal_trends):
     
     return fig, category_seasonal
 
+def create_category_timeseries_chart(rollup, resolution):
+    """식물학적 분류별 가격 추이 차트 (롤업 구간 단위)"""
+    if rollup.empty:
+        return None
+    rollup = rollup.assign(
+        botanical_type=get_taxonomy().classify(rollup['Name']),
+        total=rollup['avg_price'] * rollup['n'],
+    )
+    # 구간 × 분류 평균은 관측 수 가중 평균
+    grouped = rollup.groupby(['bucket', 'botanical_type'], observed=True)[['total', 'n']].sum().reset_index()
+    grouped['avg_price'] = grouped['total'] / grouped['n']
+    
+    theme = create_premium_theme()
+    fig = go.Figure()
+    
+    for i, category in enumerate(grouped['botanical_type'].unique()):
+        cat_data = grouped[grouped['botanical_type'] == category]
+        fig.add_trace(go.Scatter(
+            x=cat_data['bucket'],
+            y=cat_data['avg_price'],
+            mode='lines+markers',
+            name=category,
+            line=dict(color=theme['gradient_colors'][i % len(theme['gradient_colors'])], width=3),
+            marker=dict(size=6),
+            hovertemplate=f'<b>{category}</b><br>%{{x}}<br>평균 가격: %{{y:.0f}}원<extra></extra>'
+        ))
+    
+    title = {'day': '일별', 'week': '주별', 'month': '월별'}[resolution]
+    fig = apply_premium_layout(fig, f"📈 식물학적 분류별 {title} 가격 추이", 500)
+    fig.update_xaxes(title_text="기간", title_font_size=12)
+    fig.update_yaxes(title_text="평균 가격 (원)", title_font_size=12)
+    
+    return fig
+
+def create_retailer_win_chart(win_rates):
+    """식물학적 분류별 판매처 최저가 비율 차트 (누적 가로 막대)"""
+    if win_rates.empty:
+        return None
+    
+    theme = create_premium_theme()
+    fig = go.Figure()
+    
+    labels = {**RETAILER_LABELS, TIE: '동일가'}
+    colors = {RETAILERS[0]: theme['primary_colors'][0], RETAILERS[1]: '#03C75A', TIE: 'rgba(151, 151, 151, 0.5)'}
+    for column in [*RETAILERS, TIE]:
+        fig.add_trace(go.Bar(
+            y=win_rates.index.astype(str),
+            x=win_rates[column],
+            orientation='h',
+            name=labels[column],
+            marker=dict(color=colors.get(column), line=dict(color='white', width=1)),
+            customdata=win_rates['compared'],
+            hovertemplate=f'<b>%{{y}}</b><br>{labels[column]}: %{{x:.0f}}%<br>비교 품종: %{{customdata}}개<extra></extra>'
+        ))
+    
+    fig = apply_premium_layout(fig, "🛒 식물학적 분류별 판매처 최저가 비율", 400)
+    fig.update_layout(barmode='stack')
+    fig.update_xaxes(title_text="최저가 비율 (%)", title_font_size=12, range=[0, 100])
+    
+    return fig
+
 def apply_premium_layout(fig, title="", height=500):
     """프리미엄 레이아웃 적용"""
     theme = create_premium_theme()
@@ -319,6 +331,343 @@ def apply_premium_layout(fig, title="", height=500):
     
     return fig
 
+# 트렌드 차트 집계 단위 → (롤업 단위, 표시 구간 수)
+TREND_RESOLUTIONS = {'일별': ('day', 90), '주별': ('week', 52), '월별': ('month', 36)}
+
+PRICE_TABS = ["🍎 식물학적 분류별 가격분석", "📈 식물학적 분류별 트렌드", "🔍 상세 검색", "🛒 판매처 비교", "💡 추천 정보"]
+
+# 탭별 계산 결과는 스냅샷 버전을 키로 캐시 → DB가 바뀌기 전까지는 재실행해도 다시 계산하지 않음
+@st.cache_data(show_spinner=False)
+def load_category_overview(data_version):
+    """식물학적 분류별 개요 차트/통계 (데이터 버전별 캐시)"""
+    return create_category_overview_chart(get_all_fruits_with_prices(), load_category_stats())
+
+@st.cache_data(show_spinner=False)
+def load_category_detail(data_version, selected_category):
+    """선택된 식물학적 분류의 상세 차트/통계 (데이터 버전, 분류별 캐시)"""
+    df_with_category = load_category_overview(data_version)[3]
+    return create_category_detail_chart(df_with_category, selected_category)
+
+@st.cache_data(show_spinner=False)
+def load_category_trends(data_version):
+    """식물학적 분류별 계절 트렌드 차트/집계 (데이터 버전별 캐시)
+
+    가격 이력이 있으면 월별 롤업의 계절 비율을, 관측이 없는 칸은 재배 시기 기반 시뮬레이션을 사용
+    """
+    model = None
+    if has_price_history():
+        model = HistoricalAverageModel(seasonal_ratio_history(), fallback=SeasonalCurveModel())
+    return create_category_trend_chart(get_seasonal_price_trends(model))
+
+@st.cache_data(show_spinner=False)
+def load_category_timeseries(data_version, resolution, periods):
+    """롤업 테이블에서 최근 periods개 구간의 식물학적 분류별 평균가 차트 (데이터 버전별 캐시)"""
+    return create_category_timeseries_chart(load_rollup(resolution, periods), resolution)
+
+@st.cache_data(show_spinner=False)
+def load_retailer_comparison(data_version):
+    """판매처 비교 DataFrame, 분류별 최저가 비율, 비율 차트 (데이터 버전별 캐시)"""
+    comparison = get_retailer_comparison()
+    win_rates = retailer_win_rates(comparison)
+    return comparison, win_rates, create_retailer_win_chart(win_rates)
+
+@st.cache_data(show_spinner=False)
+def load_top_picks(data_version, k=3, k_overall=5, key='best_price'):
+    """분류별 TOP k와 전체 TOP k_overall (한 번의 정렬, 데이터 버전/순위 기준별 캐시)"""
+    return grouped_top_k(load_retailer_comparison(data_version)[0], k, k_overall, key=key)
+
+@st.fragment
+def show_category_tab(data_version, avg_price):
+    """식물학적 분류별 가격분석 탭 (분류 버튼 클릭 시 이 탭만 다시 실행)"""
+    st.markdown('<div class="section-title">🍎 식물학적 분류별 가격 개요</div>', unsafe_allow_html=True)
+    
+    # 식물학적 분류별 개요 차트 생성
+    fig1, fig2, category_stats, df_with_category = load_category_overview(data_version)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.plotly_chart(fig1, use_container_width=True)
+    with col2:
+        st.plotly_chart(fig2, use_container_width=True)
+    
+    # 식물학적 분류 선택
+    st.markdown('<div class="section-title">🔍 식물학적 분류별 상세 분석</div>', unsafe_allow_html=True)
+    
+    # 세션 상태 초기화
+    if 'selected_category' not in st.session_state:
+        st.session_state.selected_category = None
+    
+    # 식물학적 분류 버튼들
+    categories = sorted(df_with_category['botanical_type'].unique())
+    
+    # 버튼 레이아웃
+    cols = st.columns(len(categories))
+    for i, category in enumerate(categories):
+        with cols[i]:
+            if st.button(category, key=f"cat_btn_{category}"):
+                st.session_state.selected_category = category
+    
+    # 선택된 식물학적 분류의 상세 분석
+    if st.session_state.selected_category:
+        selected_cat = st.session_state.selected_category
+        
+        st.markdown(f'<div class="section-title">📊 {selected_cat} 상세 분석</div>', unsafe_allow_html=True)
+        
+        # 상세 차트 생성
+        detail_fig1, detail_fig2, stats = load_category_detail(data_version, selected_cat)
+        
+        if detail_fig1 is not None:
+            # 통계 요약
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("품종 수", f"{stats['count']}개")
+            with col2:
+                st.metric("평균 가격", f"{stats['avg_price']:.0f}원")
+            with col3:
+                st.metric("최저가", f"{stats['min_price']:.0f}원")
+            with col4:
+                st.metric("최고가", f"{stats['max_price']:.0f}원")
+            
+            # 상세 차트
+            col1, col2 = st.columns([2, 1])
+            with col1:
+                st.plotly_chart(detail_fig1, use_container_width=True)
+            with col2:
+                st.plotly_chart(detail_fig2, use_container_width=True)
+            
+            # 개별 과일 정보
+            st.markdown(f'<div class="section-title">📋 {selected_cat} 개별 과일 정보</div>', unsafe_allow_html=True)
+            category_fruits = df_with_category[df_with_category['botanical_type'] == selected_cat].sort_values('coupang_price')
+            
+            for idx, (_, fruit) in enumerate(category_fruits.iterrows(), 1):
+                col1, col2, col3 = st.columns([2, 1, 1])
+                
+                with col1:
+                    rank_in_category = fruit['category_rank']
+                    total_in_category = fruit['category_size']
+                    st.markdown(f"""
+                    <div class="fruit-price-card">
+                        <h4>#{rank_in_category} {fruit['Name']} - {fruit['Kind']}</h4>
+                        <p><strong>가격:</strong> {fruit['coupang_price']}원/100g</p>
+                        <p><strong>{selected_cat} 내 순위:</strong> {rank_in_category}/{total_in_category}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                with col2:
+                    delta_from_cat_avg = fruit['coupang_price'] - stats['avg_price']
+                    st.metric("식물학적 분류 평균 대비", f"{delta_from_cat_avg:+.0f}원")
+                
+                with col3:
+                    delta_from_total_avg = fruit['coupang_price'] - avg_price
+                    st.metric("전체 평균 대비", f"{delta_from_total_avg:+.0f}원")
+
+def show_trend_tab(data_version):
+    """식물학적 분류별 트렌드 탭"""
+    if has_price_history():
+        st.markdown('<div class="section-title">📅 식물학적 분류별 가격 추이</div>', unsafe_allow_html=True)
+        
+        # 차트 단위에 맞는 롤업만 조회 (원본 관측값은 읽지 않음)
+        resolution_label = st.radio("집계 단위", list(TREND_RESOLUTIONS), horizontal=True, key="trend_resolution")
+        resolution, periods = TREND_RESOLUTIONS[resolution_label]
+        timeseries_fig = load_category_timeseries(data_version, resolution, periods)
+        if timeseries_fig is not None:
+            st.plotly_chart(timeseries_fig, use_container_width=True)
+    else:
+        st.caption("가격 이력이 없어 재배 시기 기반 시뮬레이션으로 계절 트렌드를 표시합니다.")
+    
+    st.markdown('<div class="section-title">📈 식물학적 분류별 계절 트렌드</div>', unsafe_allow_html=True)
+    
+    # 트렌드 차트 생성
+    trend_fig, category_seasonal = load_category_trends(data_version)
+    st.plotly_chart(trend_fig, use_container_width=True)
+    
+    # 계절별 식물학적 분류 순위
+    st.markdown('<div class="section-title">🏆 계절별 식물학적 분류 순위</div>', unsafe_allow_html=True)
+    
+    cols = st.columns(len(SEASONS))
+    
+    for i, season in enumerate(SEASONS):
+        with cols[i]:
+            season_data = category_seasonal[category_seasonal['Season'] == season].sort_values('Price', ascending=False)
+            
+            st.markdown(f"**{season} 🏆**")
+            for idx, (_, row) in enumerate(season_data.head(3).iterrows(), 1):
+                medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉"
+                st.markdown(f"{medal} {row['botanical_type']}: {row['Price']:.0f}원")
+
+@st.fragment
+def show_search_tab(df, avg_price):
+    """상세 검색 탭 (필터 변경 시 이 탭만 다시 실행)"""
+    st.markdown('<div class="section-title">🎯 상세 검색 및 정렬</div>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        # 식물학적 분류 선택
+        selected_category_search = st.selectbox(
+            "🍎 식물학적 분류 선택",
+            options=["전체"] + sorted(df['botanical_type'].unique()),
+            index=0
+        )
+    
+    with col2:
+        # 과일 선택
+        if selected_category_search != "전체":
+            available_fruits = df[df['botanical_type'] == selected_category_search]['Name'].unique()
+        else:
+            available_fruits = df['Name'].unique()
+        
+        selected_fruit = st.selectbox(
+            "🍓 과일 선택",
+            options=["전체"] + list(available_fruits),
+            index=0
+        )
+    
+    with col3:
+        # 정렬 옵션
+        sort_option = st.selectbox(
+            "📊 정렬 기준",
+            options=["최저가순", "최고가순", "이름순"],
+            index=0
+        )
+    
+    # 필터링된 데이터
+    filtered_df = df
+    if selected_category_search != "전체":
+        filtered_df = filtered_df[filtered_df['botanical_type'] == selected_category_search]
+    if selected_fruit != "전체":
+        filtered_df = filtered_df[filtered_df['Name'] == selected_fruit]
+    
+    # 정렬 적용
+    if sort_option == "최저가순":
+        filtered_df = filtered_df.sort_values('coupang_price', ascending=True)
+    elif sort_option == "최고가순":
+        filtered_df = filtered_df.sort_values('coupang_price', ascending=False)
+    elif sort_option == "이름순":
+        # Categorical 범주 순서가 아니라 문자열 기준으로 정렬
+        filtered_df = filtered_df.sort_values(['Name', 'Kind'], ascending=True, key=lambda values: values.astype(str))
+    
+    if len(filtered_df) > 0:
+        # 검색 결과 요약
+        st.markdown(f"""
+        <div class="toss-container">
+            <h4>📋 검색 결과: {len(filtered_df)}개 상품</h4>
+            <p>평균 가격: <strong>{filtered_df['coupang_price'].mean():.0f}원</strong> | 
+               최저가: <strong>{filtered_df['coupang_price'].min():.0f}원</strong> | 
+               최고가: <strong>{filtered_df['coupang_price'].max():.0f}원</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # 검색 결과 표시
+        for idx, (_, fruit) in enumerate(filtered_df.iterrows(), 1):
+            col1, col2, col3 = st.columns([2, 1, 1])
+            
+            with col1:
+                st.markdown(f"""
+                <div class="fruit-price-card">
+                    <h4>#{idx} {fruit['Name']} - {fruit['Kind']}</h4>
+                    <p><strong>식물학적 분류:</strong> {fruit['botanical_type']}</p>
+                    <p><strong>가격:</strong> {fruit['coupang_price']}원/100g</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                delta_value = fruit['coupang_price'] - avg_price
+                st.metric("전체 평균 대비", f"{delta_value:+.0f}원")
+            
+            with col3:
+                st.metric("전체 순위", f"{fruit['price_rank']}/{len(df)}위", f"하위 {fruit['price_percentile']:.0f}%", delta_color="off")
+    else:
+        st.info("검색 조건에 맞는 과일이 없습니다.")
+
+def show_comparison_tab(data_version):
+    """판매처 비교 탭"""
+    st.markdown('<div class="section-title">🛒 판매처별 가격 비교</div>', unsafe_allow_html=True)
+    
+    comparison, win_rates, win_fig = load_retailer_comparison(data_version)
+    comparable = comparison[comparison['retailer_count'] > 1]
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("비교 가능 품종", f"{len(comparable)}개")
+    with col2:
+        st.metric("평균 가격차", f"{comparable['spread_pct'].mean():.1f}%" if len(comparable) else "-")
+    for column, retailer in zip((col3, col4), RETAILERS):
+        with column:
+            wins = (comparable['best_retailer'] == retailer) & ~comparable['tied']
+            st.metric(f"{RETAILER_LABELS[retailer]} 최저가", f"{wins.sum()}개")
+    
+    if comparable.empty:
+        st.info("두 판매처 가격이 모두 있는 품종이 없습니다. 네이버 가격은 `python -m src.utils.ingest`로 적재할 수 있습니다.")
+        return
+    
+    st.plotly_chart(win_fig, use_container_width=True)
+    
+    # 가격 차이가 큰 품종
+    st.markdown('<div class="section-title">📋 가격 차이가 큰 품종</div>', unsafe_allow_html=True)
+    widest = comparable.nlargest(10, 'spread_pct')
+    for _, fruit in widest.iterrows():
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            prices = " | ".join(
+                f"{RETAILER_LABELS[retailer]} {fruit[f'{retailer}_price']:.0f}원" for retailer in RETAILERS if fruit[f'{retailer}_price'] > 0
+            )
+            st.markdown(f"""
+            <div class="fruit-price-card">
+                <h4>{fruit['Name']} - {fruit['Kind']}</h4>
+                <p><strong>식물학적 분류:</strong> {fruit['botanical_type']}</p>
+                <p>{prices}</p>
+            </div>
+            """, unsafe_allow_html=True)
+        with col2:
+            best = "동일가" if fruit['tied'] else f"{RETAILER_LABELS[fruit['best_retailer']]} 최저"
+            st.metric(best, f"{fruit['spread']:.0f}원", f"{fruit['spread_pct']:.1f}% 차이", delta_color="off")
+
+def show_recommendation_tab(data_version):
+    """추천 정보 탭 (판매처 중 최저가 기준)"""
+    st.markdown('<div class="section-title">💡 스마트 구매 추천</div>', unsafe_allow_html=True)
+    
+    cheapest_by_category, cheapest_overall = load_top_picks(data_version)
+    
+    # 식물학적 분류별 최저가 TOP 3
+    st.markdown("### 🏆 식물학적 분류별 최저가 TOP 3")
+    
+    categories = sorted(cheapest_by_category)
+    cols = st.columns(min(3, len(categories)))
+    
+    for i, category in enumerate(categories):
+        with cols[i % 3]:
+            cheapest = cheapest_by_category[category]
+            
+            st.markdown(f"**{category}**")
+            for idx, (_, fruit) in enumerate(cheapest.iterrows(), 1):
+                medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉"
+                st.markdown(f"""
+                <div class="fruit-price-card">
+                    {medal} <strong>{fruit['Name']} ({fruit['Kind']})</strong><br>
+                    <span class="price-badge">{fruit['best_price']:.0f}원/100g · {RETAILER_LABELS[fruit['best_retailer']]}</span>
+                </div>
+                """, unsafe_allow_html=True)
+    
+    # 전체 최저가 TOP 5
+    st.markdown("### 🌟 전체 최저가 TOP 5")
+    
+    for idx, (_, fruit) in enumerate(cheapest_overall.iterrows(), 1):
+        st.markdown(f"""
+        <div class="toss-card">
+            <div style="display: flex; justify-content: space-between; align-items: center;">
+                <div>
+                    <h4>#{idx} {fruit['Name']} ({fruit['Kind']})</h4>
+                    <p><strong>식물학적 분류:</strong> {fruit['botanical_type']}</p>
+                    <p><strong>분류 내 순위:</strong> {fruit['category_rank']}/{fruit['category_size']}위</p>
+                    <p>가성비 최고의 선택!</p>
+                </div>
+                <div class="price-badge">
+                    {fruit['best_price']:.0f}원/100g · {RETAILER_LABELS[fruit['best_retailer']]}
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
 def show_price_info():
     # 사이드바 숨기기 및 헤더 스타일 CSS
     st.markdown("""
@@ -662,22 +1011,17 @@ def show_price_info():
     st.markdown('<div class="title">가격 정보</div>', unsafe_allow_html=True)
     st.markdown('<div class="subtitle">과실을 식물학적 분류로 체계적으로 분석하고, 상세 정보를 확인해보세요.</div>', unsafe_allow_html=True)
 
-    # 데이터 로드
-    all_fruits = get_all_fruits_with_prices()
-    price_stats = get_price_statistics()
-    seasonal_trends = get_seasonal_price_trends()
+    # 데이터 로드 (탭별 데이터는 선택된 탭에서만 계산)
+    data_version = get_fruit_snapshot().version
+    df = get_all_fruits_with_prices()
     
-    if not all_fruits:
+    if df.empty:
         st.warning("💡 가격 정보가 있는 과일 데이터가 없습니다.")
         return
-
-    # 데이터프레임 변환
-    df = pd.DataFrame([dict(fruit) for fruit in all_fruits])
     
     # 과실별 기본 통계 계산
-    df['botanical_type'] = df['Name'].apply(get_fruit_category)
     total_fruits = len(df)
-    total_categories = len(df['botanical_type'].unique())
+    total_categories = df['botanical_type'].nunique()
     avg_price = df['coupang_price'].mean()
     price_range = df['coupang_price'].max() - df['coupang_price'].min()
 
@@ -716,241 +1060,19 @@ def show_price_info():
         </div>
         """, unsafe_allow_html=True)
 
-    # 탭 구성
-    tab1, tab2, tab3, tab4 = st.tabs(["🍎 식물학적 분류별 가격분석", "📈 식물학적 분류별 트렌드", "🔍 상세 검색", "💡 추천 정보"])
-    
-    with tab1:
-        st.markdown('<div class="section-title">🍎 식물학적 분류별 가격 개요</div>', unsafe_allow_html=True)
-        
-        # 식물학적 분류별 개요 차트 생성
-        fig1, fig2, category_stats, df_with_category = create_category_overview_chart(df)
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            st.plotly_chart(fig1, use_container_width=True)
-        with col2:
-            st.plotly_chart(fig2, use_container_width=True)
-        
-        # 식물학적 분류 선택
-        st.markdown('<div class="section-title">🔍 식물학적 분류별 상세 분석</div>', unsafe_allow_html=True)
-        
-        # 세션 상태 초기화
-        if 'selected_category' not in st.session_state:
-            st.session_state.selected_category = None
-        
-        # 식물학적 분류 버튼들
-        categories = sorted(df_with_category['botanical_type'].unique())
-        
-        # 버튼 레이아웃
-        cols = st.columns(len(categories))
-        for i, category in enumerate(categories):
-            with cols[i]:
-                if st.button(category, key=f"cat_btn_{category}"):
-                    st.session_state.selected_category = category
-        
-        # 선택된 식물학적 분류의 상세 분석
-        if st.session_state.selected_category:
-            selected_cat = st.session_state.selected_category
-            
-            st.markdown(f'<div class="section-title">📊 {selected_cat} 상세 분석</div>', unsafe_allow_html=True)
-            
-            # 상세 차트 생성
-            detail_fig1, detail_fig2, stats = create_category_detail_chart(df_with_category, selected_cat)
-            
-            if detail_fig1 is not None:
-                # 통계 요약
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("품종 수", f"{stats['count']}개")
-                with col2:
-                    st.metric("평균 가격", f"{stats['avg_price']:.0f}원")
-                with col3:
-                    st.metric("최저가", f"{stats['min_price']:.0f}원")
-                with col4:
-                    st.metric("최고가", f"{stats['max_price']:.0f}원")
-                
-                # 상세 차트
-                col1, col2 = st.columns([2, 1])
-                with col1:
-                    st.plotly_chart(detail_fig1, use_container_width=True)
-                with col2:
-                    st.plotly_chart(detail_fig2, use_container_width=True)
-                
-                # 개별 과일 정보
-                st.markdown(f'<div class="section-title">📋 {selected_cat} 개별 과일 정보</div>', unsafe_allow_html=True)
-                category_fruits = df_with_category[df_with_category['botanical_type'] == selected_cat].sort_values('coupang_price')
-                
-                for idx, (_, fruit) in enumerate(category_fruits.iterrows(), 1):
-                    col1, col2, col3 = st.columns([2, 1, 1])
-                    
-                    with col1:
-                        rank_in_category = idx
-                        total_in_category = len(category_fruits)
-                        st.markdown(f"""
-                        <div class="fruit-price-card">
-                            <h4>#{rank_in_category} {fruit['Name']} - {fruit['Kind']}</h4>
-                            <p><strong>가격:</strong> {fruit['coupang_price']}원/100g</p>
-                            <p><strong>{selected_cat} 내 순위:</strong> {rank_in_category}/{total_in_category}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    
-                    with col2:
-                        delta_from_cat_avg = fruit['coupang_price'] - stats['avg_price']
-                        st.metric("식물학적 분류 평균 대비", f"{delta_from_cat_avg:+.0f}원")
-                    
-                    with col3:
-                        delta_from_total_avg = fruit['coupang_price'] - avg_price
-                        st.metric("전체 평균 대비", f"{delta_from_total_avg:+.0f}원")
-    
-    with tab2:
-        st.markdown('<div class="section-title">📈 식물학적 분류별 계절 트렌드</div>', unsafe_allow_html=True)
-        
-        # 트렌드 차트 생성
-        trend_fig, category_seasonal = create_category_trend_chart(seasonal_trends)
-        st.plotly_chart(trend_fig, use_container_width=True)
-        
-        # 계절별 식물학적 분류 순위
-        st.markdown('<div class="section-title">🏆 계절별 식물학적 분류 순위</div>', unsafe_allow_html=True)
-        
-        seasons = ['봄', '여름', '가을', '겨울']
-        cols = st.columns(4)
-        
-        for i, season in enumerate(seasons):
-            with cols[i]:
-                season_data = category_seasonal[category_seasonal['Season'] == season].sort_values('Price', ascending=False)
-                
-                st.markdown(f"**{season} 🏆**")
-                for idx, (_, row) in enumerate(season_data.head(3).iterrows(), 1):
-                    medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉"
-                    st.markdown(f"{medal} {row['botanical_type']}: {row['Price']:.0f}원")
-    
-    with tab3:
-        st.markdown('<div class="section-title">🎯 상세 검색 및 정렬</div>', unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            # 식물학적 분류 선택
-            selected_category_search = st.selectbox(
-                "🍎 식물학적 분류 선택",
-                options=["전체"] + sorted(df['botanical_type'].unique()),
-                index=0
-            )
-        
-        with col2:
-            # 과일 선택
-            if selected_category_search != "전체":
-                available_fruits = df[df['botanical_type'] == selected_category_search]['Name'].unique()
-            else:
-                available_fruits = df['Name'].unique()
-            
-            selected_fruit = st.selectbox(
-                "🍓 과일 선택",
-                options=["전체"] + list(available_fruits),
-                index=0
-            )
-        
-        with col3:
-            # 정렬 옵션
-            sort_option = st.selectbox(
-                "📊 정렬 기준",
-                options=["최저가순", "최고가순", "이름순"],
-                index=0
-            )
-        
-        # 필터링된 데이터
-        filtered_df = df.copy()
-        if selected_category_search != "전체":
-            filtered_df = filtered_df[filtered_df['botanical_type'] == selected_category_search]
-        if selected_fruit != "전체":
-            filtered_df = filtered_df[filtered_df['Name'] == selected_fruit]
-        
-        # 정렬 적용
-        if sort_option == "최저가순":
-            filtered_df = filtered_df.sort_values('coupang_price', ascending=True)
-        elif sort_option == "최고가순":
-            filtered_df = filtered_df.sort_values('coupang_price', ascending=False)
-        elif sort_option == "이름순":
-            filtered_df = filtered_df.sort_values(['Name', 'Kind'], ascending=True)
-        
-        if len(filtered_df) > 0:
-            # 검색 결과 요약
-            st.markdown(f"""
-            <div class="toss-container">
-                <h4>📋 검색 결과: {len(filtered_df)}개 상품</h4>
-                <p>평균 가격: <strong>{filtered_df['coupang_price'].mean():.0f}원</strong> | 
-                   최저가: <strong>{filtered_df['coupang_price'].min():.0f}원</strong> | 
-                   최고가: <strong>{filtered_df['coupang_price'].max():.0f}원</strong></p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # 검색 결과 표시
-            for idx, (_, fruit) in enumerate(filtered_df.iterrows(), 1):
-                col1, col2, col3 = st.columns([2, 1, 1])
-                
-                with col1:
-                    st.markdown(f"""
-                    <div class="fruit-price-card">
-                        <h4>#{idx} {fruit['Name']} - {fruit['Kind']}</h4>
-                        <p><strong>식물학적 분류:</strong> {fruit['botanical_type']}</p>
-                        <p><strong>가격:</strong> {fruit['coupang_price']}원/100g</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with col2:
-                    delta_value = fruit['coupang_price'] - avg_price
-                    st.metric("전체 평균 대비", f"{delta_value:+.0f}원")
-                
-                with col3:
-                    rank = (df['coupang_price'] < fruit['coupang_price']).sum() + 1
-                    total = len(df)
-                    st.metric("전체 순위", f"{rank}/{total}위")
-        else:
-            st.info("검색 조건에 맞는 과일이 없습니다.")
-    
-    with tab4:
-        st.markdown('<div class="section-title">💡 스마트 구매 추천</div>', unsafe_allow_html=True)
-        
-        # 식물학적 분류별 최저가 TOP 3
-        st.markdown("### 🏆 식물학적 분류별 최저가 TOP 3")
-        
-        categories = sorted(df['botanical_type'].unique())
-        cols = st.columns(min(3, len(categories)))
-        
-        for i, category in enumerate(categories):
-            with cols[i % 3]:
-                category_df = df[df['botanical_type'] == category]
-                cheapest = category_df.nsmallest(3, 'coupang_price')
-                
-                st.markdown(f"**{category}**")
-                for idx, (_, fruit) in enumerate(cheapest.iterrows(), 1):
-                    medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉"
-                    st.markdown(f"""
-                    <div class="fruit-price-card">
-                        {medal} <strong>{fruit['Name']} ({fruit['Kind']})</strong><br>
-                        <span class="price-badge">{fruit['coupang_price']:.0f}원/100g</span>
-                    </div>
-                    """, unsafe_allow_html=True)
-        
-        # 전체 최저가 TOP 5
-        st.markdown("### 🌟 전체 최저가 TOP 5")
-        cheapest_overall = df.nsmallest(5, 'coupang_price')
-        
-        for idx, (_, fruit) in enumerate(cheapest_overall.iterrows(), 1):
-            st.markdown(f"""
-            <div class="toss-card">
-                <div style="display: flex; justify-content: space-between; align-items: center;">
-                    <div>
-                        <h4>#{idx} {fruit['Name']} ({fruit['Kind']})</h4>
-                        <p><strong>식물학적 분류:</strong> {fruit['botanical_type']}</p>
-                        <p>가성비 최고의 선택!</p>
-                    </div>
-                    <div class="price-badge">
-                        {fruit['coupang_price']:.0f}원/100g
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+    # 탭 구성 (st.tabs는 모든 탭을 매번 계산하므로 선택된 탭만 렌더링)
+    selected_tab = st.radio("가격 정보 탭", PRICE_TABS, horizontal=True, key="price_tab", label_visibility="collapsed")
+    
+    if selected_tab == PRICE_TABS[0]:
+        show_category_tab(data_version, avg_price)
+    elif selected_tab == PRICE_TABS[1]:
+        show_trend_tab(data_version)
+    elif selected_tab == PRICE_TABS[2]:
+        show_search_tab(df, avg_price)
+    elif selected_tab == PRICE_TABS[3]:
+        show_comparison_tab(data_version)
+    else:
+        show_recommendation_tab(data_version)
 
     # 하단 정보
     st.markdown("""
@@ -0,0 +1,192 @@
+import os
+import threading
+
+IMAGE_DIR = os.path.join('assets', 'images')
+# 같은 이름의 파일이 여러 확장자로 있으면 앞쪽 확장자 우선
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif')
+
+# 과일 이름을 이미지 파일명으로 매핑하는 딕셔너리 (모든 페이지 공용)
+KOREAN_IMAGE_NAMES = {
+    '사과': 'apple',
+    '살구': 'apricot',
+    '아보카도': 'avocado',
+    '바나나': 'banana',
+    '블루베리': 'blueberry',
+    '체리모야': 'cherimoya',
+    '체리': 'cherry',
+    '용과': 'dragonfruit',
+    '두리안': 'durian',
+    '무화과': 'fig',
+    '포도': 'grape',
+    '자몽': 'grapefruit',
+    '청포도': 'greengrape',
+    '구아바': 'guava',
+    '키위': 'kiwi',
+    '참외': 'koreamelon',
+    '자두': 'plum',
+    '한국 자두': 'koreanplum',
+    '레몬': 'lemon',
+    '리치': 'lychee',
+    '망고': 'mango',
+    '망고스틴': 'mangosteen',
+    '멜론': 'melon',
+    '오렌지': 'orange',
+    '파파야': 'papaya',
+    '복숭아': 'peach',
+    '배': 'pear',
+    '감': 'persimmon',
+    '파인애플': 'pineapple',
+    '석류': 'pomegranate',
+    '람부탄': 'rambutan',
+    '적포도': 'redgrape',
+    '스타프루트': 'starfruit',
+    '딸기': 'strawberry',
+    '귤': 'tangerine',
+    '감귤': 'tangerine',
+    '수박': 'watermelon',
+    '백포도': 'white',
+    '황금키위': 'yellow',
+    '유자': 'yuzu',
+    '매실': 'plum',
+    '크랜베리': 'cranberry',
+    '건포도': 'raisin',
+    '토마토': 'tomato',
+}
+
+# 영어 과일 이름 → 이미지 파일명
+ENGLISH_IMAGE_NAMES = {
+    'apple': 'apple',
+    'apricot': 'apricot',
+    'avocado': 'avocado',
+    'banana': 'banana',
+    'blueberry': 'blueberry',
+    'cherimoya': 'cherimoya',
+    'cherry': 'cherry',
+    'dragon': 'dragonfruit',
+    'dragonfruit': 'dragonfruit',
+    'dragon fruit': 'dragonfruit',
+    'durian': 'durian',
+    'fig': 'fig',
+    'grape': 'grape',
+    'grapefruit': 'grapefruit',
+    'green grape': 'greengrape',
+    'greenp': 'greengrape',
+    'guava': 'guava',
+    'kiwi': 'kiwi',
+    'korean melon': 'koreamelon',
+    'plum': 'plum',
+    'korean plum': 'koreanplum',
+    'lemon': 'lemon',
+    'lychee': 'lychee',
+    'mango': 'mango',
+    'mangosteen': 'mangosteen',
+    'melon': 'melon',
+    'orange': 'orange',
+    'papaya': 'papaya',
+    'peach': 'peach',
+    'pear': 'pear',
+    'persimmon': 'persimmon',
+    'pineapple': 'pineapple',
+    'pomegranate': 'pomegranate',
+    'rambutan': 'rambutan',
+    'red grape': 'redgrape',
+    'star fruit': 'starfruit',
+    'starfruit': 'starfruit',
+    'strawberry': 'strawberry',
+    'tangerine': 'tangerine',
+    'tangerines': 'tangerine',
+    'watermelon': 'watermelon',
+    'yuzu': 'yuzu',
+}
+
+
+class FruitAssetRegistry:
+    """과일 이미지 경로 레지스트리
+
+    시작 시 이미지 폴더를 한 번만 스캔하고, 이후 조회는 메모리 dict만 사용 (파일 시스템 호출 없음).
+    한글 이름, 영어 이름, Kind 코드(예: apple_fuji → apple)를 모두 같은 경로로 해석한다.
+    """
+
+    def __init__(self, image_dir=IMAGE_DIR):
+        self.image_dir = image_dir
+        self.files = {}
+        try:
+            entries = sorted(os.scandir(image_dir), key=lambda e: e.name)
+        except FileNotFoundError:
+            entries = []
+        for entry in entries:
+            stem, ext = os.path.splitext(entry.name)
+            ext = ext.lower()
+            if ext not in IMAGE_EXTENSIONS or not entry.is_file():
+                continue
+            stem = stem.lower()
+            current = self.files.get(stem)
+            if current is None or IMAGE_EXTENSIONS.index(ext) < IMAGE_EXTENSIONS.index(os.path.splitext(current)[1].lower()):
+                self.files[stem] = os.path.join(image_dir, entry.name)
+
+        self.paths = {}
+        for key, stem in list(KOREAN_IMAGE_NAMES.items()) + list(ENGLISH_IMAGE_NAMES.items()):
+            if stem in self.files:
+                self.paths[key] = self.files[stem]
+        for stem, path in self.files.items():
+            self.paths.setdefault(stem, path)
+        self._resolved = {}
+        self._lock = threading.Lock()
+
+    def _lookup(self, key):
+        if not key:
+            return None
+        key = key.strip()
+        return self.paths.get(key) or self.paths.get(key.lower())
+
+    def _resolve(self, name, kind):
+        # 1) 이름 그대로 (한글/영어)
+        path = self._lookup(name)
+        if path:
+            return path
+        # 2) Kind 코드: 전체 → 공백 치환 → 첫 단어 (apple_fuji → apple)
+        if kind:
+            kind = kind.lower()
+            for key in (kind, kind.replace('_', ' '), kind.split('_')[0]):
+                path = self._lookup(key)
+                if path:
+                    return path
+        # 3) 이름의 각 단어
+        lowered = (name or '').lower()
+        for part in lowered.split():
+            path = self._lookup(part)
+            if path:
+                return path
+        # 4) 파일명 부분 일치
+        if lowered:
+            for stem, path in self.files.items():
+                if lowered in stem or stem in lowered:
+                    return path
+        return None
+
+    def resolve(self, name, kind=None):
+        """과일 이미지 경로 (없으면 None), 결과는 메모이즈"""
+        key = (name, kind)
+        if key not in self._resolved:
+            path = self._resolve(name, kind)
+            with self._lock:
+                self._resolved[key] = path
+        return self._resolved[key]
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_asset_registry():
+    """프로세스 전역 이미지 레지스트리 (최초 호출 시 한 번 스캔)"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = FruitAssetRegistry()
+    return _registry
+
+
+def resolve_fruit_image(name, kind=None):
+    return get_asset_registry().resolve(name, kind)
@@ -0,0 +1,173 @@
+import heapq
+import threading
+
+import numpy as np
+import pandas as pd
+
+from src.utils.hangul import search_key, to_choseong
+from src.utils.retailers import PRICE_COLUMNS
+from src.utils.snapshot import get_fruit_snapshot
+
+# 노드마다 미리 계산해 두는 자동완성 후보 수 (suggest limit 상한)
+MAX_SUGGESTIONS = 10
+
+# 키 종류 (작을수록 우선): 과일명 접두, 초성, 품종 코드 전체 접두, 품종 코드 중간 단어 (예: 'fuji' → apple fuji),
+# 과일명 중간 (예: '포도' → 청포도)
+NAME, CHOSEONG, KIND, KIND_TOKEN, INNER = range(5)
+
+
+class _Node:
+    __slots__ = ('edges', 'values', 'top')
+
+    def __init__(self):
+        self.edges = {}   # 첫 글자 → (간선 문자열, 자식 노드)
+        self.values = {}  # 이 노드에서 끝나는 키의 과일명 → 순위
+        self.top = ()
+
+
+def _build(entries):
+    """키 → {과일명: 순위} 사전으로 압축 트라이 구성
+
+    키를 정렬해 한 번 훑으며 직전 키와의 공통 접두 길이만큼 경로를 되돌아가 분기한다 (키마다 루트부터 내려가지 않음).
+    """
+    root = _Node()
+    path = [(0, root)]  # 직전 키의 경로: (노드까지의 깊이, 노드)
+    previous = ''
+    for key in sorted(entries):
+        common, end = 0, min(len(previous), len(key))
+        while common < end and previous[common] == key[common]:
+            common += 1
+        popped = None
+        while path[-1][0] > common:
+            popped = path.pop()
+        depth, node = path[-1]
+        if depth < common:
+            # 간선 분할: previous[depth:common] → 중간 노드 → previous[common:popped 깊이]
+            child_depth, child = popped
+            middle = _Node()
+            middle.edges[previous[common]] = (previous[common:child_depth], child)
+            node.edges[previous[depth]] = (previous[depth:common], middle)
+            path.append((common, middle))
+            depth, node = common, middle
+        if len(key) > depth:
+            leaf = _Node()
+            node.edges[key[depth]] = (key[depth:], leaf)
+            path.append((len(key), leaf))
+            node = leaf
+        node.values = entries[key]
+        previous = key
+    return root
+
+
+def _finalize(node, limit):
+    """하위 트리의 과일명별 최고 순위 중 상위 limit개를 노드에 저장 (후위 순회)"""
+    if not node.edges:
+        node.top = tuple(sorted(node.values.values())[:limit])
+        return
+    best = dict(node.values)
+    for _, child in node.edges.values():
+        _finalize(child, limit)
+        for rank in child.top:
+            name = rank[-1]
+            if name not in best or rank < best[name]:
+                best[name] = rank
+    node.top = tuple(heapq.nsmallest(limit, best.values()))
+
+
+def name_popularity(frame):
+    """과일명별 (가격 있는 품종 수, 전체 품종 수) — 자동완성 동순위 정렬용"""
+    priced = (frame[list(PRICE_COLUMNS)].to_numpy(dtype=np.float64) > 0).any(axis=1)
+    grouped = pd.DataFrame({'Name': frame['Name'].to_numpy(), 'priced': priced}).groupby('Name', sort=False)['priced']
+    return pd.DataFrame({'priced': grouped.sum(), 'varieties': grouped.size()})
+
+
+class AutocompleteIndex:
+    """과일명(완성형/자모/초성)과 영어 품종 코드에 대한 압축 트라이 자동완성 색인
+
+    - 키는 자모 단위로 저장하므로 입력 중인 음절('삭')도 '사과'의 접두로 찾는다.
+    - 노드마다 하위 후보 상위 MAX_SUGGESTIONS개를 미리 계산해 두어 질의는 검색어 길이만큼만 내려간다.
+    - 순위: 키 종류(품종 코드 전체 접두가 다른 품종 코드의 중간 단어보다 우선) → 가격 있는 품종 수 → 품종 수 → 이름
+    """
+
+    def __init__(self, snapshot, limit=MAX_SUGGESTIONS):
+        self.version = snapshot.version
+        frame = snapshot.frame
+        popularity = name_popularity(frame)
+        ranks = {
+            name: (-int(priced), -int(varieties), name)
+            for name, priced, varieties in zip(popularity.index, popularity['priced'], popularity['varieties'])
+        }
+
+        entries = {}
+
+        def add(key, name, rank):
+            names = entries.setdefault(key, {})
+            if name not in names or rank < names[name]:
+                names[name] = rank
+
+        for name, rank in ranks.items():
+            add(search_key(name), name, (NAME, *rank))
+            choseong = to_choseong(name)
+            if choseong != name:
+                add(choseong, name, (CHOSEONG, *rank))
+            for start in range(1, len(name)):
+                add(search_key(name[start:]), name, (INNER, *rank))
+        for name, kind in set(zip(frame['Name'].tolist(), frame['Kind'].tolist())):
+            key = search_key(kind)
+            if not key or name not in ranks:
+                continue
+            # 'apple fuji' → 'apple fuji'(KIND), 'fuji'(KIND_TOKEN) (숫자로 시작하는 토큰은 제외)
+            add(key, name, (KIND, *ranks[name]))
+            for position in range(1, len(key)):
+                if key[position - 1] == ' ' and key[position] != ' ' and not key[position].isdigit():
+                    add(key[position:], name, (KIND_TOKEN, *ranks[name]))
+        entries.pop('', None)
+        self._root = _build(entries)
+        _finalize(self._root, limit)
+
+    def _find(self, query):
+        node, i = self._root, 0
+        while i < len(query):
+            edge = node.edges.get(query[i])
+            if edge is None:
+                return None
+            label, child = edge
+            if query.startswith(label, i):
+                node, i = child, i + len(label)
+            elif label.startswith(query[i:]):
+                return child
+            else:
+                return None
+        return node
+
+    def suggest(self, query, limit=5):
+        """검색어로 시작하는 과일명 자동완성 후보 (최대 limit개, 순위 순)"""
+        query = search_key(query)
+        if not query:
+            return []
+        node = self._find(query)
+        if node is None:
+            return []
+        return [rank[-1] for rank in node.top[:limit]]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_autocomplete_index(snapshot=None):
+    """현재 스냅샷 버전의 자동완성 색인 (버전이 바뀔 때만 재구축)"""
+    global _index
+    if snapshot is None:
+        snapshot = get_fruit_snapshot()
+    index = _index
+    if index is not None and index.version == snapshot.version:
+        return index
+    with _index_lock:
+        if _index is None or _index.version != snapshot.version:
+            _index = AutocompleteIndex(snapshot)
+        return _index
+
+
+def suggest_fruit_names(query, limit=5):
+    return get_autocomplete_index().suggest(query, limit)
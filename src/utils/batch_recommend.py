@@ -0,0 +1,169 @@
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.utils.ingest import read_batches
+from src.utils.recommendations import CATALOG, DIMENSIONS
+
+BATCH_SIZE = 50_000
+TOP_K = 6
+PROFILE_COLUMNS = tuple(key for key, _, _ in DIMENSIONS)
+
+# 프로필 파일 컬럼명 → 추천 기준 키 (대소문자 무시)
+COLUMN_ALIASES = {
+    'health_goal': 'health_goal',
+    'goal': 'health_goal',
+    '건강 목표': 'health_goal',
+    'age_group': 'age_group',
+    'age': 'age_group',
+    '연령대': 'age_group',
+    'gender_special': 'gender_special',
+    'gender': 'gender_special',
+    '성별/특수상황': 'gender_special',
+}
+
+
+def recommend_frame(frame, k=TOP_K):
+    """프로필 DataFrame에 recommendations / scores / error 컬럼 추가
+
+    같은 (목표, 연령대, 성별) 조합은 factorize로 묶어 고유 조합만 점수 엔진에 한 번에 넘긴다.
+    파일에 없는 컬럼은 추천 폼과 같은 기본값으로 채우고, 있는 컬럼의 빈 값/기준표에 없는 값은
+    기본값으로 바꾸지 않고 입력값 그대로 error를 남긴다 (추천 없음).
+    (결과 DataFrame, 고유 프로필 수, 오류 행 수) 반환
+    """
+    frame = frame.rename(columns=lambda c: COLUMN_ALIASES.get(str(c).strip().lower(), c))
+    if not set(PROFILE_COLUMNS) & set(frame.columns):
+        raise ValueError(f"프로필 컬럼 없음: {', '.join(PROFILE_COLUMNS)} 중 하나 이상 필요")
+    values = [
+        frame[column].fillna('').astype(str).str.strip() if column in frame else pd.Series('', index=frame.index)
+        for column in PROFILE_COLUMNS
+    ]
+    codes, uniques = pd.factorize(pd.MultiIndex.from_arrays(values))
+
+    profiles, errors, valid = [], np.empty(len(uniques), dtype=object), []
+    for i, profile in enumerate(uniques):
+        invalid = [
+            column for column, value, (_, table, _) in zip(PROFILE_COLUMNS, profile, DIMENSIONS)
+            if column in frame and value not in table
+        ]
+        errors[i] = f"알 수 없는 값: {', '.join(invalid)}" if invalid else ''
+        if invalid:
+            profiles.append(tuple(profile))
+        else:
+            profiles.append(CATALOG.profile(*profile))
+            valid.append(i)
+    ranked = CATALOG.scorer.rank([profiles[i] for i in valid], k)
+
+    fruits = np.empty(len(profiles), dtype=object)
+    fruits[:] = [[] for _ in profiles]
+    rounded = np.empty(len(profiles), dtype=object)
+    rounded[:] = [[] for _ in profiles]
+    for i, (order, scores) in zip(valid, ranked):
+        fruits[i] = [CATALOG.fruits[fruit_id] for fruit_id in order.tolist()]
+        rounded[i] = [round(score, 3) for score in scores.tolist()]
+    frame = frame.copy()
+    for column, profile_values in zip(PROFILE_COLUMNS, zip(*profiles)):
+        frame[column] = np.asarray(profile_values, dtype=object)[codes]
+    frame['recommendations'] = fruits[codes]
+    frame['scores'] = rounded[codes]
+    frame['error'] = errors[codes]
+    return frame, len(profiles), int((frame['error'] != '').sum())
+
+
+def format_frame(frame, fmt):
+    """추천 결과 배치를 출력 문자열로 (jsonl: 목록 그대로, csv: '|'로 연결)"""
+    if fmt == 'jsonl':
+        text = frame.to_json(orient='records', lines=True, force_ascii=False)
+        return text if text.endswith('\n') else text + '\n'
+    frame = frame.assign(
+        recommendations=frame['recommendations'].str.join('|'),
+        scores=frame['scores'].map(lambda row: '|'.join(map(str, row))),
+    )
+    return frame.to_csv(index=False, header=False, lineterminator='\n')
+
+
+def _process_batch(frame, k, fmt):
+    frame, distinct, rejected = recommend_frame(frame, k)
+    header = ','.join(frame.columns) + '\n' if fmt == 'csv' else ''
+    return format_frame(frame, fmt), header, len(frame), distinct, rejected
+
+
+def recommend_file(path, out, k=TOP_K, batch_size=BATCH_SIZE, fmt=None, out_format='jsonl', workers=None):
+    """프로필 파일을 배치 단위로 읽어 추천 결과를 입력 순서대로 out에 스트리밍
+
+    workers > 1이면 배치별 추천/직렬화를 프로세스 풀에서 병렬 처리한다 (진행 중인 배치는 workers × 2개까지).
+    """
+    workers = workers or os.cpu_count() or 1
+    stats = {'rows': 0, 'distinct': 0, 'rejected': 0}
+    wrote_header = False
+
+    def emit(result):
+        nonlocal wrote_header
+        text, header, rows, distinct, rejected = result
+        if header and not wrote_header:
+            out.write(header)
+            wrote_header = True
+        out.write(text)
+        stats['rows'] += rows
+        stats['distinct'] = max(stats['distinct'], distinct)
+        stats['rejected'] += rejected
+
+    start = time.perf_counter()
+    batches = read_batches(path, batch_size, fmt)
+    if workers <= 1:
+        for batch in batches:
+            emit(_process_batch(batch, k, out_format))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for batch in batches:
+                pending.append(pool.submit(_process_batch, batch, k, out_format))
+                if len(pending) >= workers * 2:
+                    emit(pending.popleft().result())
+            while pending:
+                emit(pending.popleft().result())
+    stats['seconds'] = time.perf_counter() - start
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m src.utils.batch_recommend', description='대량 사용자 프로필 과일 추천')
+    parser.add_argument('path', help='프로필 CSV 또는 JSON Lines 파일 (health_goal, age_group, gender_special)')
+    parser.add_argument('-o', '--output', help='결과 파일 (기본: 표준 출력)')
+    parser.add_argument('--format', choices=('csv', 'jsonl'), help='입력 형식 (기본: 확장자로 판단)')
+    parser.add_argument('--output-format', choices=('csv', 'jsonl'), help='출력 형식 (기본: -o 파일 확장자가 .csv면 csv, 그 외 jsonl)')
+    parser.add_argument('-k', '--top', type=int, default=TOP_K, help=f'프로필당 추천 과일 수 (기본 {TOP_K})')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help=f'배치당 행 수 (기본 {BATCH_SIZE})')
+    parser.add_argument('--workers', type=int, help='프로세스 수 (기본: CPU 수, 1이면 단일 프로세스)')
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.path):
+        print(f"파일 없음: {args.path}", file=sys.stderr)
+        return 1
+    out_format = args.output_format or ('csv' if args.output and args.output.lower().endswith('.csv') else 'jsonl')
+    out = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    try:
+        stats = recommend_file(args.path, out, args.top, args.batch_size, args.format, out_format, args.workers)
+    finally:
+        if args.output:
+            out.close()
+    rate = stats['rows'] / stats['seconds'] if stats['seconds'] else 0
+    print(
+        f"{args.path}: {stats['rows']:,}명 추천 완료, 배치당 최대 고유 프로필 {stats['distinct']}개 "
+        f"({stats['seconds']:.2f}s, {rate:,.0f} rows/s)",
+        file=sys.stderr,
+    )
+    if stats['rejected']:
+        print(f"알 수 없는 프로필 값 {stats['rejected']:,}명: 추천 없이 error 컬럼에 기록", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+import json
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+
+# 컬럼별 .npy 파일 + manifest.json (python -m src.utils.snapshot 또는 ingest 후 생성)
+SNAPSHOT_DIR = os.path.join('.cache', 'snapshot')
+MANIFEST = 'manifest.json'
+FORMAT_VERSION = 1
+
+
+def db_fingerprint(db_path):
+    """DB 파일 상태 (inode, 크기, mtime + 비어 있지 않은 WAL의 크기, mtime)
+
+    PRAGMA data_version과 달리 프로세스가 바뀌어도 같은 값이라 내보낸 스냅샷의 최신 여부 판단에 쓴다.
+    체크포인트 후 비었거나 삭제된 WAL은 무시한다.
+    """
+    stat = os.stat(db_path)
+    fingerprint = [stat.st_ino, stat.st_size, stat.st_mtime_ns]
+    try:
+        wal = os.stat(db_path + '-wal')
+    except FileNotFoundError:
+        wal = None
+    if wal is not None and wal.st_size > 0:
+        fingerprint += [wal.st_size, wal.st_mtime_ns]
+    return fingerprint
+
+
+def write_columns(columns, fingerprint, directory=SNAPSHOT_DIR):
+    """컬럼 dict를 컬럼별 .npy(Categorical은 코드 배열 + manifest의 범주 목록)로 저장
+
+    새 파일을 모두 쓴 뒤 manifest를 원자적으로 교체하고, 이전 내보내기 파일을 지운다.
+    """
+    os.makedirs(directory, exist_ok=True)
+    tag = uuid.uuid4().hex[:12]
+    entries = {}
+    for i, (name, values) in enumerate(columns.items()):
+        kind = 'array'
+        categories = None
+        if isinstance(values, pd.Categorical) or values.dtype == object:
+            kind = 'category' if isinstance(values, pd.Categorical) else 'object'
+            values = pd.Categorical(values)
+            categories = values.categories.tolist()
+            values = values.codes
+        filename = f"{i:02d}.{tag}.npy"
+        np.save(os.path.join(directory, filename), np.ascontiguousarray(values), allow_pickle=False)
+        entries[name] = {'file': filename, 'kind': kind, 'categories': categories}
+
+    manifest = {'format': FORMAT_VERSION, 'fingerprint': list(fingerprint), 'columns': entries}
+    temp_path = os.path.join(directory, f"{MANIFEST}.{tag}.tmp")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(temp_path, os.path.join(directory, MANIFEST))
+
+    current = {entry['file'] for entry in entries.values()}
+    for filename in os.listdir(directory):
+        if filename.endswith('.npy') and filename not in current:
+            try:
+                os.remove(os.path.join(directory, filename))
+            except OSError:
+                pass
+
+
+def read_columns(fingerprint, directory=SNAPSHOT_DIR):
+    """fingerprint가 같은 내보내기의 컬럼 dict (숫자/코드 배열은 읽기 전용 mmap), 없거나 오래됐으면 None"""
+    try:
+        with open(os.path.join(directory, MANIFEST), encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('format') != FORMAT_VERSION or manifest.get('fingerprint') != list(fingerprint):
+        return None
+    columns = {}
+    try:
+        for name, entry in manifest['columns'].items():
+            values = np.load(os.path.join(directory, entry['file']), mmap_mode='r', allow_pickle=False)
+            if entry['kind'] == 'category':
+                values = pd.Categorical.from_codes(values, categories=entry['categories'])
+            elif entry['kind'] == 'object':
+                values = np.asarray(pd.Categorical.from_codes(values, categories=entry['categories']), dtype=object)
+            columns[name] = values
+    except (OSError, ValueError, KeyError):
+        return None
+    return columns
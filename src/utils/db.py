@@ -0,0 +1,171 @@
+import os
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+
+DB_PATH = os.path.join('database', 'a.sqlite3')
+
+# 읽기 전용 연결에 적용할 PRAGMA (mmap 256MB, 페이지 캐시 약 64MB)
+READER_PRAGMAS = (
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA query_only = ON",
+)
+
+# journal_mode는 파일에 영구 저장되므로 writer를 여는 적재/설치 단계(CLI)에서만 WAL로 전환된다
+WRITER_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA busy_timeout = 5000",
+)
+
+
+class _Lease:
+    """스레드가 빌려 쓰는 읽기 연결 (스레드 종료 시 풀로 반환)"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+
+class ConnectionManager:
+    """프로세스 전역 SQLite 연결 관리자
+
+    - 읽기: 스레드별 read-only 연결 (URI mode=ro), 스레드가 끝나면 풀에 반환되어 재사용
+    - 쓰기: 단일 writer 연결을 락으로 직렬화
+    - 읽기 경로는 writer를 열지 않으므로 DB 파일(저널 모드 포함)을 바꾸지 않는다
+    """
+
+    def __init__(self, db_path=DB_PATH, max_idle=8):
+        self.db_path = db_path
+        self.max_idle = max_idle
+        self._local = threading.local()
+        self._idle = []
+        self._pool_lock = threading.Lock()
+        self._writer = None
+        self._writer_lock = threading.RLock()
+        self._generation = 0
+        self._watcher = None
+        self._watch_lock = threading.RLock()
+        self._watch_inode = None
+
+    def _uri(self, mode):
+        path = os.path.abspath(self.db_path).replace('?', '%3f').replace('#', '%23')
+        return f"file:{path}?mode={mode}"
+
+    def _open_reader(self):
+        conn = sqlite3.connect(self._uri('ro'), uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in READER_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _checkout(self):
+        with self._pool_lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._open_reader()
+
+    def _checkin(self, conn, generation):
+        with self._pool_lock:
+            if generation == self._generation and len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def reader(self):
+        """현재 스레드의 읽기 전용 연결 반환 (close 하지 않고 재사용)"""
+        lease = getattr(self._local, 'lease', None)
+        if lease is None:
+            conn = self._checkout()
+            lease = _Lease(conn)
+            weakref.finalize(lease, self._checkin, conn, self._generation)
+            self._local.lease = lease
+        return lease.conn
+
+    def _get_writer(self):
+        if self._writer is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            for pragma in WRITER_PRAGMAS:
+                conn.execute(pragma)
+            self._writer = conn
+        return self._writer
+
+    @contextmanager
+    def writer(self):
+        """직렬화된 쓰기 트랜잭션
+
+        with manager.writer() as conn:
+            conn.execute(...)
+        """
+        with self._writer_lock:
+            conn = self._get_writer()
+            if conn.in_transaction:
+                # 중첩 호출은 바깥 트랜잭션에 합류
+                yield conn
+                return
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            else:
+                conn.execute("COMMIT")
+
+    def checkpoint(self):
+        """WAL 내용을 DB 파일로 옮기고 WAL을 비움 (다른 연결이 읽는 중이면 가능한 만큼만)"""
+        with self._writer_lock:
+            return tuple(self._get_writer().execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone())
+
+    def data_version(self):
+        """DB 변경 감지용 버전 (파일 stat + PRAGMA data_version)
+
+        data_version은 다른 연결이 커밋할 때마다 바뀌므로 전용 감시 연결 하나로만 읽는다.
+        파일 자체가 교체된 경우(inode 변경)에는 기존 연결을 모두 닫고 다시 연다.
+        """
+        stat = os.stat(self.db_path)
+        with self._watch_lock:
+            if self._watch_inode is not None and stat.st_ino != self._watch_inode:
+                self.close_all()
+            if self._watcher is None:
+                self._watcher = self._open_reader()
+            self._watch_inode = stat.st_ino
+            version = self._watcher.execute("PRAGMA data_version").fetchone()[0]
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size, version)
+
+    def close_all(self):
+        """풀과 writer의 모든 연결 닫기"""
+        with self._pool_lock:
+            idle, self._idle = self._idle, []
+            self._generation += 1
+        for conn in idle:
+            conn.close()
+        self._local = threading.local()
+        with self._watch_lock:
+            if self._watcher is not None:
+                self._watcher.close()
+                self._watcher = None
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_connection_manager():
+    """프로세스 전역 연결 관리자 반환"""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = ConnectionManager()
+    return _manager
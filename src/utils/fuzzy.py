@@ -0,0 +1,99 @@
+def edit_distance(a, b, limit=None):
+    """Levenshtein 거리 (limit를 넘으면 limit + 1 반환)
+
+    Myers/Hyyrö 비트 병렬 알고리즘: 짧은 문자열의 각 위치를 정수의 비트로 두고 긴 문자열의 글자마다
+    DP 한 열을 비트 연산 몇 번으로 갱신한다 (글자 쌍마다 칸을 채우는 DP보다 훨씬 빠름).
+    """
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is None:
+        limit = len(a)
+    if len(a) - len(b) > limit:
+        return limit + 1
+    if not b:
+        return min(len(a), limit + 1)
+    peq = {}
+    for i, ch in enumerate(b):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+    mask = (1 << len(b)) - 1
+    last = 1 << (len(b) - 1)
+    pv, mv, score = mask, 0, len(b)
+    for ch in a:
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+    return min(score, limit + 1)
+
+
+def max_edit_distance(key):
+    """정규화된 검색어 길이별 허용 오타 수 (짧은 검색어는 오타 검색 안 함)"""
+    if len(key) < 3:
+        return 0
+    if len(key) < 6:
+        return 1
+    if len(key) < 12:
+        return 2
+    return 3
+
+
+class BKTree:
+    """편집 거리 BK-tree: 노드 = [키, 값 집합, {거리: 자식 노드}]
+
+    삼각 부등식으로 |d(q, 노드) - d(노드, 자식)| ≤ 허용 거리인 자식만 내려가므로
+    전체 키와 거리를 계산하지 않는다.
+    """
+
+    def __init__(self, items=()):
+        self._root = None
+        self.size = 0
+        for key, value in items:
+            self.add(key, value)
+
+    def add(self, key, value):
+        if self._root is None:
+            self._root = [key, {value}, {}]
+            self.size = 1
+            return
+        node = self._root
+        while True:
+            distance = edit_distance(key, node[0])
+            if distance == 0:
+                node[1].add(value)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [key, {value}, {}]
+                self.size += 1
+                return
+            node = child
+
+    def search(self, key, max_distance):
+        """key와 거리 max_distance 이하인 (거리, 키, 값 집합) 목록 (가까운 순)"""
+        if self._root is None:
+            return []
+        found = []
+        stack = [self._root]
+        while stack:
+            node_key, values, children = stack.pop()
+            # 자식으로 내려갈 수 있는 최대 거리까지만 정확히 계산
+            limit = max_distance + max(children, default=0)
+            distance = edit_distance(key, node_key, limit)
+            if distance <= max_distance:
+                found.append((distance, node_key, values))
+            for child_distance, child in children.items():
+                if abs(child_distance - distance) <= max_distance:
+                    stack.append(child)
+        found.sort(key=lambda item: (item[0], item[1]))
+        return found
@@ -0,0 +1,53 @@
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+# 호환용 자모 초성 19자 (유니코드 음절 순서)
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_CHOSEONG_SET = frozenset(CHOSEONG)
+
+
+def is_hangul_syllable(ch):
+    return HANGUL_BASE <= ord(ch) <= HANGUL_LAST
+
+
+def to_choseong(text):
+    """완성형 한글 음절을 초성으로 변환 (그 외 문자는 그대로)  예: '사과' → 'ㅅㄱ'"""
+    return ''.join(
+        CHOSEONG[(ord(ch) - HANGUL_BASE) // 588] if is_hangul_syllable(ch) else ch
+        for ch in text
+    )
+
+
+def is_choseong_query(text):
+    """초성만으로 이루어진 검색어인지 확인  예: 'ㅅㄱ'"""
+    return bool(text) and all(ch in _CHOSEONG_SET for ch in text)
+
+# 호환용 자모 중성 21자 / 종성 27자 (+ 받침 없음)
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ('', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ',
+             'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ')
+
+# 겹모음/겹받침은 입력 순서대로 풀어 씀 (입력 중인 '삭'이 '사과'의 접두가 되도록)
+_COMPOUND_JAMO = str.maketrans({
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+})
+
+
+def decompose(text):
+    """완성형 한글을 자모 입력 순서로 분해 (그 외 문자는 그대로)  예: '사과' → 'ㅅㅏㄱㅗㅏ'"""
+    jamo = []
+    for ch in text:
+        if is_hangul_syllable(ch):
+            code = ord(ch) - HANGUL_BASE
+            jamo.append(CHOSEONG[code // 588] + JUNGSEONG[code % 588 // 28] + JONGSEONG[code % 28])
+        else:
+            jamo.append(ch)
+    return ''.join(jamo).translate(_COMPOUND_JAMO)
+
+
+def search_key(text):
+    """검색 키 정규화: 소문자, '_' → 공백, 한글은 자모 분해 (자동완성/오타 검색 공용)"""
+    text = (text or '').strip().lower().replace('_', ' ')
+    return text if text.isascii() else decompose(text)
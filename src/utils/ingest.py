@@ -0,0 +1,303 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.utils.db import get_connection_manager
+from src.utils.price_history import RETAILERS, commit_staged_observations, ensure_history_schema, refresh_rollups, stage_observations
+from src.utils.retailers import PRICE_COLUMNS
+from src.utils.schema import ensure_column
+from src.utils.seasons import get_fruit_season_masks, has_season_columns, season_months
+from src.utils.snapshot import export_snapshot
+from src.utils.taxonomy import sync_taxonomy
+
+BATCH_SIZE = 100_000
+
+# 크롤링 파일 컬럼명 → fruit 테이블 컬럼명 (대소문자 무시)
+COLUMN_ALIASES = {
+    'name': 'Name',
+    '과일명': 'Name',
+    'kind': 'Kind',
+    '품종': 'Kind',
+    'coupang': 'coupang_price',
+    'coupang_price': 'coupang_price',
+    'naver': 'naver_price',
+    'naver_price': 'naver_price',
+    'observed_at': 'observed_at',
+    'date': 'observed_at',
+}
+
+UNIQUE_INDEX_DDL = "CREATE UNIQUE INDEX IF NOT EXISTS idx_fruit_name_kind ON fruit(Name, Kind)"
+
+INGEST_STAGE_DDL = """CREATE TEMP TABLE IF NOT EXISTS ingest_stage (
+    Name TEXT, Kind TEXT, observed_at INTEGER, coupang_price REAL, naver_price REAL
+)"""
+
+# 숫자 관측 시각이 이 값 이상이면 밀리초 단위로 본다 (초 단위로는 서기 5138년)
+EPOCH_MILLIS_THRESHOLD = 1e11
+
+
+# 판매처별 마지막으로 반영한 관측 시각 (이력 없이 적재해도 백필이 현재가를 덮어쓰지 않도록 fruit에 저장)
+OBSERVED_COLUMNS = tuple(f'{retailer}_observed_at' for retailer in RETAILERS)
+
+
+def _upsert_sql():
+    """파일에 없거나 잘못된 가격(NULL)은 기존 값을 유지, 새 품종이면 0(가격 없음)
+
+    기존 품종의 판매처별 가격은 관측 시각(?5)이 fruit에 기록된 그 판매처의 관측 시각보다
+    늦거나 같을 때만 바꾼다 (과거 데이터 백필이 현재가를 덮어쓰지 않도록).
+    SET의 오른쪽 식은 모두 갱신 전 값을 보므로 가격과 관측 시각을 같은 조건으로 바꿀 수 있다.
+    """
+    newer = [
+        f"?{i} IS NOT NULL AND ?5 >= IFNULL({observed}, ?5)"
+        for i, observed in enumerate(OBSERVED_COLUMNS, start=3)
+    ]
+    updates = ',\n        '.join(
+        f"{column} = CASE WHEN {condition} THEN ?{i} ELSE {column} END,\n"
+        f"        {observed} = CASE WHEN {condition} THEN ?5 ELSE {observed} END"
+        for i, (column, observed, condition) in enumerate(zip(PRICE_COLUMNS, OBSERVED_COLUMNS, newer), start=3)
+    )
+    observed_values = ', '.join(f"CASE WHEN ?{i} IS NOT NULL THEN ?5 END" for i in range(3, 3 + len(RETAILERS)))
+    return f"""INSERT INTO fruit(Name, Kind, {', '.join(PRICE_COLUMNS)}, {', '.join(OBSERVED_COLUMNS)})
+    VALUES (?1, ?2, IFNULL(?3, 0), IFNULL(?4, 0), {observed_values})
+    ON CONFLICT(Name, Kind) DO UPDATE SET
+        {updates}"""
+
+
+def ensure_observed_columns(conn):
+    """fruit에 판매처별 관측 시각 컬럼 추가, 새로 만든 컬럼은 price_history의 최신 관측으로 채움"""
+    ensure_history_schema(conn)
+    for retailer, observed in zip(RETAILERS, OBSERVED_COLUMNS):
+        if ensure_column(conn, 'fruit', observed, 'INTEGER'):
+            conn.execute(
+                f"""UPDATE fruit SET {observed} = (
+                    SELECT MAX(observed_at) FROM price_history WHERE variety_id = fruit.id AND retailer = ?
+                )""",
+                (retailer,),
+            )
+
+
+UPSERT_SQL = _upsert_sql()
+
+# 재배 시기 컬럼이 있는 DB에서 새로 들어온 품종(마스크 0)에 과일 단위 마스크 채우기
+NEW_SEASON_SQL = "UPDATE fruit SET season_mask = ?, season_months = ? WHERE Name = ? AND season_mask = 0"
+
+
+def read_batches(path, batch_size=BATCH_SIZE, fmt=None):
+    """CSV / JSON Lines 파일을 batch_size 행씩 DataFrame으로 읽기 (전체를 메모리에 올리지 않음)"""
+    fmt = fmt or ('jsonl' if path.endswith(('.jsonl', '.ndjson', '.json')) else 'csv')
+    if fmt == 'jsonl':
+        reader = pd.read_json(path, lines=True, chunksize=batch_size, dtype=False)
+    elif fmt == 'csv':
+        reader = pd.read_csv(path, chunksize=batch_size, dtype=str, keep_default_na=False)
+    else:
+        raise ValueError(f"지원하지 않는 형식: {fmt}")
+    with reader:
+        yield from reader
+
+
+def _clean_strings(values):
+    """문자열 trim (고유값만 처리 후 코드로 펼침, 결측은 '')"""
+    codes, uniques = pd.factorize(values.fillna(''))
+    cleaned = pd.Index(uniques).astype(str).str.strip()
+    return pd.Series(cleaned.take(codes), index=values.index)
+
+
+def _parse_prices(values):
+    """'12,900원' 같은 문자열 포함 가격 → float (해석 불가/0 이하는 NaN)
+
+    숫자로 바로 바뀌지 않는 값만 정규식으로 숫자 외 문자를 제거한다.
+    """
+    prices = pd.to_numeric(values, errors='coerce')
+    if values.dtype == object:
+        retry = prices.isna() & values.notna() & values.ne('')
+        if retry.any():
+            prices[retry] = pd.to_numeric(values[retry].astype(str).str.replace(r'[^\d.]', '', regex=True), errors='coerce')
+    return prices.where(prices > 0).round()
+
+
+def parse_observed_at(values, default_observed_at):
+    """관측 시각 → (유닉스 초 int64 배열, 해석 실패 여부 배열)
+
+    빈 값은 default_observed_at, 숫자(숫자 문자열 포함)는 유닉스 초(EPOCH_MILLIS_THRESHOLD 이상은 밀리초),
+    문자열은 ISO 8601로 먼저 해석하고 실패한 값만 행마다 형식을 추론해 다시 해석한다 (시간대 없는 값은 UTC).
+    해석할 수 없는 값은 적재 시각으로 대체하지 않고 실패로 표시한다.
+    """
+    text = values.astype(object).where(values.notna(), '').astype(str).str.strip()
+    blank = text.eq('').to_numpy()
+    seconds = np.full(len(text), default_observed_at, dtype=np.int64)
+    failed = np.zeros(len(text), dtype=bool)
+
+    numbers = pd.to_numeric(text.where(~blank), errors='coerce').to_numpy(dtype=np.float64)
+    numeric = ~np.isnan(numbers)
+    if numeric.any():
+        epoch = numbers[numeric]
+        epoch = np.where(np.abs(epoch) >= EPOCH_MILLIS_THRESHOLD, epoch / 1000, epoch)
+        valid = np.isfinite(epoch) & (np.abs(epoch) < EPOCH_MILLIS_THRESHOLD)
+        seconds[numeric] = np.where(valid, np.round(np.where(valid, epoch, 0)), default_observed_at)
+        failed[numeric] = ~valid
+
+    strings = ~blank & ~numeric
+    if strings.any():
+        parsed = pd.to_datetime(text[strings], utc=True, errors='coerce', format='ISO8601')
+        retry = parsed.isna()
+        if retry.any():
+            parsed[retry] = pd.to_datetime(text[strings][retry], utc=True, errors='coerce', format='mixed')
+        parsed_ok = parsed.notna().to_numpy()
+        stamps = np.full(len(parsed), default_observed_at, dtype=np.int64)
+        stamps[parsed_ok] = parsed[parsed_ok].astype('int64').to_numpy() // 1_000_000_000
+        seconds[strings] = stamps
+        failed[strings] = ~parsed_ok
+    return seconds, failed
+
+
+def normalize_batch(batch, default_observed_at):
+    """컬럼명 정리, 문자열 trim, 가격/시각 파싱을 배치 단위로 처리
+
+    (Name, Kind, coupang_price, naver_price, observed_at) DataFrame과 버린 행 수 반환
+    (이름/품종이 비었거나, 유효한 가격이 없거나, 관측 시각을 해석할 수 없는 행은 버림)
+    """
+    batch = batch.rename(columns=lambda c: COLUMN_ALIASES.get(str(c).strip().lower(), c))
+    missing = {'Name', 'Kind'} - set(batch.columns)
+    if missing:
+        raise ValueError(f"필수 컬럼 없음: {', '.join(sorted(missing))}")
+    if not set(PRICE_COLUMNS) & set(batch.columns):
+        raise ValueError(f"가격 컬럼 없음: {', '.join(PRICE_COLUMNS)} 중 하나 필요")
+
+    frame = pd.DataFrame({
+        'Name': _clean_strings(batch['Name']),
+        'Kind': _clean_strings(batch['Kind']),
+    })
+    for column in PRICE_COLUMNS:
+        frame[column] = _parse_prices(batch[column]) if column in batch else np.nan
+    bad_time = np.zeros(len(frame), dtype=bool)
+    if 'observed_at' in batch:
+        frame['observed_at'], bad_time = parse_observed_at(batch['observed_at'], default_observed_at)
+    else:
+        frame['observed_at'] = default_observed_at
+
+    valid = (
+        frame['Name'].ne('') & frame['Kind'].ne('')
+        & frame[list(PRICE_COLUMNS)].notna().any(axis=1)
+        & ~bad_time
+    )
+    return frame[valid], int((~valid).sum())
+
+
+def _nullable_ints(values):
+    values = values.to_numpy(dtype=np.float64)
+    missing = np.isnan(values)
+    ints = np.where(missing, 0, values).astype(np.int64).astype(object)
+    ints[missing] = None
+    return ints.tolist()
+
+
+def _upsert_params(frame):
+    return zip(
+        frame['Name'].tolist(), frame['Kind'].tolist(),
+        *(_nullable_ints(frame[column]) for column in PRICE_COLUMNS),
+        frame['observed_at'].tolist(),
+    )
+
+
+def _stage_observations(conn, frame):
+    """배치를 임시 테이블에 적재 후 fruit와 (Name, Kind) 유니크 인덱스로 조인해 관측값 스테이징
+
+    품종 id 조회를 파이썬에서 하지 않고 SQL 한 번의 집합 연산으로 처리한다.
+    """
+    conn.execute(INGEST_STAGE_DDL)
+    conn.execute("DELETE FROM temp.ingest_stage")
+    conn.executemany(
+        "INSERT INTO temp.ingest_stage VALUES (?, ?, ?, ?, ?)",
+        zip(frame['Name'].tolist(), frame['Kind'].tolist(), frame['observed_at'].tolist(),
+            *(frame[column].astype(object).where(frame[column].notna(), None).tolist() for column in PRICE_COLUMNS)),
+    )
+    stage_observations(conn)
+    for retailer, column in zip(RETAILERS, PRICE_COLUMNS):
+        conn.execute(
+            f"""INSERT OR REPLACE INTO temp.observation_stage(variety_id, retailer, observed_at, price)
+                SELECT f.id, ?, s.observed_at, s.{column}
+                FROM temp.ingest_stage s JOIN fruit f ON f.Name = s.Name AND f.Kind = s.Kind
+                WHERE s.{column} IS NOT NULL""",
+            (retailer,),
+        )
+
+
+def ingest_file(path, manager=None, batch_size=BATCH_SIZE, fmt=None, record_history=True, observed_at=None):
+    """가격 파일을 배치별 트랜잭션으로 fruit 테이블에 upsert (+ price_history 추가)
+
+    배치마다 커밋하므로 WAL 모드의 읽기 연결은 적재 중에도 막히지 않는다.
+    """
+    manager = manager or get_connection_manager()
+    default_observed_at = int(time.time()) if observed_at is None else int(observed_at)
+    stats = {'rows': 0, 'upserted': 0, 'rejected': 0, 'history': 0}
+    refresh_days = set()
+
+    with manager.writer() as conn:
+        conn.execute(UNIQUE_INDEX_DDL)
+        ensure_observed_columns(conn)
+
+    start = time.perf_counter()
+    for batch in read_batches(path, batch_size, fmt):
+        stats['rows'] += len(batch)
+        frame, rejected = normalize_batch(batch, default_observed_at)
+        stats['rejected'] += rejected
+        if frame.empty:
+            continue
+        # 같은 배치 안의 중복은 관측 시각이 가장 늦은 행만 반영 (fruit는 품종별 최신가, 이력은 같은 시각의 마지막 값)
+        frame = frame.sort_values('observed_at', kind='stable')
+        latest = frame.drop_duplicates(['Name', 'Kind'], keep='last')
+        with manager.writer() as conn:
+            conn.executemany(UPSERT_SQL, _upsert_params(latest))
+            stats['upserted'] += len(latest)
+            if record_history:
+                _stage_observations(conn, frame)
+                stats['history'] += commit_staged_observations(conn, refresh_days)
+
+    # 기존 관측값을 덮어쓴 날짜는 적재가 끝난 뒤 한 번만 원본에서 다시 집계
+    with manager.writer() as conn:
+        if refresh_days:
+            refresh_rollups(conn, refresh_days)
+        conn.execute("DROP TABLE IF EXISTS temp.ingest_stage")
+        conn.execute("DROP TABLE IF EXISTS temp.observation_stage")
+        if has_season_columns(conn):
+            conn.executemany(
+                NEW_SEASON_SQL,
+                [(mask, season_months(mask), name) for name, mask in get_fruit_season_masks().items() if mask],
+            )
+    # 새 과일 이름 분류 추가 (요약 테이블 트리거가 기본 분류에서 해당 분류로 옮김)
+    sync_taxonomy(manager)
+    stats['seconds'] = time.perf_counter() - start
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m src.utils.ingest', description='쿠팡/네이버 가격 파일 적재')
+    parser.add_argument('paths', nargs='+', help='CSV 또는 JSON Lines 파일')
+    parser.add_argument('--format', choices=('csv', 'jsonl'), help='파일 형식 (기본: 확장자로 판단)')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help=f'트랜잭션당 행 수 (기본 {BATCH_SIZE})')
+    parser.add_argument('--no-history', action='store_true', help='price_history에 관측값을 남기지 않음')
+    args = parser.parse_args(argv)
+
+    for path in args.paths:
+        if not os.path.exists(path):
+            print(f"파일 없음: {path}", file=sys.stderr)
+            return 1
+        stats = ingest_file(path, batch_size=args.batch_size, fmt=args.format, record_history=not args.no_history)
+        rate = stats['rows'] / stats['seconds'] if stats['seconds'] else 0
+        print(
+            f"{path}: {stats['rows']:,}행 읽음, 품종 {stats['upserted']:,}건 반영, {stats['rejected']:,}행 제외, "
+            f"이력 {stats['history']:,}건 ({stats['seconds']:.2f}s, {rate:,.0f} rows/s)"
+        )
+    # 앱 새 프로세스가 SQLite 대신 바로 mmap으로 읽을 열 단위 스냅샷 갱신
+    start = time.perf_counter()
+    rows = export_snapshot()
+    print(f"스냅샷 내보내기: 품종 {rows:,}개 ({time.perf_counter() - start:.2f}s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
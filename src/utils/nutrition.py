@@ -0,0 +1,91 @@
+import json
+import os
+import threading
+
+import pandas as pd
+
+DATA_PATH = 'static/data.json'
+DEFAULT_VARIETY = '일반'
+MISSING = '정보 없음'
+
+# 화면에서 쓰는 키 → data.json 필드명
+FIELDS = {
+    'calories': '칼로리 (kcal/100g)',
+    'sweetness': '당도 (°Brix)',
+    'origin': '주요 원산지',
+    'season': '재배 시기',
+}
+
+
+class NutritionRepository:
+    """data.json 영양 정보 저장소
+
+    (과일명, 품종) → 레코드, 과일명 → 기본 품종('일반', 없으면 첫 품종) 포인터로 O(1) 조회
+    """
+
+    def __init__(self, records, mtime=None):
+        self.records = tuple(records)
+        self.mtime = mtime
+        self.by_variety = {}
+        self.by_fruit = {}
+        self.default_variety = {}
+        for item in self.records:
+            name = item.get('과일명')
+            if not name:
+                continue
+            variety = item.get('품종') or DEFAULT_VARIETY
+            if (name, variety) in self.by_variety:
+                continue
+            self.by_variety[(name, variety)] = item
+            self.by_fruit.setdefault(name, []).append(variety)
+            if variety == DEFAULT_VARIETY or name not in self.default_variety:
+                self.default_variety[name] = variety
+
+    def __contains__(self, fruit_name):
+        return fruit_name in self.default_variety
+
+    def get(self, fruit_name, variety=None):
+        """레코드 조회 (품종 생략 시 기본 품종), 없으면 None"""
+        if variety is None:
+            variety = self.default_variety.get(fruit_name)
+        return self.by_variety.get((fruit_name, variety))
+
+    def varieties(self, fruit_name):
+        """과일의 품종명 목록 (data.json 순서)"""
+        return list(self.by_fruit.get(fruit_name, ()))
+
+    def info(self, fruit_name, variety=None):
+        """화면 표시용 정보 dict (값이 없으면 '정보 없음')"""
+        record = self.get(fruit_name, variety) or {}
+        return {key: record.get(field, MISSING) for key, field in FIELDS.items()}
+
+    def lookup_many(self, fruit_names):
+        """과일명 목록과 같은 순서로 정렬된 영양 정보 DataFrame (없는 값은 NaN)"""
+        fruit_names = list(fruit_names)
+        rows = [self.get(name) or {} for name in fruit_names]
+        return pd.DataFrame(
+            {key: [row.get(field) for row in rows] for key, field in FIELDS.items()},
+            index=pd.Index(fruit_names, name='Name'),
+        )
+
+
+_repositories = {}
+_repository_lock = threading.Lock()
+
+
+def get_nutrition_repository(path=DATA_PATH):
+    """파일 mtime이 바뀐 경우에만 data.json을 다시 파싱"""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return NutritionRepository([])
+    repository = _repositories.get(path)
+    if repository is not None and repository.mtime == mtime:
+        return repository
+    with _repository_lock:
+        repository = _repositories.get(path)
+        if repository is None or repository.mtime != mtime:
+            with open(path, 'r', encoding='utf-8') as f:
+                repository = NutritionRepository(json.load(f), mtime)
+            _repositories[path] = repository
+        return repository
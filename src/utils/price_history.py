@@ -0,0 +1,298 @@
+import sys
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from src.utils.db import get_connection_manager
+from src.utils.price_trends import SEASON_MONTHS, SEASONS
+from src.utils.schema import table_columns
+
+RETAILERS = ('coupang', 'naver')
+RESOLUTIONS = ('day', 'week', 'month')
+
+DAY_SECONDS = 86400
+EPOCH = date(1970, 1, 1)
+
+# 구간 키는 시작일 ('YYYY-MM-DD'), observed_at은 유닉스 초(UTC), 주는 월요일 시작
+# 일 롤업은 원본에서, 주/월 롤업은 일 롤업에서 집계
+# 스테이징 관측값(observed_at) → 구간 시작일
+STAGE_BUCKET_SQL = {
+    'day': "date(observed_at, 'unixepoch')",
+    'week': "date(observed_at, 'unixepoch', '-6 days', 'weekday 1')",
+    'month': "date(observed_at, 'unixepoch', 'start of month')",
+}
+PARENT_BUCKET_SQL = {
+    'week': "date(bucket, '-6 days', 'weekday 1')",
+    'month': "date(bucket, 'start of month')",
+}
+
+HISTORY_DDL = (
+    """CREATE TABLE IF NOT EXISTS price_history (
+        variety_id INTEGER NOT NULL,
+        retailer TEXT NOT NULL,
+        observed_at INTEGER NOT NULL,
+        price REAL NOT NULL,
+        PRIMARY KEY (variety_id, retailer, observed_at)
+    ) WITHOUT ROWID""",
+    # 기간 조회/증분 롤업용 커버링 인덱스 (테이블을 읽지 않고 인덱스만 스캔)
+    "CREATE INDEX IF NOT EXISTS idx_price_history_time ON price_history(observed_at, variety_id, retailer, price)",
+    """CREATE TABLE IF NOT EXISTS price_rollup (
+        resolution TEXT NOT NULL,
+        bucket TEXT NOT NULL,
+        variety_id INTEGER NOT NULL,
+        retailer TEXT NOT NULL,
+        n INTEGER NOT NULL,
+        total REAL NOT NULL,
+        min_price REAL NOT NULL,
+        max_price REAL NOT NULL,
+        PRIMARY KEY (resolution, bucket, variety_id, retailer)
+    ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS idx_price_rollup_variety ON price_rollup(resolution, variety_id, bucket, n, total)",
+)
+
+
+STAGE_DDL = """CREATE TEMP TABLE IF NOT EXISTS observation_stage (
+    variety_id INTEGER NOT NULL,
+    retailer TEXT NOT NULL,
+    observed_at INTEGER NOT NULL,
+    price REAL NOT NULL,
+    PRIMARY KEY (variety_id, retailer, observed_at)
+) WITHOUT ROWID"""
+
+
+def ensure_history_schema(conn):
+    for ddl in HISTORY_DDL:
+        conn.execute(ddl)
+
+
+def has_price_history(manager=None):
+    """롤업된 가격 이력이 있는지 (테이블이 없으면 False)"""
+    manager = manager or get_connection_manager()
+    conn = manager.reader()
+    if not table_columns(conn, 'price_rollup'):
+        return False
+    return conn.execute("SELECT 1 FROM price_rollup LIMIT 1").fetchone() is not None
+
+
+def observation_days(timestamps):
+    """observed_at 목록 → 관측이 있는 UTC 일 번호 집합"""
+    return set(np.unique(np.asarray(list(timestamps), dtype=np.int64) // DAY_SECONDS).tolist())
+
+
+def _week_start(day):
+    return day - timedelta(days=day.weekday())
+
+
+def _next_month(day):
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _rollup_days(conn, start, end):
+    conn.execute(
+        """INSERT INTO price_rollup(resolution, bucket, variety_id, retailer, n, total, min_price, max_price)
+           SELECT 'day', date(observed_at, 'unixepoch') AS bucket, variety_id, retailer,
+                  COUNT(*), SUM(price), MIN(price), MAX(price)
+           FROM price_history
+           WHERE observed_at >= ? AND observed_at < ?
+           GROUP BY bucket, variety_id, retailer""",
+        (start, end),
+    )
+
+
+def _rollup_parent(conn, resolution, start, end):
+    conn.execute(
+        f"""INSERT INTO price_rollup(resolution, bucket, variety_id, retailer, n, total, min_price, max_price)
+            SELECT ?, {PARENT_BUCKET_SQL[resolution]} AS parent, variety_id, retailer,
+                   SUM(n), SUM(total), MIN(min_price), MAX(max_price)
+            FROM price_rollup
+            WHERE resolution = 'day' AND bucket >= ? AND bucket < ?
+            GROUP BY parent, variety_id, retailer""",
+        (resolution, start, end),
+    )
+
+
+def refresh_rollups(conn, days=None):
+    """관측이 바뀐 UTC 일(days)이 속한 일/주/월 구간만 다시 집계 (None이면 전체 재집계)
+
+    늦게 들어온 관측값도 그 날짜가 속한 구간만 다시 계산되므로 결과는 전체 재집계와 같다.
+    """
+    if days is None:
+        conn.execute("DELETE FROM price_rollup")
+        _rollup_days(conn, -(1 << 62), 1 << 62)
+        for resolution in PARENT_BUCKET_SQL:
+            _rollup_parent(conn, resolution, '', '9999')
+        return
+
+    days = sorted(EPOCH + timedelta(days=int(day)) for day in days)
+    for day in days:
+        start = (day - EPOCH).days * DAY_SECONDS
+        conn.execute("DELETE FROM price_rollup WHERE resolution = 'day' AND bucket = ?", (day.isoformat(),))
+        _rollup_days(conn, start, start + DAY_SECONDS)
+
+    parents = {
+        'week': {(_week_start(day), _week_start(day) + timedelta(days=7)) for day in days},
+        'month': {(day.replace(day=1), _next_month(day)) for day in days},
+    }
+    for resolution, ranges in parents.items():
+        for start, end in sorted(ranges):
+            conn.execute("DELETE FROM price_rollup WHERE resolution = ? AND bucket = ?", (resolution, start.isoformat()))
+            _rollup_parent(conn, resolution, start.isoformat(), end.isoformat())
+
+
+def stage_observations(conn, rows=()):
+    """임시 스테이징 테이블을 비우고 (variety_id, retailer, observed_at, price) 행 적재 (같은 키는 마지막 값)"""
+    conn.execute(STAGE_DDL)
+    conn.execute("DELETE FROM temp.observation_stage")
+    conn.executemany("INSERT OR REPLACE INTO temp.observation_stage VALUES (?, ?, ?, ?)", rows)
+
+
+def commit_staged_observations(conn, deferred_days=None):
+    """스테이징된 관측값을 price_history에 반영하고 롤업 갱신, 반영한 행 수 반환
+
+    기존 관측값과 겹치지 않으면 스테이징 분의 집계만 롤업에 더하고(원본 재스캔 없음),
+    겹치면(가격 정정) 해당 날짜가 속한 구간을 원본에서 다시 집계한다.
+    deferred_days(set)를 넘기면 재집계할 날짜를 모아 두기만 하고, 호출자가 마지막에 refresh_rollups로 한 번 처리한다.
+    """
+    count = conn.execute("SELECT COUNT(*) FROM temp.observation_stage").fetchone()[0]
+    if not count:
+        return 0
+    overlap = conn.execute(
+        """SELECT 1 FROM temp.observation_stage s JOIN price_history h
+           ON h.variety_id = s.variety_id AND h.retailer = s.retailer AND h.observed_at = s.observed_at
+           LIMIT 1"""
+    ).fetchone()
+    conn.execute(
+        """INSERT INTO price_history(variety_id, retailer, observed_at, price)
+           SELECT variety_id, retailer, observed_at, price FROM temp.observation_stage WHERE true
+           ON CONFLICT(variety_id, retailer, observed_at) DO UPDATE SET price = excluded.price"""
+    )
+    if overlap is None:
+        for resolution, bucket in STAGE_BUCKET_SQL.items():
+            conn.execute(
+                f"""INSERT INTO price_rollup(resolution, bucket, variety_id, retailer, n, total, min_price, max_price)
+                    SELECT ?, {bucket} AS bucket, variety_id, retailer, COUNT(*), SUM(price), MIN(price), MAX(price)
+                    FROM temp.observation_stage WHERE true
+                    GROUP BY bucket, variety_id, retailer
+                    ON CONFLICT(resolution, bucket, variety_id, retailer) DO UPDATE SET
+                        n = n + excluded.n,
+                        total = total + excluded.total,
+                        min_price = MIN(min_price, excluded.min_price),
+                        max_price = MAX(max_price, excluded.max_price)""",
+                (resolution,),
+            )
+    else:
+        days = observation_days(row[0] for row in conn.execute("SELECT DISTINCT observed_at FROM temp.observation_stage"))
+        if deferred_days is None:
+            refresh_rollups(conn, days)
+        else:
+            deferred_days |= days
+    return count
+
+
+def append_observations(rows, manager=None):
+    """(variety_id, retailer, observed_at, price) 관측값 추가 후 롤업 갱신
+
+    같은 키가 이미 있으면 가격을 덮어쓴다. 추가한 행 수 반환
+    """
+    rows = [(int(v), str(r), int(t), float(p)) for v, r, t, p in rows]
+    if not rows:
+        return 0
+    manager = manager or get_connection_manager()
+    with manager.writer() as conn:
+        ensure_history_schema(conn)
+        stage_observations(conn, rows)
+        return commit_staged_observations(conn)
+
+
+def record_current_prices(manager=None, observed_at=None):
+    """fruit 테이블의 현재 가격(0 제외)을 observed_at 시각의 관측값으로 추가"""
+    manager = manager or get_connection_manager()
+    observed_at = int(time.time()) if observed_at is None else int(observed_at)
+    rows = []
+    for variety_id, coupang, naver in manager.reader().execute("SELECT id, coupang_price, naver_price FROM fruit"):
+        for retailer, price in zip(RETAILERS, (coupang, naver)):
+            if price:
+                rows.append((variety_id, retailer, observed_at, price))
+    return append_observations(rows, manager)
+
+
+def rebuild_rollups(manager=None):
+    manager = manager or get_connection_manager()
+    with manager.writer() as conn:
+        ensure_history_schema(conn)
+        refresh_rollups(conn)
+
+
+def load_rollup(resolution='day', periods=None, manager=None):
+    """구간별 품종 평균가 (bucket, variety_id, Name, Kind, retailer, n, avg_price, min_price, max_price)
+
+    periods가 있으면 최근 periods개 구간만 (롤업 기본키 범위 스캔)
+    """
+    if resolution not in RESOLUTIONS:
+        raise ValueError(f"지원하지 않는 단위: {resolution}")
+    manager = manager or get_connection_manager()
+    conn = manager.reader()
+    if not table_columns(conn, 'price_rollup'):
+        return pd.DataFrame(columns=['bucket', 'variety_id', 'Name', 'Kind', 'retailer', 'n', 'avg_price', 'min_price', 'max_price'])
+    start = ''
+    if periods:
+        start = conn.execute(
+            """SELECT MIN(bucket) FROM (
+                   SELECT DISTINCT bucket FROM price_rollup WHERE resolution = ? ORDER BY bucket DESC LIMIT ?
+               )""",
+            (resolution, int(periods)),
+        ).fetchone()[0] or ''
+    query = """SELECT r.bucket, r.variety_id, f.Name, f.Kind, r.retailer, r.n,
+                      r.total / r.n AS avg_price, r.min_price, r.max_price
+               FROM price_rollup r JOIN fruit f ON f.id = r.variety_id
+               WHERE r.resolution = ? AND r.bucket >= ?
+               ORDER BY r.bucket, r.variety_id, r.retailer"""
+    return pd.read_sql_query(query, conn, params=(resolution, start))
+
+
+def seasonal_ratio_history(manager=None):
+    """월별 롤업 → 품종별 계절 평균가 / 전체 평균가 비율 (id 인덱스, SEASONS 컬럼)
+
+    HistoricalAverageModel 입력용. 관측이 없는 계절은 NaN
+    """
+    manager = manager or get_connection_manager()
+    conn = manager.reader()
+    if not table_columns(conn, 'price_rollup'):
+        return pd.DataFrame(columns=list(SEASONS), dtype=np.float64)
+    monthly = pd.read_sql_query(
+        """SELECT variety_id, CAST(strftime('%m', bucket) AS INTEGER) AS month, SUM(total) AS total, SUM(n) AS n
+           FROM price_rollup WHERE resolution = 'month'
+           GROUP BY variety_id, month""",
+        conn,
+    )
+    month_season = np.empty(13, dtype=object)
+    for season, months in zip(SEASONS, SEASON_MONTHS):
+        month_season[list(months)] = season
+    monthly['season'] = month_season[monthly['month'].to_numpy()]
+    by_season = monthly.groupby(['variety_id', 'season'])[['total', 'n']].sum()
+    overall = monthly.groupby('variety_id')[['total', 'n']].sum()
+    season_avg = (by_season['total'] / by_season['n']).unstack('season')
+    ratios = season_avg.div(overall['total'] / overall['n'], axis=0)
+    return ratios.reindex(columns=list(SEASONS))
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else 'snapshot'
+    start = time.perf_counter()
+    if command == 'snapshot':
+        count = record_current_prices()
+        print(f"현재 가격 {count}건 기록 ({time.perf_counter() - start:.2f}s)")
+    elif command == 'rollup':
+        rebuild_rollups()
+        print(f"롤업 재집계 완료 ({time.perf_counter() - start:.2f}s)")
+    else:
+        print("사용법: python -m src.utils.price_history [snapshot|rollup]")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+from src.utils.seasons import month_bit, season_mask_column
+
+SEASONS = ('봄', '여름', '가을', '겨울')
+SEASON_MONTHS = ((3, 4, 5), (6, 7, 8), (9, 10, 11), (12, 1, 2))
+# 계절별 12비트 월 마스크 (season_mask와 같은 비트 배치)
+SEASON_MASKS = np.array([sum(month_bit(m) for m in months) for months in SEASON_MONTHS], dtype=np.int64)
+# 12비트 마스크 → 포함된 월 수
+_POPCOUNT = np.array([bin(i).count('1') for i in range(1 << 12)], dtype=np.int64)
+
+DEFAULT_SEED = 42
+
+
+def _base_prices(frame):
+    return frame['coupang_price'].to_numpy(dtype=np.float64)
+
+
+class RandomBandModel:
+    """기본가 × [low, high) 균등 난수 (기존 시뮬레이션과 같은 분포, 시드 고정)"""
+
+    def __init__(self, low=0.8, high=1.2, seed=DEFAULT_SEED):
+        self.low = low
+        self.high = high
+        self.seed = seed
+
+    def ratios(self, frame):
+        rng = np.random.default_rng(self.seed)
+        return rng.uniform(self.low, self.high, size=(len(frame), len(SEASONS)))
+
+
+class SeasonalCurveModel:
+    """재배 시기(season_mask) 기반 모델
+
+    계절 3개월 중 제철인 달의 비율만큼 in_season 쪽으로, 나머지는 off_season 쪽으로 가격 비율을 정한다.
+    재배 시기를 모르는 품종(마스크 0)은 1.0, 그 위에 ±noise 폭의 고정 시드 난수를 더한다.
+    """
+
+    def __init__(self, in_season=0.85, off_season=1.15, noise=0.05, seed=DEFAULT_SEED):
+        self.in_season = in_season
+        self.off_season = off_season
+        self.noise = noise
+        self.seed = seed
+
+    def ratios(self, frame):
+        masks = season_mask_column(frame) & ((1 << 12) - 1)
+        coverage = _POPCOUNT[masks[:, None] & SEASON_MASKS[None, :]] / 3.0
+        ratios = self.off_season + (self.in_season - self.off_season) * coverage
+        ratios[masks == 0] = 1.0
+        if self.noise:
+            rng = np.random.default_rng(self.seed)
+            ratios += rng.uniform(-self.noise, self.noise, size=ratios.shape)
+        return ratios
+
+
+class HistoricalAverageModel:
+    """관측된 계절 평균가 / 기본가 비율 사용
+
+    history: id 인덱스, SEASONS 컬럼의 비율 DataFrame. 관측이 없는 칸은 fallback 모델(없으면 1.0)로 채운다.
+    """
+
+    def __init__(self, history, fallback=None):
+        self.history = history.reindex(columns=list(SEASONS))
+        self.fallback = fallback
+
+    def ratios(self, frame):
+        ratios = self.history.reindex(frame['id'].to_numpy()).to_numpy(dtype=np.float64)
+        missing = np.isnan(ratios)
+        if missing.any():
+            fill = self.fallback.ratios(frame) if self.fallback is not None else np.ones_like(ratios)
+            ratios[missing] = fill[missing]
+        return ratios
+
+
+def seasonal_price_matrix(frame, model):
+    """품종 × 계절 가격 행렬 (기본가 열벡터 × 모델 비율 행렬, 한 번의 브로드캐스트)"""
+    return _base_prices(frame)[:, None] * model.ratios(frame)
+
+
+def seasonal_price_trends(frame, model=None):
+    """계절별 가격 트렌드 long DataFrame (Name, Kind, Season, Price, Base_Price)
+
+    행 순서는 품종별로 SEASONS 순서 (기존 iterrows 구현과 동일)
+    """
+    model = SeasonalCurveModel() if model is None else model
+    base = _base_prices(frame)
+    prices = seasonal_price_matrix(frame, model)
+    n_seasons = len(SEASONS)
+    return pd.DataFrame({
+        'Name': np.repeat(frame['Name'].to_numpy(), n_seasons),
+        'Kind': np.repeat(frame['Kind'].to_numpy(), n_seasons),
+        'Season': pd.Categorical.from_codes(np.tile(np.arange(n_seasons), len(frame)), categories=list(SEASONS), ordered=True),
+        'Price': prices.ravel(),
+        'Base_Price': np.repeat(base, n_seasons),
+    })
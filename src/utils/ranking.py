@@ -0,0 +1,68 @@
+import heapq
+
+import numpy as np
+import pandas as pd
+
+
+def min_ranks(values):
+    """오름차순 순위 (같은 값은 같은 순위, 1부터), 정렬 한 번 + searchsorted"""
+    values = np.asarray(values)
+    return np.searchsorted(np.sort(values, kind='stable'), values, side='left') + 1
+
+
+def add_rank_columns(df, column='coupang_price', group='botanical_type'):
+    """가격 순위/백분위 컬럼 추가 (낮은 가격 = 1위)
+
+    price_rank, price_percentile: 전체 기준
+    category_rank, category_size, category_percentile: group 컬럼(식물학적 분류) 기준
+    백분위는 순위 / 전체 수 × 100 (작을수록 저렴)
+    """
+    total = len(df)
+    df['price_rank'] = min_ranks(df[column].to_numpy())
+    df['price_percentile'] = df['price_rank'] / max(total, 1) * 100
+    if group in df:
+        grouped = df.groupby(group, observed=True)[column]
+        df['category_rank'] = grouped.rank(method='min').fillna(0).astype(np.int64)
+        df['category_size'] = grouped.transform('size').fillna(0).astype(np.int64)
+        df['category_percentile'] = df['category_rank'] / df['category_size'].clip(lower=1) * 100
+    return df
+
+
+def grouped_top_k(df, k=3, k_overall=5, key='best_price', group='botanical_type', ascending=True):
+    """분류별 상위 k개와 전체 상위 k_overall개를 한 번의 정렬로 함께 반환
+
+    key 기준 안정 정렬 한 번 → 앞 k_overall행이 전체 목록, 같은 순서를 group 코드로 다시 안정 정렬해 groupby.head(k).
+    같은 값은 원래 행 순서를 유지한다 (nsmallest/nlargest의 keep='first'와 동일).
+    반환: ({분류: DataFrame}, 전체 DataFrame)
+    """
+    values = df[key].to_numpy()
+    order = np.argsort(values if ascending else -values, kind='stable')
+    overall = df.iloc[order[:k_overall]]
+    codes = pd.Categorical(df[group]).codes[order]
+    by_group = df.iloc[order[np.argsort(codes, kind='stable')]].groupby(group, observed=True, sort=False).head(k)
+    return {name: frame for name, frame in by_group.groupby(group, observed=True, sort=False)}, overall
+
+
+def stream_top_k(records, k=3, k_overall=5, key='best_price', group='botanical_type', ascending=True):
+    """grouped_top_k의 스트리밍 버전 (레코드 iterable을 한 번 읽고 분류별 크기 k 힙만 유지)
+
+    전체를 메모리에 올리거나 정렬하지 않으므로 큰 입력(예: 적재 파일 배치)에도 쓸 수 있다.
+    반환: ({분류: [레코드]}, [레코드]), 각 목록은 key 순서
+    """
+    sign = 1 if ascending else -1
+    heaps = {}
+    overall = []
+    for seq, record in enumerate(records):
+        # 최대 힙(부호 반전)으로 현재 k개 중 가장 나쁜 항목을 교체, 같은 값은 먼저 나온 레코드 우선
+        item = (-sign * record[key], -seq, record)
+        heap = heaps.setdefault(record[group], [])
+        for target, size in ((heap, k), (overall, k_overall)):
+            if len(target) < size:
+                heapq.heappush(target, item)
+            elif size and item > target[0]:
+                heapq.heapreplace(target, item)
+
+    def ordered(heap):
+        return [record for _, _, record in sorted(heap, reverse=True)]
+
+    return {name: ordered(heap) for name, heap in heaps.items()}, ordered(overall)
@@ -0,0 +1,316 @@
+import threading
+from itertools import product
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+from src.utils.nutrition import get_nutrition_repository
+from src.utils.retailers import compare_retailers
+from src.utils.snapshot import get_fruit_snapshot
+
+# 건강 목표별 추천 과일
+HEALTH_GOALS = {
+    "다이어트": {
+        "fruits": ["사과", "자두", "딸기", "블루베리", "키위", "자몽"],
+        "reason": "저칼로리, 높은 식이섬유로 포만감을 주며 신진대사를 촉진합니다.",
+        "nutrients": ["식이섬유", "비타민C", "칼륨"]
+    },
+    "면역력 증진": {
+        "fruits": ["오렌지", "키위", "딸기", "블루베리", "망고", "파파야"],
+        "reason": "비타민C와 항산화 물질이 풍부하여 면역체계를 강화합니다.",
+        "nutrients": ["비타민C", "항산화물질", "비타민A"]
+    },
+    "피부 건강": {
+        "fruits": ["아보카도", "망고", "파파야", "딸기", "석류", "블루베리"],
+        "reason": "비타민E, 비타민C, 항산화 물질이 피부 재생과 콜라겐 생성을 돕습니다.",
+        "nutrients": ["비타민E", "비타민C", "베타카로틴"]
+    },
+    "소화 개선": {
+        "fruits": ["파인애플", "파파야", "바나나", "키위", "사과", "배"],
+        "reason": "소화효소와 식이섬유가 풍부하여 장 건강을 개선합니다.",
+        "nutrients": ["식이섬유", "소화효소", "칼륨"]
+    },
+    "빈혈 예방": {
+        "fruits": ["석류", "건포도", "살구", "체리", "딸기", "키위"],
+        "reason": "철분과 비타민C가 풍부하여 혈액 생성과 철분 흡수를 돕습니다.",
+        "nutrients": ["철분", "비타민C", "엽산"]
+    }
+}
+
+# 연령대별 추천 과일
+AGE_GROUPS = {
+    "어린이 (5-12세)": {
+        "fruits": ["바나나", "사과", "딸기", "포도", "오렌지", "복숭아"],
+        "reason": "성장에 필요한 영양소가 풍부하고 달콤한 맛으로 아이들이 좋아합니다.",
+        "nutrients": ["칼슘", "비타민C", "자연당"]
+    },
+    "청소년 (13-19세)": {
+        "fruits": ["바나나", "사과", "키위", "블루베리", "망고", "아보카도"],
+        "reason": "두뇌 발달과 에너지 공급에 필요한 영양소를 제공합니다.",
+        "nutrients": ["오메가3", "비타민B", "항산화물질"]
+    },
+    "성인 (20-64세)": {
+        "fruits": ["사과", "키위", "아보카도", "블루베리", "자몽", "석류"],
+        "reason": "만성질환 예방과 건강 유지에 도움이 되는 항산화 물질이 풍부합니다.",
+        "nutrients": ["항산화물질", "식이섬유", "칼륨"]
+    },
+    "노인 (65세 이상)": {
+        "fruits": ["바나나", "사과", "배", "오렌지", "키위", "멜론"],
+        "reason": "소화가 쉽고 혈압 조절과 뼈 건강에 도움이 되는 영양소를 함유합니다.",
+        "nutrients": ["칼륨", "칼슘", "비타민D"]
+    }
+}
+
+# 성별/특수상황별 추천 과일
+GENDER_SPECIAL = {
+    "남성": {
+        "fruits": ["토마토", "수박", "아보카도", "바나나", "석류", "블루베리"],
+        "reason": "남성 건강에 중요한 라이코펜과 아연이 풍부합니다.",
+        "nutrients": ["라이코펜", "아연", "마그네슘"]
+    },
+    "여성": {
+        "fruits": ["석류", "딸기", "아보카도", "키위", "체리", "크랜베리"],
+        "reason": "여성 호르몬 균형과 철분 보충에 도움이 됩니다.",
+        "nutrients": ["철분", "엽산", "안토시아닌"]
+    },
+    "임산부": {
+        "fruits": ["아보카도", "바나나", "오렌지", "망고", "사과", "딸기"],
+        "reason": "태아 발달에 필요한 엽산과 비타민이 풍부합니다.",
+        "nutrients": ["엽산", "비타민B6", "칼슘"]
+    },
+    "갱년기 여성": {
+        "fruits": ["석류", "체리", "아보카도", "블루베리", "자두", "무화과"],
+        "reason": "호르몬 변화에 따른 증상 완화와 뼈 건강에 도움이 됩니다.",
+        "nutrients": ["식물성 에스트로겐", "칼슘", "마그네슘"]
+    },
+    "해당없음": {
+        "fruits": ["사과", "바나나", "오렌지", "키위", "딸기", "포도"],
+        "reason": "일반적으로 건강에 도움이 되는 기본적인 과일들입니다.",
+        "nutrients": ["비타민C", "식이섬유", "칼륨"]
+    }
+}
+
+# 추천 기준 (결과 dict 키, 기준표, 없는 값일 때 기본값)
+DIMENSIONS = (
+    ("health_goal", HEALTH_GOALS, "면역력 증진"),
+    ("age_group", AGE_GROUPS, "성인 (20-64세)"),
+    ("gender_special", GENDER_SPECIAL, "해당없음"),
+)
+
+
+# 점수 가중치: 선택한 기준 항목에 속하면 기준별 가중치, 영양소 태그 일치도(0~1)에 nutrients 가중치
+DEFAULT_WEIGHTS = MappingProxyType({
+    "health_goal": 1.0,
+    "age_group": 1.0,
+    "gender_special": 1.0,
+    "nutrients": 0.5,
+})
+
+
+class RecommendationCatalog:
+    """추천 기준표를 정수 ID 카탈로그로 컴파일한 색인
+
+    - 과일: 기준표에 처음 나온 순서대로 ID (0, 1, ...)
+    - 기준 항목(예: 다이어트): 추천 과일 ID 비트셋 (int)
+    - 모든 (목표, 연령대, 성별) 조합의 순위 목록을 점수 엔진으로 한 번에 계산 → recommend()는 dict 조회 한 번
+    """
+
+    def __init__(self, dimensions=DIMENSIONS, weights=DEFAULT_WEIGHTS):
+        self.dimensions = dimensions
+        self.fruits = tuple(dict.fromkeys(
+            fruit for _, table, _ in dimensions for entry in table.values() for fruit in entry["fruits"]
+        ))
+        self.fruit_ids = MappingProxyType({fruit: i for i, fruit in enumerate(self.fruits)})
+        # 기준별 항목 → 비트셋, 항목 정보는 읽기 전용으로 공유
+        self.masks = {}
+        self.entries = {}
+        for key, table, _ in dimensions:
+            self.masks[key] = {name: self._bitset(entry["fruits"]) for name, entry in table.items()}
+            self.entries[key] = {
+                name: MappingProxyType({field: tuple(value) if isinstance(value, list) else value for field, value in entry.items()})
+                for name, entry in table.items()
+            }
+        self.scorer = FruitScorer(self, weights)
+        profiles = list(product(*(tuple(table) for _, table, _ in dimensions)))
+        self.ranked = {
+            profile: tuple(self.fruits[i] for i in order.tolist())
+            for profile, (order, _) in zip(profiles, self.scorer.rank(profiles))
+        }
+
+    def _bitset(self, fruits):
+        mask = 0
+        for fruit in fruits:
+            mask |= 1 << self.fruit_ids[fruit]
+        return mask
+
+    def profile(self, *values):
+        """입력값을 기준표 항목으로 정규화 (없는 값은 기준별 기본값)"""
+        return tuple(value if value in table else default for (_, table, default), value in zip(self.dimensions, values))
+
+    def recommend(self, *values):
+        """(기준별 항목 정보 dict, 순위가 매겨진 과일 이름 tuple)"""
+        profile = self.profile(*values)
+        entries = {key: self.entries[key][name] for (key, _, _), name in zip(self.dimensions, profile)}
+        return entries, self.ranked[profile]
+
+
+class FruitScorer:
+    """과일 × (기준 항목, 영양소 태그) 행렬에 대한 가중 내적 점수 엔진
+
+    - 기준 항목 열: 항목 비트셋에 속하면 1
+    - 영양소 태그 열: 과일이 속한 항목 중 그 태그를 가진 항목 비율
+    - 프로필 벡터: 선택한 항목 열에 기준별 가중치, 영양소 태그 열에 선택 항목들의 태그 비율 × nutrients 가중치
+    점수 = 행렬 @ 프로필 벡터, 여러 프로필은 (프로필 수 × 열) 행렬 한 번의 곱으로 계산한다.
+    """
+
+    def __init__(self, catalog, weights=DEFAULT_WEIGHTS):
+        self.catalog = catalog
+        self.weights = dict(weights)
+        self.dimensions = tuple(key for key, _, _ in catalog.dimensions)
+        self.columns = tuple((key, name) for key, table, _ in catalog.dimensions for name in table)
+        self.column_ids = {column: i for i, column in enumerate(self.columns)}
+        self.tags = tuple(dict.fromkeys(
+            tag for key in self.dimensions for entry in catalog.entries[key].values() for tag in entry["nutrients"]
+        ))
+        n_fruits, n_columns = len(catalog.fruits), len(self.columns)
+
+        fruit_ids = np.arange(n_fruits)
+        membership = np.zeros((n_fruits, n_columns))
+        entry_tags = np.zeros((n_columns, len(self.tags)))
+        tag_ids = {tag: i for i, tag in enumerate(self.tags)}
+        for j, (key, name) in enumerate(self.columns):
+            membership[:, j] = (catalog.masks[key][name] >> fruit_ids) & 1
+            entry_tags[j, [tag_ids[tag] for tag in catalog.entries[key][name]["nutrients"]]] = 1
+        tag_share = membership @ entry_tags / np.maximum(membership.sum(axis=1, keepdims=True), 1)
+        self.entry_tags = entry_tags
+        self.matrix = np.hstack([membership, tag_share])
+
+    def profile_columns(self, profiles):
+        """프로필 목록 → (프로필 수 × 기준 수) 항목 열 번호 (없는 값은 기준별 기본값)"""
+        return np.array(
+            [[self.column_ids[(key, name)] for key, name in zip(self.dimensions, self.catalog.profile(*profile))] for profile in profiles],
+            dtype=np.int64,
+        ).reshape(len(profiles), len(self.dimensions))
+
+    def profile_vectors(self, profiles):
+        """(프로필 수 × 열) 가중치 행렬"""
+        columns = self.profile_columns(profiles)
+        n_columns = len(self.columns)
+        vectors = np.zeros((len(columns), self.matrix.shape[1]))
+        rows = np.arange(len(columns))[:, None]
+        vectors[rows, columns] = [self.weights[key] for key in self.dimensions]
+        tags = self.entry_tags[columns].sum(axis=1)
+        vectors[:, n_columns:] = self.weights["nutrients"] * tags / np.maximum(tags.sum(axis=1, keepdims=True), 1)
+        return vectors
+
+    def score(self, profiles):
+        """(프로필 수 × 과일 수) 점수 행렬"""
+        return self.profile_vectors(profiles) @ self.matrix.T
+
+    def rank(self, profiles, k=None):
+        """프로필별 (과일 ID 배열, 점수 배열) 목록
+
+        선택한 기준 항목 중 하나 이상에 속하는 과일만 남긴다 (영양소 태그만 겹치는 과일은 제외).
+        기준 항목 점수 내림차순 → 영양소 태그 점수(동점 해소용) → 과일 ID 순으로 정렬한다.
+        """
+        vectors = self.profile_vectors(profiles)
+        n_columns = len(self.columns)
+        scores = vectors @ self.matrix.T
+        criteria = vectors[:, :n_columns] @ self.matrix[:, :n_columns].T
+        members = (self.matrix[:, self.profile_columns(profiles)] > 0).any(axis=2).T
+        # 부동소수 오차로 동점이 갈리지 않도록 반올림한 점수로 정렬
+        order = np.lexsort((
+            np.broadcast_to(np.arange(scores.shape[1]), scores.shape),
+            -scores.round(9), -criteria.round(9), ~members,
+        ))
+        counts = members.sum(axis=1)
+        if k is not None:
+            counts = np.minimum(counts, k)
+        scores = np.take_along_axis(scores, order, axis=1)
+        return [(row[:n], row_scores[:n]) for row, row_scores, n in zip(order, scores, counts.tolist())]
+
+    def explain(self, profile, k=6):
+        """한 프로필의 상위 k개 과일과 기준별 점수 기여도
+
+        [{"fruit", "score", "criteria": {기준: 기여도}, "nutrients": 일치한 태그 tuple}, ...] (선택한 기준 항목에 속하는 과일만)
+        """
+        vector = self.profile_vectors([profile])[0]
+        columns = self.profile_columns([profile])[0]
+        order, scores = self.rank([profile], k)[0]
+        n_columns = len(self.columns)
+        profile_tags = vector[n_columns:] > 0
+        results = []
+        for fruit_id, score in zip(order.tolist(), scores.tolist()):
+            row = self.matrix[fruit_id]
+            criteria = {key: float(row[column] * vector[column]) for key, column in zip(self.dimensions, columns)}
+            criteria["nutrients"] = float(row[n_columns:] @ vector[n_columns:])
+            matched = (row[n_columns:] > 0) & profile_tags
+            results.append({
+                "fruit": self.catalog.fruits[fruit_id],
+                "score": score,
+                "criteria": criteria,
+                "nutrients": tuple(tag for tag, hit in zip(self.tags, matched) if hit),
+            })
+        return results
+
+
+# 모듈 로드 시 한 번 컴파일 (5 × 4 × 5 = 100개 조합)
+CATALOG = RecommendationCatalog()
+
+
+def recommend_fruits(health_goal, age_group, gender_special):
+    return CATALOG.recommend(health_goal, age_group, gender_special)
+
+
+def explain_recommendations(health_goal, age_group, gender_special, k=6):
+    return CATALOG.scorer.explain((health_goal, age_group, gender_special), k)
+
+
+_cheapest = None
+_cheapest_lock = threading.Lock()
+
+
+def cheapest_varieties(snapshot=None):
+    """과일 이름별 최저가 품종 (판매처 중 최저가 기준, 스냅샷 버전이 바뀔 때만 다시 계산)
+
+    Name 인덱스, Kind / best_price(원/100g) / best_retailer 컬럼
+    """
+    global _cheapest
+    if snapshot is None:
+        snapshot = get_fruit_snapshot()
+    cached = _cheapest
+    if cached is not None and cached[0] == snapshot.version:
+        return cached[1]
+    with _cheapest_lock:
+        if _cheapest is None or _cheapest[0] != snapshot.version:
+            comparison = compare_retailers(snapshot.frame)
+            cheapest = (
+                comparison.sort_values(['best_price', 'id'], kind='stable')
+                .drop_duplicates('Name')
+                .set_index('Name')[['Kind', 'best_price', 'best_retailer']]
+            )
+            _cheapest = (snapshot.version, cheapest)
+        return _cheapest[1]
+
+
+def price_recommendations(fruits, scores=None, budget=None, snapshot=None, repository=None):
+    """추천 과일 목록에 최저가 품종, 원/100g, 1000원당 kcal을 한 번의 merge로 붙이기
+
+    fruits(선택한 기준에 속하는 추천 순위 목록) 순서를 유지하며, budget(원/100g)을 주면 가격이 없거나 예산을 넘는 과일은 제외한다.
+    (priced, unpriced)를 반환하며, unpriced는 가격이 없어 비교하지 못한 과일 이름 목록(예산 적용 전 기준)이다.
+    """
+    repository = repository or get_nutrition_repository()
+    candidates = pd.DataFrame({'Name': list(fruits)})
+    candidates['rank'] = np.arange(1, len(candidates) + 1)
+    if scores is not None:
+        candidates['score'] = np.asarray(scores, dtype=np.float64)
+    calories = pd.to_numeric(repository.lookup_many(candidates['Name'])['calories'], errors='coerce')
+    candidates['calories'] = calories.to_numpy()
+    priced = candidates.merge(cheapest_varieties(snapshot), left_on='Name', right_index=True, how='left')
+    priced['kcal_per_1000won'] = priced['calories'] / priced['best_price'] * 1000
+    unpriced = priced.loc[priced['best_price'].isna(), 'Name'].tolist()
+    if budget:
+        # 예산과 같은 가격은 포함, 가격이 없는 과일(NaN)은 비교 결과가 False라 제외
+        priced = priced[priced['best_price'] <= budget]
+    return priced.reset_index(drop=True), unpriced
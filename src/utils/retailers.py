@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+from src.utils.price_history import RETAILERS
+
+RETAILER_LABELS = {'coupang': '쿠팡', 'naver': '네이버'}
+PRICE_COLUMNS = tuple(f'{retailer}_price' for retailer in RETAILERS)
+# 판매처별 최저가 비율 계산 시 동일 가격(무승부) 구분용 라벨
+TIE = 'tie'
+
+
+def retailer_prices(frame, columns=('id', 'Name', 'Kind', 'botanical_type')):
+    """wide 가격 컬럼 → long (variety, retailer, price) DataFrame (가격 0 = 정보 없음은 제외)
+
+    columns 중 frame에 있는 컬럼은 그대로 따라오고, 'row'는 frame 안에서의 위치
+    """
+    prices = frame[list(PRICE_COLUMNS)].to_numpy(dtype=np.float64)
+    n_retailers = len(RETAILERS)
+    keep = (prices > 0).ravel()
+    rows = np.repeat(np.arange(len(frame)), n_retailers)[keep]
+    long = pd.DataFrame({'row': rows})
+    for column in columns:
+        if column in frame:
+            long[column] = frame[column].to_numpy()[rows]
+    long['retailer'] = pd.Categorical.from_codes(np.tile(np.arange(n_retailers), len(frame))[keep], categories=list(RETAILERS))
+    long['price'] = prices.ravel()[keep]
+    return long
+
+
+def compare_retailers(frame):
+    """품종별 판매처 비교 (가격이 하나라도 있는 품종만)
+
+    long 프레임을 (품종, 가격, 판매처 순서)로 한 번 정렬한 뒤 품종 경계(reduceat)로 집계한다.
+    best_retailer/best_price: 최저가 판매처와 가격 (같은 가격이면 RETAILERS 앞쪽, tied=True)
+    spread, spread_pct: 최고가 - 최저가, 최저가 대비 비율(%)
+    """
+    long = retailer_prices(frame, columns=())
+    rows = long['row'].to_numpy()
+    prices = long['price'].to_numpy()
+    codes = long['retailer'].cat.codes.to_numpy()
+    order = np.lexsort((codes, prices, rows))
+    rows, prices, codes = rows[order], prices[order], codes[order]
+
+    starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]]) if len(rows) else np.array([], dtype=np.int64)
+    counts = np.diff(np.r_[starts, len(rows)])
+    best = prices[starts]
+    worst = np.maximum.reduceat(prices, starts) if len(starts) else best
+    second = np.where(counts > 1, prices[np.minimum(starts + 1, len(prices) - 1)], np.nan)
+
+    comparison = frame.iloc[rows[starts]].reset_index(drop=True)
+    comparison['best_retailer'] = pd.Categorical.from_codes(codes[starts], categories=list(RETAILERS))
+    comparison['best_price'] = best
+    comparison['max_price'] = worst
+    comparison['retailer_count'] = counts
+    comparison['tied'] = second == best
+    comparison['spread'] = worst - best
+    comparison['spread_pct'] = comparison['spread'] / best * 100
+    return comparison
+
+
+def retailer_win_rates(comparison, group='botanical_type'):
+    """group별 판매처 최저가 비율(%) (두 곳 이상 가격이 있는 품종 기준, 동일 가격은 TIE)
+
+    반환: group 인덱스, RETAILERS + TIE 컬럼 비율과 비교 품종 수(compared) 컬럼
+    """
+    comparable = comparison[comparison['retailer_count'] > 1]
+    winners = np.where(comparable['tied'], TIE, comparable['best_retailer'].astype(str))
+    wins = pd.crosstab(comparable[group].to_numpy(), winners).reindex(columns=[*RETAILERS, TIE], fill_value=0)
+    compared = wins.sum(axis=1)
+    rates = wins.div(compared.clip(lower=1), axis=0) * 100
+    rates['compared'] = compared
+    rates.index.name = group
+    rates.columns.name = None
+    return rates
@@ -0,0 +1,11 @@
+def table_columns(conn, table):
+    """테이블의 컬럼명 집합 (테이블이 없으면 빈 집합)"""
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def ensure_column(conn, table, column, declaration):
+    """컬럼이 없을 때만 ALTER TABLE ... ADD COLUMN 실행, 추가 여부 반환"""
+    if column in table_columns(conn, table):
+        return False
+    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+    return True
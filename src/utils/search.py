@@ -0,0 +1,184 @@
+import sqlite3
+import threading
+from collections import defaultdict
+
+from src.utils.fuzzy import BKTree, max_edit_distance
+from src.utils.hangul import is_choseong_query, search_key, to_choseong
+from src.utils.snapshot import get_fruit_snapshot
+
+# trigram 토크나이저는 3글자 이상만 색인하므로 짧은 검색어는 n-gram 보조 색인 사용
+TRIGRAM = 3
+
+# 매칭 등급 (작을수록 우선)
+EXACT_NAME, NAME_PREFIX, NAME_CONTAINS, ALIAS, KIND = range(5)
+
+
+def _ngrams(text, max_n=TRIGRAM):
+    grams = set()
+    for n in range(1, max_n + 1):
+        for i in range(len(text) - n + 1):
+            grams.add(text[i:i + n])
+    return grams
+
+
+def fruit_aliases(names, kinds):
+    """과일명별 영어 별칭 (가장 짧은 Kind 코드 = 기본 품종 코드, 예: 사과 → apple)"""
+    aliases = {}
+    for name, kind in zip(names, kinds):
+        kind = (kind or '').lower()
+        if kind and (name not in aliases or len(kind) < len(aliases[name])):
+            aliases[name] = kind
+    return {name: alias.replace('_', ' ') for name, alias in aliases.items()}
+
+
+class FruitSearchIndex:
+    """fruit 스냅샷에 대한 검색 색인
+
+    - 3글자 이상: SQLite FTS5 (trigram) 가상 테이블, bm25 순위
+    - 1~2글자: Python n-gram 역색인
+    - 초성 검색 (예: 'ㅅㄱ' → 사과): 초성 문자열 n-gram 역색인
+    - 결과가 없으면 자모 분해 이름/품종 코드 BK-tree로 오타 허용 검색 (예: '파인에플' → 파인애플)
+    """
+
+    def __init__(self, snapshot):
+        self.version = snapshot.version
+        columns = snapshot.columns
+        self.ids = columns['id'].tolist()
+        self.names = dict(zip(self.ids, columns['Name'].tolist()))
+        kinds = [(kind or '') for kind in columns['Kind'].tolist()]
+        self.kinds = dict(zip(self.ids, kinds))
+        aliases = fruit_aliases(columns['Name'].tolist(), kinds)
+        self.aliases = {fruit_id: aliases.get(name, '') for fruit_id, name in self.names.items()}
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(':memory:', check_same_thread=False)
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE fruit_fts USING fts5(name, kind, aliases, tokenize='trigram')"
+        )
+        self._conn.executemany(
+            "INSERT INTO fruit_fts(rowid, name, kind, aliases) VALUES (?, ?, ?, ?)",
+            [(i, self.names[i], self.kinds[i].replace('_', ' '), self.aliases[i]) for i in self.ids],
+        )
+
+        self._short = defaultdict(set)
+        self._choseong = defaultdict(set)
+        self._choseong_text = {}
+        for fruit_id in self.ids:
+            for text in (self.names[fruit_id], self.kinds[fruit_id].lower().replace('_', ' '), self.aliases[fruit_id]):
+                for gram in _ngrams(text, TRIGRAM - 1):
+                    self._short[gram].add(fruit_id)
+            cho = to_choseong(self.names[fruit_id])
+            self._choseong_text[fruit_id] = cho
+            for gram in _ngrams(cho):
+                self._choseong[gram].add(fruit_id)
+
+        # 오타 검색용 BK-tree는 처음 필요할 때 구축
+        self._fuzzy = None
+        self._fuzzy_lock = threading.Lock()
+
+    def _fts_match(self, query):
+        phrase = '"' + query.replace('"', '""') + '"'
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT rowid, bm25(fruit_fts, 10.0, 2.0, 1.0) FROM fruit_fts WHERE fruit_fts MATCH ?",
+                (phrase,),
+            ).fetchall()
+        return dict(rows)
+
+    def _choseong_match(self, query):
+        if len(query) <= TRIGRAM:
+            return set(self._choseong.get(query, ()))
+        grams = [query[i:i + TRIGRAM] for i in range(len(query) - TRIGRAM + 1)]
+        candidates = set.intersection(*(self._choseong.get(g, set()) for g in grams))
+        return {i for i in candidates if query in self._choseong_text[i]}
+
+    def _fuzzy_tree(self):
+        if self._fuzzy is None:
+            with self._fuzzy_lock:
+                if self._fuzzy is None:
+                    tree = BKTree()
+                    for fruit_id in self.ids:
+                        tree.add(search_key(self.names[fruit_id]), fruit_id)
+                        if self.kinds[fruit_id]:
+                            tree.add(search_key(self.kinds[fruit_id]), fruit_id)
+                    self._fuzzy = tree
+        return self._fuzzy
+
+    def fuzzy_search(self, query, limit=None):
+        """오타 허용 검색: 자모 분해 편집 거리가 허용 범위 이내인 fruit id 목록 (가까운 순)"""
+        key = search_key(query)
+        max_distance = max_edit_distance(key)
+        if not max_distance or is_choseong_query(key):
+            return []
+        distances = {}
+        for distance, _, fruit_ids in self._fuzzy_tree().search(key, max_distance):
+            for fruit_id in fruit_ids:
+                distances.setdefault(fruit_id, distance)
+        ranked = sorted(distances, key=lambda i: (distances[i], i))
+        return ranked[:limit] if limit else ranked
+
+    def _tier(self, fruit_id, query):
+        name = self.names[fruit_id]
+        if is_choseong_query(query):
+            name = self._choseong_text[fruit_id]
+        if name == query:
+            return EXACT_NAME
+        if name.startswith(query):
+            return NAME_PREFIX
+        if query in name:
+            return NAME_CONTAINS
+        if query.lower() in self.aliases[fruit_id]:
+            return ALIAS
+        return KIND
+
+    def search(self, query, limit=None, fuzzy=True):
+        """순위가 매겨진 fruit id 목록 (정확 일치 > 접두 일치 > 포함 > 별칭 > 품종 코드, 동순위는 bm25)
+
+        fuzzy: 일치 결과가 없을 때 오타 허용 검색으로 대체
+        """
+        query = (query or '').strip()
+        if not query:
+            return []
+        scores = {}
+        if is_choseong_query(query):
+            matched = self._choseong_match(query)
+        elif len(query) < TRIGRAM:
+            matched = self._short.get(query.lower(), set())
+        else:
+            scores = self._fts_match(query)
+            matched = scores.keys()
+        if not matched and fuzzy:
+            return self.fuzzy_search(query, limit)
+        ranked = sorted(matched, key=lambda i: (self._tier(i, query), scores.get(i, 0.0), i))
+        return ranked[:limit] if limit else ranked
+
+    def search_names(self, query, limit=None, fuzzy=True):
+        """검색 결과를 과일명 단위로 묶은 순위 목록"""
+        names = list(dict.fromkeys(self.names[i] for i in self.search(query, fuzzy=fuzzy)))
+        return names[:limit] if limit else names
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_search_index(snapshot=None):
+    """현재 스냅샷 버전의 검색 색인 (버전이 바뀔 때만 재구축)"""
+    global _index
+    if snapshot is None:
+        snapshot = get_fruit_snapshot()
+    index = _index
+    if index is not None and index.version == snapshot.version:
+        return index
+    with _index_lock:
+        if _index is None or _index.version != snapshot.version:
+            _index = FruitSearchIndex(snapshot)
+        return _index
+
+
+def search_fruit_ids(query, limit=None):
+    return get_search_index().search(query, limit)
+
+
+def search_fruit_names(query, limit=None):
+    return get_search_index().search_names(query, limit)
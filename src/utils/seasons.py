@@ -0,0 +1,155 @@
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+
+from src.utils.db import get_connection_manager
+from src.utils.nutrition import DATA_PATH, DEFAULT_VARIETY, get_nutrition_repository
+from src.utils.schema import ensure_column, table_columns
+
+ALL_MONTHS = (1 << 12) - 1
+
+_RANGE = re.compile(r'(\d{1,2})\s*월?\s*[~\-–]\s*(\d{1,2})\s*월')
+_MONTH = re.compile(r'(\d{1,2})\s*월')
+
+SEASON_DDL = """CREATE TABLE IF NOT EXISTS fruit_season (
+    Name TEXT NOT NULL,
+    variety TEXT NOT NULL,
+    season_text TEXT,
+    season_mask INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (Name, variety)
+) WITHOUT ROWID"""
+
+
+def month_bit(month):
+    """1~12월 → 비트 (1월 = 1 << 0)"""
+    return 1 << (month - 1)
+
+
+def month_range_mask(start, end):
+    """start월~end월 구간 마스크 (10월~2월처럼 연말을 넘어가는 구간 포함)"""
+    mask = 0
+    month = start
+    while True:
+        mask |= month_bit(month)
+        if month == end:
+            return mask
+        month = month % 12 + 1
+
+
+def parse_season_mask(text):
+    """'재배 시기' 문자열을 12비트 월 마스크로 변환
+
+    '9월~11월' → 9,10,11월 / '10월~2월' → 10,11,12,1,2월 / '연중', '연중 수입' → 전체
+    해석할 수 없으면 0
+    """
+    if not text:
+        return 0
+    text = str(text)
+    if '연중' in text:
+        return ALL_MONTHS
+    mask = 0
+    for start, end in _RANGE.findall(text):
+        start, end = int(start), int(end)
+        if 1 <= start <= 12 and 1 <= end <= 12:
+            mask |= month_range_mask(start, end)
+    for month in _MONTH.findall(_RANGE.sub(' ', text)):
+        month = int(month)
+        if 1 <= month <= 12:
+            mask |= month_bit(month)
+    return mask
+
+
+def season_months(mask):
+    """마스크에 포함된 월 수"""
+    return bin(mask).count('1')
+
+
+def build_season_masks(records):
+    """data.json 레코드 → ({(과일명, 품종): (재배 시기, 마스크)}, {과일명: 마스크})
+
+    과일 단위 마스크는 '일반' 품종 기준, 없으면 모든 품종의 합집합
+    """
+    variety_masks = {}
+    for item in records:
+        name = item.get('과일명')
+        if not name:
+            continue
+        variety = item.get('품종') or DEFAULT_VARIETY
+        text = item.get('재배 시기')
+        variety_masks[(name, variety)] = (text, parse_season_mask(text))
+
+    fruit_masks = {}
+    for (name, variety), (_, mask) in variety_masks.items():
+        if variety == DEFAULT_VARIETY:
+            fruit_masks[name] = mask
+    for (name, _), (_, mask) in variety_masks.items():
+        if (name, DEFAULT_VARIETY) not in variety_masks:
+            fruit_masks[name] = fruit_masks.get(name, 0) | mask
+    return variety_masks, fruit_masks
+
+
+def ingest_seasons(manager=None, path=DATA_PATH):
+    """data.json의 재배 시기를 파싱해 fruit.season_mask 및 fruit_season 테이블에 저장
+
+    DB의 Kind(영어 코드)와 data.json의 품종(한글)은 1:1로 대응되지 않으므로
+    fruit 행에는 과일 단위 마스크를, 품종별 마스크는 fruit_season 테이블에 저장한다.
+    """
+    manager = manager or get_connection_manager()
+    variety_masks, fruit_masks = build_season_masks(get_nutrition_repository(path).records)
+    with manager.writer() as conn:
+        ensure_column(conn, 'fruit', 'season_mask', 'INTEGER NOT NULL DEFAULT 0')
+        ensure_column(conn, 'fruit', 'season_months', 'INTEGER NOT NULL DEFAULT 0')
+        conn.execute(SEASON_DDL)
+        # (season_mask & ?) 조건에는 b-tree 색인을 쓸 수 없어 이전 버전이 만든 색인은 제거
+        conn.execute("DROP INDEX IF EXISTS idx_fruit_season_mask")
+        conn.execute("DELETE FROM fruit_season")
+        conn.executemany(
+            "INSERT INTO fruit_season(Name, variety, season_text, season_mask) VALUES (?, ?, ?, ?)",
+            [(name, variety, text, mask) for (name, variety), (text, mask) in variety_masks.items()],
+        )
+        conn.execute("UPDATE fruit SET season_mask = 0, season_months = 0")
+        conn.executemany(
+            "UPDATE fruit SET season_mask = ?, season_months = ? WHERE Name = ?",
+            [(mask, season_months(mask), name) for name, mask in fruit_masks.items()],
+        )
+    return len(variety_masks), len(fruit_masks)
+
+
+def has_season_columns(conn):
+    """fruit 테이블에 season_mask/season_months 컬럼이 설치되어 있는지 (python -m src.utils.seasons)"""
+    return {'season_mask', 'season_months'} <= table_columns(conn, 'fruit')
+
+
+_fruit_masks = (None, {})
+
+
+def get_fruit_season_masks(path=DATA_PATH):
+    """data.json 기준 {과일명: 마스크} (season 컬럼이 없는 DB에서 읽기 전용으로 사용, data.json이 바뀔 때만 재계산)"""
+    global _fruit_masks
+    repository = get_nutrition_repository(path)
+    cached_repository, fruit_masks = _fruit_masks
+    if cached_repository is not repository:
+        fruit_masks = build_season_masks(repository.records)[1]
+        _fruit_masks = (repository, fruit_masks)
+    return fruit_masks
+
+
+def season_mask_column(frame):
+    """frame의 과일 단위 마스크 배열 (season_mask 컬럼이 없으면 data.json에서 계산)"""
+    if 'season_mask' in frame:
+        return frame['season_mask'].to_numpy(dtype=np.int64)
+    masks = pd.Series(frame['Name'].to_numpy()).map(get_fruit_season_masks())
+    return masks.fillna(0).to_numpy(dtype=np.int64)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    path = argv[0] if argv else DATA_PATH
+    varieties, fruits = ingest_seasons(path=path)
+    print(f"재배 시기 색인 완료: 과일 {fruits}종, 품종 {varieties}개")
+
+
+if __name__ == '__main__':
+    main()
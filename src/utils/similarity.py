@@ -0,0 +1,145 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from src.utils.nutrition import get_nutrition_repository
+from src.utils.retailers import PRICE_COLUMNS
+from src.utils.seasons import season_mask_column
+from src.utils.snapshot import get_fruit_snapshot
+
+# 특징별 가중치 (정규화 후 곱함): 칼로리, 당도, log 가격, 재배 시기(월 원형 중심 cos/sin)
+FEATURE_WEIGHTS = {
+    'calories': 1.0,
+    'sweetness': 1.0,
+    'price': 1.0,
+    'season_cos': 0.5,
+    'season_sin': 0.5,
+}
+
+# 1~12월의 원 위 좌표 (비트 i = i+1월)
+_MONTH_ANGLES = np.arange(12) * (2 * np.pi / 12)
+
+
+def season_centroids(masks):
+    """12비트 재배 시기 마스크 → 월 원형 평균 (cos, sin), 마스크 0/연중은 (0, 0)"""
+    masks = np.asarray(masks, dtype=np.int64)
+    bits = (masks[:, None] >> np.arange(12)) & 1
+    counts = np.maximum(bits.sum(axis=1), 1)
+    return bits @ np.cos(_MONTH_ANGLES) / counts, bits @ np.sin(_MONTH_ANGLES) / counts
+
+
+def _best_prices(frame):
+    """판매처 중 최저가 (가격 0 = 정보 없음, 모두 없으면 NaN)"""
+    prices = frame[list(PRICE_COLUMNS)].to_numpy(dtype=np.float64)
+    best = np.where(prices > 0, prices, np.inf).min(axis=1)
+    best[np.isinf(best)] = np.nan
+    return best
+
+
+class SimilarityIndex:
+    """품종별 정규화 특징 벡터에 대한 k-최근접 이웃 색인
+
+    - 칼로리/당도/재배 시기: data.json (과일 기본 품종), 가격: 판매처 중 최저가 (log)
+    - 각 특징을 z-점수로 정규화하고 결측값은 0(평균)으로 채운 뒤 가중치를 곱한다.
+    - 행은 과일 이름 순으로 정렬해 두고, 질의 시 전체 거리 벡터 한 번 + 이름 구간별 최솟값(reduceat)으로
+      과일 단위 최근접 이웃을 구한다 (10만 품종에서도 수 ms).
+    """
+
+    def __init__(self, snapshot, repository):
+        self.version = (snapshot.version, repository.mtime)
+        frame = snapshot.frame
+        order = np.argsort(frame['Name'].to_numpy(dtype=str), kind='stable')
+        frame = frame.iloc[order].reset_index(drop=True)
+
+        names = frame['Name'].to_numpy()
+        nutrition = repository.lookup_many(pd.unique(names))
+        prices = _best_prices(frame)
+        masks = season_mask_column(frame)
+        season_cos, season_sin = season_centroids(masks)
+        raw = pd.DataFrame({
+            'calories': pd.to_numeric(nutrition['calories'], errors='coerce').reindex(names).to_numpy(),
+            'sweetness': pd.to_numeric(nutrition['sweetness'], errors='coerce').reindex(names).to_numpy(),
+            'price': np.log(prices),
+            'season_cos': season_cos,
+            'season_sin': season_sin,
+        })
+        self.frame = pd.DataFrame({
+            'id': frame['id'].to_numpy(),
+            'Name': names,
+            'Kind': frame['Kind'].to_numpy(),
+            'price': prices,
+            'calories': raw['calories'].to_numpy(),
+            'sweetness': raw['sweetness'].to_numpy(),
+        })
+
+        mean = raw.mean()
+        std = raw.std(ddof=0).replace(0, 1).fillna(1)
+        weights = pd.Series(FEATURE_WEIGHTS)[raw.columns]
+        self.vectors = np.ascontiguousarray(((raw - mean) / std).fillna(0.0).mul(weights).to_numpy(dtype=np.float32))
+        self.norms = np.einsum('ij,ij->i', self.vectors, self.vectors)
+
+        # 이름별 행 구간 [starts[i], ends[i])
+        self.names, self.starts = np.unique(names, return_index=True)
+        self.ends = np.r_[self.starts[1:], len(names)]
+
+    def _name_code(self, fruit_name):
+        code = int(np.searchsorted(self.names, fruit_name))
+        if code >= len(self.names) or self.names[code] != fruit_name:
+            return None
+        return code
+
+    def nearest(self, fruit_name, k=4, cheaper=False, less_sweet=False):
+        """fruit_name과 가장 비슷한 다른 과일 k개 (과일별로 가장 가까운 품종 1개)
+
+        cheaper: 질의 과일 최저가보다 싼 품종만, less_sweet: 질의 과일보다 당도가 낮은 품종만
+        반환: id, Name, Kind, price, calories, sweetness, distance 컬럼 DataFrame (가까운 순)
+        """
+        code = self._name_code(fruit_name)
+        if code is None:
+            return self.frame.iloc[:0].assign(distance=np.array([], dtype=np.float32))
+        own = slice(self.starts[code], self.ends[code])
+        # 질의 벡터 = 과일 품종들의 평균, |a-b|² = |a|² - 2a·b + |b|² (행렬-벡터 곱 한 번)
+        vector = self.vectors[own].mean(axis=0)
+        distances = self.norms - 2 * (self.vectors @ vector) + vector @ vector
+        distances[own] = np.inf
+        if cheaper:
+            prices = self.frame['price'].to_numpy()
+            distances[~(prices < np.nanmin(prices[own], initial=np.inf))] = np.inf
+        if less_sweet:
+            sweetness = self.frame['sweetness'].to_numpy()
+            distances[~(sweetness < sweetness[self.starts[code]])] = np.inf
+
+        by_name = np.minimum.reduceat(distances, self.starts)
+        k = min(k, int(np.isfinite(by_name).sum()))
+        if k <= 0:
+            return self.frame.iloc[:0].assign(distance=np.array([], dtype=np.float32))
+        top = np.argpartition(by_name, k - 1)[:k]
+        top = top[np.argsort(by_name[top], kind='stable')]
+        rows = [self.starts[c] + int(np.argmin(distances[self.starts[c]:self.ends[c]])) for c in top]
+        result = self.frame.iloc[rows].reset_index(drop=True)
+        result['distance'] = np.sqrt(np.maximum(distances[rows], 0))
+        return result
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_similarity_index(snapshot=None, repository=None):
+    """현재 스냅샷 버전/data.json mtime의 유사도 색인 (둘 중 하나가 바뀔 때만 재구축)"""
+    global _index
+    snapshot = snapshot or get_fruit_snapshot()
+    repository = repository or get_nutrition_repository()
+    version = (snapshot.version, repository.mtime)
+    index = _index
+    if index is not None and index.version == version:
+        return index
+    with _index_lock:
+        if _index is None or _index.version != version:
+            _index = SimilarityIndex(snapshot, repository)
+        return _index
+
+
+def similar_fruits(fruit_name, k=4, cheaper=False, less_sweet=False):
+    return get_similarity_index().nearest(fruit_name, k, cheaper, less_sweet)
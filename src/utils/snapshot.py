@@ -0,0 +1,135 @@
+import threading
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+from src.utils.columnar import SNAPSHOT_DIR, db_fingerprint, read_columns, write_columns
+from src.utils.db import get_connection_manager
+from src.utils.retailers import PRICE_COLUMNS
+
+# SQLite 선언 타입 → NumPy dtype (NULL은 0으로 채움, 가격 0 = 정보 없음), TEXT는 Categorical (NULL은 '')
+_SQLITE_DTYPES = {
+    'INTEGER': np.int64,
+    'REAL': np.float64,
+}
+# 원/100g 가격과 12비트 재배 시기 마스크는 32비트로 충분
+_NARROW_DTYPES = {
+    'INTEGER': np.int32,
+    'REAL': np.float32,
+}
+_NARROW_COLUMNS = frozenset(PRICE_COLUMNS) | {'season_mask'}
+
+
+class FruitSnapshot:
+    """fruit 테이블의 불변 스냅샷 (컬럼별 NumPy 배열/Categorical + pandas 뷰)"""
+
+    def __init__(self, columns, version):
+        for values in columns.values():
+            if isinstance(values, np.ndarray):
+                values.flags.writeable = False
+        self.columns = MappingProxyType(columns)
+        self.version = version
+        self._records = None
+
+    def __len__(self):
+        return len(self.columns['id'])
+
+    @property
+    def frame(self):
+        """스냅샷 배열을 공유하는 새 DataFrame (호출 측에서 컬럼 추가/필터 가능)"""
+        return pd.DataFrame(dict(self.columns), copy=False)
+
+    def varieties(self, fruit_name):
+        """과일 이름 하나의 품종 행 DataFrame (id 순, 쓰지 않는 범주는 제거)"""
+        frame = self.frame
+        frame = frame[frame['Name'] == fruit_name].reset_index(drop=True)
+        for column in frame.select_dtypes('category'):
+            frame[column] = frame[column].cat.remove_unused_categories()
+        return frame
+
+    def records(self):
+        """행 단위 읽기 전용 매핑 목록 (sqlite3.Row처럼 fruit['Name']으로 접근)"""
+        if self._records is None:
+            names = list(self.columns)
+            rows = zip(*(self.columns[name].tolist() for name in names))
+            self._records = tuple(MappingProxyType(dict(zip(names, row))) for row in rows)
+        return self._records
+
+
+def load_fruit_columns(conn):
+    """fruit 테이블을 컬럼별 타입이 지정된 배열로 읽기
+
+    행 팩토리 없는 커서의 튜플을 DataFrame.from_records로 한 번에 받아 컬럼 단위로 변환한다 (행마다 dict 없음).
+    TEXT → Categorical, 가격/재배 시기 마스크 → int32/float32, 그 외 INTEGER/REAL → int64/float64
+    """
+    declared = {row['name']: (row['type'] or '').upper() for row in conn.execute("PRAGMA table_info(fruit)")}
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute("SELECT * FROM fruit ORDER BY id")
+    names = [description[0] for description in cursor.description]
+    raw = pd.DataFrame.from_records(cursor.fetchall(), columns=names, coerce_float=False)
+    columns = {}
+    for name in names:
+        values = raw[name]
+        kind = declared.get(name, '')
+        if kind == 'TEXT':
+            columns[name] = pd.Categorical(values.fillna('').astype(str))
+        elif kind in _SQLITE_DTYPES:
+            dtype = (_NARROW_DTYPES if name in _NARROW_COLUMNS else _SQLITE_DTYPES)[kind]
+            columns[name] = pd.to_numeric(values, errors='coerce').fillna(0).to_numpy(dtype=dtype)
+        else:
+            columns[name] = values.to_numpy(dtype=object)
+    return columns
+
+
+_snapshot = None
+_snapshot_lock = threading.Lock()
+
+
+def export_snapshot(manager=None, directory=SNAPSHOT_DIR):
+    """체크포인트 후 fruit 컬럼을 열 단위 파일로 내보내기 (새 프로세스가 SQLite 대신 mmap으로 로드)"""
+    manager = manager or get_connection_manager()
+    manager.checkpoint()
+    fingerprint = db_fingerprint(manager.db_path)
+    columns = load_fruit_columns(manager.reader())
+    write_columns(columns, fingerprint, directory)
+    return len(columns['id'])
+
+
+def _load_columns(manager):
+    """내보낸 스냅샷이 최신이면 mmap으로, 아니면 SQLite에서 읽기
+
+    읽기 경로는 파일을 쓰지 않는다 (내보내기는 적재 CLI와 python -m src.utils.snapshot에서만).
+    """
+    columns = read_columns(db_fingerprint(manager.db_path))
+    if columns is not None:
+        return columns
+    return load_fruit_columns(manager.reader())
+
+
+def get_fruit_snapshot():
+    """프로세스 전역 fruit 스냅샷 반환
+
+    PRAGMA data_version 또는 파일 stat이 바뀐 경우에만 다시 읽는다.
+    프로세스 시작 시에는 DB 상태가 같은 열 단위 내보내기(.cache/snapshot)가 있으면 SQLite를 읽지 않는다.
+    """
+    global _snapshot
+    manager = get_connection_manager()
+    version = manager.data_version()
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.version == version:
+        return snapshot
+    with _snapshot_lock:
+        if _snapshot is None or _snapshot.version != version:
+            _snapshot = FruitSnapshot(_load_columns(manager), version)
+        return _snapshot
+
+
+def main():
+    rows = export_snapshot()
+    print(f"스냅샷 내보내기 완료: 품종 {rows:,}개 → {SNAPSHOT_DIR}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+import numpy as np
+import pandas as pd
+
+from src.utils.db import get_connection_manager
+from src.utils.schema import table_columns
+from src.utils.snapshot import get_fruit_snapshot
+from src.utils.taxonomy import CATEGORY_ORDER, DEFAULT_CATEGORY, get_taxonomy, sync_taxonomy
+
+# 과일 이름별 / 식물학적 분류별 쿠팡 가격 요약 (가격 0 = 정보 없음은 제외)
+# 평균 = total / n, 분산 = (sumsq - total² / n) / (n - 1)
+STATS_DDL = (
+    """CREATE TABLE IF NOT EXISTS fruit_stats (
+        Name TEXT PRIMARY KEY,
+        n INTEGER NOT NULL,
+        total REAL NOT NULL,
+        sumsq REAL NOT NULL,
+        min_price REAL,
+        max_price REAL
+    ) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS category_stats (
+        category TEXT PRIMARY KEY,
+        n INTEGER NOT NULL,
+        total REAL NOT NULL,
+        sumsq REAL NOT NULL,
+        min_price REAL,
+        max_price REAL
+    ) WITHOUT ROWID""",
+    # 최저/최고가 행이 빠질 때 이름별 MIN/MAX를 인덱스 한 번 탐색으로 다시 구함
+    "CREATE INDEX IF NOT EXISTS idx_fruit_name_price ON fruit(Name, coupang_price)",
+)
+
+# fruit_category에 없는 이름은 기본 분류
+_CATEGORY_OF = f"IFNULL((SELECT category FROM fruit_category WHERE Name = {{name}}), '{DEFAULT_CATEGORY}')"
+
+# 키별로 최저/최고가를 다시 구하는 쿼리 (삭제된 값이 극값이었을 때만 실행)
+_RECOMPUTE = {
+    'fruit_stats': "SELECT {agg}(coupang_price) FROM fruit WHERE Name = {key} AND coupang_price > 0",
+    'category_stats': (
+        "SELECT {agg}(s.{column}) FROM fruit_stats s LEFT JOIN fruit_category c ON c.Name = s.Name "
+        f"WHERE IFNULL(c.category, '{DEFAULT_CATEGORY}') = {{key}}"
+    ),
+}
+_KEY_COLUMNS = {'fruit_stats': 'Name', 'category_stats': 'category'}
+
+
+def _price_source(row):
+    """fruit 행 하나(NEW/OLD)를 요약 한 건으로 (가격이 없으면 0건)"""
+    price = f"{row}.coupang_price"
+    return f"SELECT 1 AS n, {price} AS total, {price} * {price} AS sumsq, {price} AS min_price, {price} AS max_price WHERE {price} > 0"
+
+
+def _name_source(name):
+    """이름 하나의 fruit_stats 요약 (분류가 바뀔 때 옮길 값)"""
+    return f"SELECT n, total, sumsq, min_price, max_price FROM fruit_stats WHERE Name = {name}"
+
+
+def _add_sql(table, key, source):
+    """요약 source를 table의 key 행에 더하기 (없으면 생성)"""
+    column = _KEY_COLUMNS[table]
+    return f"""INSERT INTO {table}({column}, n, total, sumsq, min_price, max_price)
+        SELECT {key}, n, total, sumsq, min_price, max_price FROM ({source}) WHERE true
+        ON CONFLICT({column}) DO UPDATE SET
+            n = n + excluded.n,
+            total = total + excluded.total,
+            sumsq = sumsq + excluded.sumsq,
+            min_price = MIN(min_price, excluded.min_price),
+            max_price = MAX(max_price, excluded.max_price);"""
+
+
+def _remove_sql(table, key, source):
+    """요약 source를 table의 key 행에서 빼기
+
+    합계는 바로 빼고, 빠진 값이 최저/최고가였던 경우에만 극값을 다시 구한다. 0건이 된 행은 삭제.
+    """
+    column = _KEY_COLUMNS[table]
+    min_column = 'coupang_price' if table == 'fruit_stats' else 'min_price'
+    max_column = 'coupang_price' if table == 'fruit_stats' else 'max_price'
+    recompute_min = _RECOMPUTE[table].format(agg='MIN', column=min_column, key=key)
+    recompute_max = _RECOMPUTE[table].format(agg='MAX', column=max_column, key=key)
+    return f"""UPDATE {table} SET
+            n = {table}.n - s.n,
+            total = {table}.total - s.total,
+            sumsq = {table}.sumsq - s.sumsq,
+            min_price = CASE WHEN s.min_price <= {table}.min_price THEN NULL ELSE {table}.min_price END,
+            max_price = CASE WHEN s.max_price >= {table}.max_price THEN NULL ELSE {table}.max_price END
+        FROM ({source}) s WHERE {table}.{column} = {key};
+        DELETE FROM {table} WHERE {column} = {key} AND n <= 0;
+        UPDATE {table} SET
+            min_price = IFNULL(min_price, ({recompute_min})),
+            max_price = IFNULL(max_price, ({recompute_max}))
+        WHERE {column} = {key} AND (min_price IS NULL OR max_price IS NULL);"""
+
+
+def _remove_row(row):
+    return _remove_sql('fruit_stats', f"{row}.Name", _price_source(row)) + _remove_sql(
+        'category_stats', _CATEGORY_OF.format(name=f"{row}.Name"), _price_source(row))
+
+
+def _add_row(row):
+    return _add_sql('fruit_stats', f"{row}.Name", _price_source(row)) + _add_sql(
+        'category_stats', _CATEGORY_OF.format(name=f"{row}.Name"), _price_source(row))
+
+
+# fruit 쓰기마다 이름/분류 요약을 증분 갱신, fruit_category 변경 시 해당 이름의 요약을 분류 사이로 옮김
+# (INSERT OR REPLACE의 암묵적 삭제는 트리거를 실행하지 않으므로 fruit는 UPSERT/UPDATE로 수정)
+STATS_TRIGGERS = (
+    f"""CREATE TRIGGER IF NOT EXISTS fruit_stats_insert AFTER INSERT ON fruit BEGIN
+        {_add_row('NEW')}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS fruit_stats_delete AFTER DELETE ON fruit BEGIN
+        {_remove_row('OLD')}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS fruit_stats_update AFTER UPDATE OF Name, coupang_price ON fruit BEGIN
+        {_remove_row('OLD')}
+        {_add_row('NEW')}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS category_stats_insert AFTER INSERT ON fruit_category BEGIN
+        {_remove_sql('category_stats', f"'{DEFAULT_CATEGORY}'", _name_source('NEW.Name'))}
+        {_add_sql('category_stats', 'NEW.category', _name_source('NEW.Name'))}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS category_stats_delete AFTER DELETE ON fruit_category BEGIN
+        {_remove_sql('category_stats', 'OLD.category', _name_source('OLD.Name'))}
+        {_add_sql('category_stats', f"'{DEFAULT_CATEGORY}'", _name_source('OLD.Name'))}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS category_stats_update AFTER UPDATE OF category ON fruit_category BEGIN
+        {_remove_sql('category_stats', 'OLD.category', _name_source('OLD.Name'))}
+        {_add_sql('category_stats', 'NEW.category', _name_source('NEW.Name'))}
+    END""",
+)
+
+
+def rebuild_stats(conn):
+    """fruit 전체에서 이름별/분류별 요약을 다시 집계 (트리거 설치 직후, 복구용)"""
+    conn.execute("DELETE FROM fruit_stats")
+    conn.execute("DELETE FROM category_stats")
+    conn.execute(
+        """INSERT INTO fruit_stats(Name, n, total, sumsq, min_price, max_price)
+           SELECT Name, COUNT(*), SUM(coupang_price), SUM(coupang_price * coupang_price), MIN(coupang_price), MAX(coupang_price)
+           FROM fruit WHERE coupang_price > 0 AND Name IS NOT NULL GROUP BY Name"""
+    )
+    conn.execute(
+        f"""INSERT INTO category_stats(category, n, total, sumsq, min_price, max_price)
+            SELECT IFNULL(c.category, '{DEFAULT_CATEGORY}') AS cat, SUM(s.n), SUM(s.total), SUM(s.sumsq), MIN(s.min_price), MAX(s.max_price)
+            FROM fruit_stats s LEFT JOIN fruit_category c ON c.Name = s.Name GROUP BY cat"""
+    )
+
+
+def install_stats(manager=None):
+    """분류 테이블을 채우고 요약 테이블/트리거 생성 후 한 번 전체 집계"""
+    manager = manager or get_connection_manager()
+    with manager.writer() as conn:
+        sync_taxonomy(manager)
+        for statement in STATS_DDL + STATS_TRIGGERS:
+            conn.execute(statement)
+        rebuild_stats(conn)
+
+
+def has_stats_tables(conn):
+    """요약 테이블이 설치되어 있는지 (python -m src.utils.stats)"""
+    return bool(table_columns(conn, 'fruit_stats')) and bool(table_columns(conn, 'category_stats'))
+
+
+_SUMMARY_COLUMNS = ['count', 'total', 'sumsq', 'min_price', 'max_price']
+
+
+def _summary_frame(frame, key):
+    """(key, count, total, sumsq, min_price, max_price) → 평균/표준편차를 포함한 요약 DataFrame"""
+    count = frame['count'].to_numpy(dtype=np.float64)
+    total = frame['total'].to_numpy(dtype=np.float64)
+    frame['avg_price'] = total / np.maximum(count, 1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        variance = (frame['sumsq'].to_numpy(dtype=np.float64) - total * total / count) / (count - 1)
+    frame['std_price'] = np.sqrt(np.clip(variance, 0, None))
+    return frame[[key, 'avg_price', 'min_price', 'max_price', 'count', 'std_price']]
+
+
+def _query_summary(sql, key):
+    rows = get_connection_manager().reader().execute(sql).fetchall()
+    return pd.DataFrame([tuple(row) for row in rows], columns=[key] + _SUMMARY_COLUMNS)
+
+
+def _snapshot_fruit_summary():
+    """요약 테이블이 없을 때 스냅샷에서 fruit_stats와 같은 이름별 요약 계산 (DB는 변경하지 않음)"""
+    frame = get_fruit_snapshot().frame
+    prices = frame['coupang_price'].to_numpy(dtype=np.float64)
+    names = frame['Name'].to_numpy(dtype=object)
+    priced = (prices > 0) & (names != '')
+    prices = pd.Series(prices[priced])
+    grouped = pd.DataFrame({'price': prices, 'square': prices * prices}).groupby(names[priced], sort=False)
+    summary = pd.DataFrame({
+        'count': grouped['price'].size(),
+        'total': grouped['price'].sum(),
+        'sumsq': grouped['square'].sum(),
+        'min_price': grouped['price'].min(),
+        'max_price': grouped['price'].max(),
+    })
+    return summary.rename_axis('Name').reset_index()
+
+
+def load_fruit_stats():
+    """과일 이름별 가격 요약 (평균가 내림차순)"""
+    if has_stats_tables(get_connection_manager().reader()):
+        frame = _query_summary(
+            "SELECT Name, n, total, sumsq, min_price, max_price FROM fruit_stats ORDER BY total / n DESC", 'Name'
+        )
+    else:
+        frame = _snapshot_fruit_summary()
+        frame = frame.iloc[np.argsort(-(frame['total'] / frame['count']).to_numpy(), kind='stable')].reset_index(drop=True)
+    return _summary_frame(frame, 'Name')
+
+
+def load_category_stats():
+    """식물학적 분류별 가격 요약 (CATEGORY_ORDER 순, 분류 수만큼의 행만 읽음)"""
+    if has_stats_tables(get_connection_manager().reader()):
+        frame = _query_summary("SELECT category, n, total, sumsq, min_price, max_price FROM category_stats", 'botanical_type')
+    else:
+        fruits = _snapshot_fruit_summary()
+        grouped = fruits.groupby(np.asarray(get_taxonomy().classify(fruits['Name']), dtype=object), sort=False)
+        frame = grouped.agg(
+            count=('count', 'sum'), total=('total', 'sum'), sumsq=('sumsq', 'sum'),
+            min_price=('min_price', 'min'), max_price=('max_price', 'max'),
+        ).rename_axis('botanical_type').reset_index()
+    frame = _summary_frame(frame, 'botanical_type')
+    order = {category: i for i, category in enumerate(CATEGORY_ORDER)}
+    frame['_order'] = [order.get(category, len(order)) for category in frame['botanical_type']]
+    return frame.sort_values(['_order', 'botanical_type']).drop(columns='_order').reset_index(drop=True)
+
+
+def main():
+    install_stats()
+    print(f"가격 요약 재집계 완료: 과일 {len(load_fruit_stats())}종, 분류 {len(load_category_stats())}개")
+
+
+if __name__ == '__main__':
+    main()
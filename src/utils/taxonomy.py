@@ -0,0 +1,129 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from src.utils.db import get_connection_manager
+from src.utils.schema import table_columns
+from src.utils.snapshot import get_fruit_snapshot
+
+# 과실의 식물학적 분류 → 분류 키워드
+BOTANICAL_CATEGORIES = {
+    '이과': ['사과', '배'],
+    '핵과': ['복숭아', '자두', '살구', '체리', '매실', '망고', '람부탄', '리치', '백도', '황도', '청도'],
+    '장과류': ['포도', '블루베리', '감', '구아바', '망고스틴', '바나나', '스타프루트', '아보카도', '용과', '적포도', '청포도', '파파야'],
+    '감과체': ['감귤', '레몬', '오렌지', '자몽', '유자'],
+    '박과열매': ['수박', '멜론', '참외'],
+    '취합과': ['딸기', '체리모야'],
+    '다화과': ['파인애플', '무화과'],
+    '석류과': ['석류'],
+    '삭과': ['두리안'],
+    '기타과실': [],
+}
+DEFAULT_CATEGORY = '기타과실'
+CATEGORY_ORDER = tuple(BOTANICAL_CATEGORIES)
+
+TAXONOMY_DDL = """CREATE TABLE IF NOT EXISTS fruit_category (
+    Name TEXT PRIMARY KEY,
+    category TEXT NOT NULL
+) WITHOUT ROWID"""
+
+
+# 키워드 → 분류 역색인 (같은 키워드가 여러 분류에 있으면 앞쪽 분류), 긴 키워드부터 부분 일치 검사
+KEYWORD_INDEX = {}
+for _category, _keywords in BOTANICAL_CATEGORIES.items():
+    for _keyword in _keywords:
+        KEYWORD_INDEX.setdefault(_keyword, _category)
+_KEYWORDS_BY_LENGTH = sorted(KEYWORD_INDEX, key=len, reverse=True)
+
+
+def classify_name(fruit_name):
+    """키워드 규칙으로 분류: 이름과 같은 키워드 → 이름에 포함된 가장 긴 키워드 → 기타과실
+
+    가장 긴 키워드를 우선하므로 '감귤'은 '감'(장과류)이 아니라 '감귤'(감과체)로 분류된다.
+    """
+    category = KEYWORD_INDEX.get(fruit_name)
+    if category is not None:
+        return category
+    for keyword in _KEYWORDS_BY_LENGTH:
+        if keyword in fruit_name:
+            return KEYWORD_INDEX[keyword]
+    return DEFAULT_CATEGORY
+
+
+class FruitTaxonomy:
+    """과일 이름 → 식물학적 분류 색인
+
+    DB의 fruit_category 테이블(없으면 규칙)로 한 번 만든 dict를 조회하고,
+    처음 보는 이름만 규칙으로 분류해 메모한다.
+    """
+
+    def __init__(self, mapping, version=None):
+        self.mapping = dict(mapping)
+        self.version = version
+        self._lock = threading.Lock()
+
+    def category(self, fruit_name):
+        category = self.mapping.get(fruit_name)
+        if category is None:
+            category = classify_name(fruit_name)
+            with self._lock:
+                self.mapping[fruit_name] = category
+        return category
+
+    def classify(self, names):
+        """이름 배열 → 분류 Categorical (고유 이름마다 한 번만 조회)"""
+        codes, uniques = pd.factorize(np.asarray(names, dtype=object))
+        labels = [self.category(name) for name in uniques]
+        categories = list(CATEGORY_ORDER) + sorted(set(labels) - set(CATEGORY_ORDER))
+        position = {category: i for i, category in enumerate(categories)}
+        # factorize의 결측 코드(-1)는 lookup 마지막 칸(-1 → NaN)으로 매핑
+        lookup = np.array([position[label] for label in labels] + [-1], dtype=np.int64)
+        return pd.Categorical.from_codes(lookup[codes], categories=categories)
+
+
+def sync_taxonomy(manager=None):
+    """fruit 테이블의 과일 이름을 분류해 fruit_category 테이블에 저장 (기존 행은 유지)"""
+    manager = manager or get_connection_manager()
+    with manager.writer() as conn:
+        conn.execute(TAXONOMY_DDL)
+        names = [row[0] for row in conn.execute("SELECT DISTINCT Name FROM fruit WHERE Name IS NOT NULL")]
+        before = conn.total_changes
+        conn.executemany(
+            "INSERT OR IGNORE INTO fruit_category(Name, category) VALUES (?, ?)",
+            [(name, classify_name(name)) for name in names],
+        )
+        return conn.total_changes - before
+
+
+_taxonomy = None
+_taxonomy_lock = threading.Lock()
+
+
+def get_taxonomy(snapshot=None):
+    """현재 스냅샷 버전의 분류 색인 (버전이 바뀔 때만 다시 로드)
+
+    fruit_category 테이블은 python -m src.utils.taxonomy 또는 적재 시에만 채우며,
+    테이블이 없으면 DB를 바꾸지 않고 규칙으로만 분류한다.
+    """
+    global _taxonomy
+    if snapshot is None:
+        snapshot = get_fruit_snapshot()
+    taxonomy = _taxonomy
+    if taxonomy is not None and taxonomy.version == snapshot.version:
+        return taxonomy
+    with _taxonomy_lock:
+        if _taxonomy is None or _taxonomy.version != snapshot.version:
+            conn = get_connection_manager().reader()
+            rows = conn.execute("SELECT Name, category FROM fruit_category") if table_columns(conn, 'fruit_category') else ()
+            _taxonomy = FruitTaxonomy(rows, snapshot.version)
+        return _taxonomy
+
+
+def main():
+    added = sync_taxonomy()
+    print(f"식물학적 분류 색인 완료: 새 과일 {added}종 추가")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+import hashlib
+import os
+import sys
+import threading
+import time
+
+from src.utils.assets import get_asset_registry
+
+# Streamlit 정적 파일 서빙(server.enableStaticServing) 폴더 아래에 저장 → /app/static/thumbnails/... 로 제공
+STATIC_DIR = 'static'
+THUMBNAIL_DIR = os.path.join(STATIC_DIR, 'thumbnails')
+STATIC_URL_PREFIX = '/app/static/'
+
+# 페이지에서 사용하는 표시 폭 (홈 제철 카드, 건강 추천 카드, 영양 분석 카드/상세)
+SEASONAL_WIDTH = 180
+RECOMMENDATION_WIDTH = 240
+CARD_WIDTH = 360
+THUMBNAIL_WIDTHS = (SEASONAL_WIDTH, RECOMMENDATION_WIDTH, CARD_WIDTH)
+
+WEBP_QUALITY = 80
+
+_thumbnails = {}
+_thumbnail_lock = threading.Lock()
+
+
+def _source_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()[:16]
+
+
+def thumbnail_path(source, width):
+    """source 이미지의 width 폭 WebP 썸네일 경로 (원본 해시 + 폭으로 디스크 캐시)
+
+    Pillow가 없거나 변환에 실패하면 원본 경로를 그대로 반환한다.
+    """
+    key = (source, width)
+    cached = _thumbnails.get(key)
+    if cached is not None:
+        return cached
+    with _thumbnail_lock:
+        cached = _thumbnails.get(key)
+        if cached is None:
+            cached = _build_thumbnail(source, width)
+            _thumbnails[key] = cached
+        return cached
+
+
+def _build_thumbnail(source, width):
+    try:
+        from PIL import Image
+    except ImportError:
+        return source
+    try:
+        stem = os.path.splitext(os.path.basename(source))[0]
+        target = os.path.join(THUMBNAIL_DIR, f"{stem}-{_source_hash(source)}-{width}.webp")
+        if os.path.exists(target):
+            return target
+        with Image.open(source) as image:
+            image.thumbnail((width, width * 10), Image.LANCZOS)
+            os.makedirs(THUMBNAIL_DIR, exist_ok=True)
+            # 동시 생성 시 반쯤 쓰인 파일이 노출되지 않도록 임시 파일에 쓴 뒤 교체
+            tmp = f"{target}.{os.getpid()}.tmp"
+            image.save(tmp, 'WEBP', quality=WEBP_QUALITY)
+        os.replace(tmp, target)
+        return target
+    except (OSError, ValueError):
+        return source
+
+
+def _static_serving_enabled():
+    try:
+        import streamlit as st
+        return bool(st.get_option('server.enableStaticServing'))
+    except Exception:
+        return False
+
+
+def thumbnail_url(source, width):
+    """st.image에 넘길 썸네일 주소
+
+    정적 서빙이 켜져 있으면 /app/static/ URL을 반환해 Streamlit이 이미지를 다시 인코딩하지 않고
+    브라우저가 그대로 캐시하도록 한다. 꺼져 있으면 썸네일 파일 경로를 반환한다.
+    """
+    path = thumbnail_path(source, width)
+    if path.startswith(THUMBNAIL_DIR + os.sep) and _static_serving_enabled():
+        return STATIC_URL_PREFIX + os.path.relpath(path, STATIC_DIR).replace(os.sep, '/')
+    return path
+
+
+def resolve_fruit_thumbnail(name, kind=None, width=CARD_WIDTH):
+    """과일 이미지 썸네일 주소 (이미지가 없으면 None)"""
+    source = get_asset_registry().resolve(name, kind)
+    if source is None:
+        return None
+    return thumbnail_url(source, width)
+
+
+def warm_thumbnails(widths=THUMBNAIL_WIDTHS):
+    """이미지 폴더의 모든 이미지에 대해 페이지에서 쓰는 폭의 썸네일 미리 생성"""
+    registry = get_asset_registry()
+    count = 0
+    for source in sorted(set(registry.files.values())):
+        for width in widths:
+            thumbnail_path(source, width)
+            count += 1
+    return count
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    widths = tuple(int(w) for w in argv) or THUMBNAIL_WIDTHS
+    start = time.perf_counter()
+    count = warm_thumbnails(widths)
+    print(f"썸네일 {count}개 준비 완료 ({time.perf_counter() - start:.1f}s) → {THUMBNAIL_DIR}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,20 +1,17 @@
-import sqlite3
-import os
+import numpy as np
 import streamlit as st
+from src.utils.db import get_connection_manager
+from src.utils.snapshot import get_fruit_snapshot
+from src.utils.search import get_search_index
+from src.utils.seasons import get_fruit_season_masks, has_season_columns, month_bit, season_months
 
-# 데이터베이스 연결 함수
+# 데이터베이스 연결 함수 (스레드별 읽기 전용 연결 재사용 - close 하지 않음)
 def get_db_connection():
-    db_path = os.path.join('database', 'a.sqlite3')
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    return conn
+    return get_connection_manager().reader()
 
-# 과일 정보 가져오기 (기존 과일 영양 정보 + 가격 정보 통합)
+# 과일 정보 가져오기 (기존 과일 영양 정보 + 가격 정보 통합, 프로세스 공유 스냅샷 사용)
 def get_fruit_nutrition():
-    conn = get_db_connection()
-    fruits = conn.execute("SELECT * FROM fruit").fetchall()
-    conn.close()
-    return fruits
+    return get_fruit_snapshot().records()
 
 # 과일 가격 정보 가져오기 (새로운 스키마에 맞게 수정)
 def get_fruit_prices(fruit_name=None, variety=None):
@@ -31,26 +28,42 @@ def get_fruit_prices(fruit_name=None, variety=None):
             params.append(f"%{variety}%")
     
     prices = conn.execute(query, params).fetchall()
-    conn.close()
     return prices
 
-# 계절 과일 가져오기 (임시로 모든 과일 반환 - 계절 정보가 없으므로)
-def get_seasonal_fruits(month):
+# 계절 과일 가져오기 (해당 월이 재배 시기에 포함된 과일, 과일별 최저가 품종 1개)
+# 가격 정보가 있는 과일 우선, 재배 기간이 짧은(제철 성격이 강한) 과일 → 저렴한 순으로 정렬
+def get_seasonal_fruits(month, limit=None):
     conn = get_db_connection()
-    # 새로운 스키마에는 계절 정보가 없으므로 모든 과일을 반환
-    fruits = conn.execute("SELECT * FROM fruit").fetchall()
-    conn.close()
+    source, params = 'fruit', []
+    if not has_season_columns(conn):
+        # season 컬럼을 설치하지 않은 DB는 data.json의 마스크를 서브쿼리로 붙여 같은 쿼리 실행 (DB는 변경하지 않음)
+        masks = get_fruit_season_masks()
+        if not masks:
+            return []
+        values = ', '.join(['(?, ?, ?)'] * len(masks))
+        source = f'''(SELECT fruit.*, season.season_mask, season.season_months FROM fruit JOIN (
+            SELECT column1 AS Name, column2 AS season_mask, column3 AS season_months FROM (VALUES {values})
+        ) AS season USING (Name))'''
+        params = [value for name, mask in masks.items() for value in (name, mask, season_months(mask))]
+    fruits = conn.execute(f'''
+        SELECT id, Name, Kind, MIN(NULLIF(coupang_price, 0)) AS coupang_price,
+               naver_price, season_mask, season_months
+        FROM {source}
+        WHERE (season_mask & ?) != 0
+        GROUP BY Name
+        ORDER BY MIN(NULLIF(coupang_price, 0)) IS NULL, season_months, MIN(NULLIF(coupang_price, 0)), Name
+        LIMIT ?
+    ''', (*params, month_bit(month), -1 if limit is None else limit)).fetchall()
     return fruits
 
-# 과일 이름으로 검색하기
+# 과일 이름으로 검색하기 (이름/품종/영어 별칭/초성, 관련도 순)
 def search_fruits(search_term):
-    conn = get_db_connection()
-    fruits = conn.execute('''
-        SELECT * FROM fruit 
-        WHERE Name LIKE ?
-    ''', (f'%{search_term}%',)).fetchall()
-    conn.close()
-    return fruits
+    snapshot = get_fruit_snapshot()
+    fruit_ids = get_search_index(snapshot).search(search_term)
+    # 스냅샷은 id 순으로 정렬되어 있으므로 이진 탐색으로 행 위치 계산
+    positions = np.searchsorted(snapshot.columns['id'], fruit_ids)
+    records = snapshot.records()
+    return [records[pos] for pos in positions]
 
 # 특정 과일의 모든 품종 가져오기
 def get_fruit_varieties(fruit_name):
@@ -59,14 +72,12 @@ def get_fruit_varieties(fruit_name):
         SELECT * FROM fruit 
         WHERE Name = ?
     ''', (fruit_name,)).fetchall()
-    conn.close()
     return varieties
 
 # 과일 이름 목록 가져오기 (중복 제거)
 def get_unique_fruit_names():
     conn = get_db_connection()
     fruits = conn.execute("SELECT DISTINCT Name FROM fruit").fetchall()
-    conn.close()
     return [fruit['Name'] for fruit in fruits]
 
 # 과일 가격 비교 데이터 가져오기
@@ -78,7 +89,6 @@ def get_price_comparison_data():
         WHERE coupang_price > 0
         ORDER BY Name, coupang_price
     ''').fetchall()
-    conn.close()
     return fruits
 
 # CSS 스타일 로드
@@ -0,0 +1,78 @@
+import heapq
+import random
+from types import SimpleNamespace
+
+import pandas as pd
+
+from src.utils.autocomplete import AutocompleteIndex, _build, _finalize
+
+
+def _index_from_entries(entries, limit):
+    root = _build(entries)
+    _finalize(root, limit)
+    index = AutocompleteIndex.__new__(AutocompleteIndex)
+    index._root = root
+    return index
+
+
+def _brute_force(entries, query, limit):
+    """query로 시작하는 모든 키의 과일명별 최고 순위 중 상위 limit개"""
+    best = {}
+    for key, names in entries.items():
+        if key.startswith(query):
+            for name, rank in names.items():
+                if name not in best or rank < best[name]:
+                    best[name] = rank
+    return heapq.nsmallest(limit, best.values())
+
+
+def _snapshot(rows):
+    frame = pd.DataFrame(rows, columns=['Name', 'Kind', 'coupang_price', 'naver_price'])
+    return SimpleNamespace(version=1, frame=frame)
+
+
+def test_trie_matches_brute_force_prefix_scan():
+    rng = random.Random(0)
+    for _ in range(200):
+        entries = {}
+        for _ in range(rng.randint(1, 30)):
+            key = ''.join(rng.choice('abc') for _ in range(rng.randint(1, 6)))
+            names = entries.setdefault(key, {})
+            for _ in range(rng.randint(1, 3)):
+                name = f"f{rng.randint(0, 9)}"
+                rank = (rng.randint(0, 3), rng.randint(-5, 0), name)
+                if name not in names or rank < names[name]:
+                    names[name] = rank
+        limit = rng.randint(1, 5)
+        index = _index_from_entries(entries, limit)
+        queries = {key[:end] for key in entries for end in range(1, len(key) + 1)}
+        queries |= {''.join(rng.choice('abcd') for _ in range(rng.randint(1, 4))) for _ in range(10)}
+        for query in queries:
+            node = index._find(query)
+            found = list(node.top) if node is not None else []
+            assert found == _brute_force(entries, query, limit), (entries, query)
+
+
+def test_whole_kind_prefix_ranks_before_inner_token():
+    index = AutocompleteIndex(_snapshot([
+        ('사과', 'apple', 500, 0),
+        ('망고', 'mango', 700, 0),
+        ('망고', 'mango_apple', 600, 0),
+        ('망고', 'mango_cas', 800, 0),
+    ]))
+    assert index.suggest('apple') == ['사과', '망고']
+    assert index.suggest('mango') == ['망고']
+
+
+def test_suggest_name_jamo_and_choseong():
+    index = AutocompleteIndex(_snapshot([
+        ('사과', 'apple', 500, 0),
+        ('살구', 'apricot', 900, 0),
+        ('청포도', 'grape_green', 700, 0),
+        ('포도', 'grape', 0, 0),
+    ]))
+    assert index.suggest('삭') == ['사과']
+    assert index.suggest('ㅅㄱ') == ['사과', '살구']
+    assert index.suggest('포도') == ['포도', '청포도']
+    assert index.suggest('') == []
+    assert index.suggest('없는') == []
@@ -0,0 +1,67 @@
+import random
+
+from src.utils.fuzzy import BKTree, edit_distance, max_edit_distance
+
+
+def _levenshtein(a, b):
+    """두 행만 쓰는 DP 참조 구현"""
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def _random_word(rng, alphabet='abcdㅅㅏㄱㅗ', max_length=12):
+    return ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, max_length)))
+
+
+def test_edit_distance_matches_dp():
+    rng = random.Random(0)
+    for _ in range(3000):
+        a, b = _random_word(rng), _random_word(rng)
+        assert edit_distance(a, b) == _levenshtein(a, b), (a, b)
+
+
+def test_edit_distance_long_strings():
+    # 비트 병렬 구현은 짧은 쪽 길이만큼의 비트를 쓰므로 64자를 넘는 경우도 확인
+    rng = random.Random(1)
+    for _ in range(50):
+        a, b = _random_word(rng, 'ab', 150), _random_word(rng, 'ab', 150)
+        assert edit_distance(a, b) == _levenshtein(a, b)
+
+
+def test_edit_distance_limit_caps_at_limit_plus_one():
+    rng = random.Random(2)
+    for _ in range(3000):
+        a, b = _random_word(rng), _random_word(rng)
+        limit = rng.randint(0, 5)
+        assert edit_distance(a, b, limit) == min(_levenshtein(a, b), limit + 1), (a, b, limit)
+
+
+def test_max_edit_distance_by_length():
+    assert [max_edit_distance('x' * n) for n in (0, 2, 3, 5, 6, 11, 12, 30)] == [0, 0, 1, 1, 2, 2, 3, 3]
+
+
+def test_bk_tree_search_matches_linear_scan():
+    rng = random.Random(3)
+    for _ in range(30):
+        items = [(_random_word(rng, max_length=8), i) for i in range(rng.randint(1, 200))]
+        tree = BKTree(items)
+        assert tree.size == len({key for key, _ in items})
+        for _ in range(20):
+            query, max_distance = _random_word(rng, max_length=8), rng.randint(0, 3)
+            expected = {}
+            for key, value in items:
+                distance = _levenshtein(query, key)
+                if distance <= max_distance:
+                    expected.setdefault((distance, key), set()).add(value)
+            found = tree.search(query, max_distance)
+            assert [(distance, key) for distance, key, _ in found] == sorted(expected)
+            assert all(values == expected[(distance, key)] for distance, key, values in found)
+
+
+def test_bk_tree_empty():
+    assert BKTree().search('사과', 2) == []
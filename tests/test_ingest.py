@@ -0,0 +1,110 @@
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.db import ConnectionManager
+from src.utils.ingest import ingest_file, normalize_batch, parse_observed_at
+from src.utils.seasons import get_fruit_season_masks, ingest_seasons
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NOW = 2_000_000_000
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """커밋된 DB의 복사본에 연결 (data.json 경로 때문에 저장소 루트에서 실행)"""
+    monkeypatch.chdir(ROOT)
+    db_path = tmp_path / 'a.sqlite3'
+    shutil.copyfile(os.path.join(ROOT, 'database', 'a.sqlite3'), db_path)
+    manager = ConnectionManager(str(db_path))
+    yield manager
+    manager.close_all()
+
+
+def _ingest(manager, tmp_path, lines, header='과일명,품종,coupang_price,observed_at', record_history=True):
+    path = tmp_path / 'prices.csv'
+    path.write_text(header + '\n' + '\n'.join(lines) + '\n', encoding='utf-8')
+    return ingest_file(str(path), manager=manager, observed_at=NOW, record_history=record_history)
+
+
+def _price(manager, name, kind):
+    return manager.reader().execute(
+        "SELECT coupang_price FROM fruit WHERE Name = ? AND Kind = ?", (name, kind)
+    ).fetchone()[0]
+
+
+def test_parse_observed_at_mixed_formats_and_epochs():
+    values = pd.Series(['2026-10-01', '2026-10-02 10:00', '2026-10-03T09:00:00+09:00', '1760000000', '1760000000000', ''])
+    seconds, failed = parse_observed_at(values, NOW)
+    expected = [
+        pd.Timestamp('2026-10-01', tz='UTC').timestamp(),
+        pd.Timestamp('2026-10-02 10:00', tz='UTC').timestamp(),
+        pd.Timestamp('2026-10-03 00:00', tz='UTC').timestamp(),
+        1760000000,
+        1760000000,
+        NOW,
+    ]
+    assert seconds.tolist() == expected
+    assert not failed.any()
+
+
+def test_parse_observed_at_numeric_column():
+    seconds, failed = parse_observed_at(pd.Series([1760000000, np.nan, 1.5e12]), NOW)
+    assert seconds.tolist() == [1760000000, NOW, 1500000000]
+    assert not failed.any()
+
+
+def test_unparseable_observed_at_is_rejected_not_stamped_now():
+    batch = pd.DataFrame({
+        '과일명': ['사과', '사과', '배'],
+        '품종': ['apple', 'apple_hong', 'pear'],
+        'coupang_price': ['1,200원', '900', '1500'],
+        'observed_at': ['2026-10-01', 'garbage', 'inf'],
+    })
+    frame, rejected = normalize_batch(batch, NOW)
+    assert rejected == 2
+    assert frame['Kind'].tolist() == ['apple']
+    assert frame['coupang_price'].tolist() == [1200.0]
+    assert NOW not in frame['observed_at'].tolist()
+
+
+def test_backfill_does_not_overwrite_newer_price(manager, tmp_path):
+    _ingest(manager, tmp_path, ['사과,apple,1200,2026-10-01'])
+    assert _price(manager, '사과', 'apple') == 1200
+
+    stats = _ingest(manager, tmp_path, ['사과,apple,9999,2020-01-01'])
+    assert stats['history'] == 1
+    assert _price(manager, '사과', 'apple') == 1200
+
+    _ingest(manager, tmp_path, ['사과,apple,1500,2026-10-05'])
+    assert _price(manager, '사과', 'apple') == 1500
+
+
+def test_backfill_without_history_does_not_overwrite_newer_price(manager, tmp_path):
+    _ingest(manager, tmp_path, ['사과,apple,1200,2026-10-01'], record_history=False)
+    stats = _ingest(manager, tmp_path, ['사과,apple,9999,2020-01-01'], record_history=False)
+    assert stats['history'] == 0
+    assert _price(manager, '사과', 'apple') == 1200
+
+
+def test_observed_at_is_tracked_per_retailer(manager, tmp_path):
+    header = '과일명,품종,coupang_price,naver_price,observed_at'
+    _ingest(manager, tmp_path, ['사과,apple,1200,,2026-10-05'], header=header, record_history=False)
+    # 네이버 가격은 아직 관측된 적이 없으므로 쿠팡보다 오래된 관측이어도 반영
+    _ingest(manager, tmp_path, ['사과,apple,500,1100,2026-10-01'], header=header, record_history=False)
+    row = manager.reader().execute(
+        "SELECT coupang_price, naver_price FROM fruit WHERE Name = '사과' AND Kind = 'apple'"
+    ).fetchone()
+    assert tuple(row) == (1200, 1100)
+
+
+def test_new_variety_gets_season_mask(manager, tmp_path):
+    ingest_seasons(manager)
+    _ingest(manager, tmp_path, ['망고,mango_new,1000,2026-10-01'])
+    mask = manager.reader().execute(
+        "SELECT season_mask FROM fruit WHERE Name = '망고' AND Kind = 'mango_new'"
+    ).fetchone()[0]
+    assert mask == get_fruit_season_masks()['망고'] != 0
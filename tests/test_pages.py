@@ -0,0 +1,43 @@
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CATEGORY_TAB = "🍎 식물학적 분류별 가격분석"
+SEARCH_TAB = "🔍 상세 검색"
+
+
+@pytest.fixture(autouse=True)
+def repo_root(monkeypatch):
+    monkeypatch.chdir(ROOT)
+
+
+def _price_page(tab):
+    at = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=120)
+    at.session_state['menu'] = '가격 정보'
+    at.session_state['price_tab'] = tab
+    at.run()
+    assert not at.exception
+    return at
+
+
+def test_category_buttons_render_detail():
+    at = _price_page(CATEGORY_TAB)
+    keys = [button.key for button in at.button if button.key and button.key.startswith('cat_btn_')]
+    assert keys
+    for key in keys:
+        at = _price_page(CATEGORY_TAB)
+        at.button(key).click()
+        at.run()
+        assert not at.exception, (key, [e.value for e in at.exception])
+        category = key[len('cat_btn_'):]
+        assert any(f'{category} 상세 분석' in markdown.value for markdown in at.markdown)
+
+
+def test_search_tab_sorts_by_name():
+    at = _price_page(SEARCH_TAB)
+    sort_box = next(box for box in at.selectbox if box.label.startswith('📊'))
+    sort_box.set_value('이름순')
+    at.run()
+    assert not at.exception
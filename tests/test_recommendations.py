@@ -0,0 +1,42 @@
+import itertools
+from types import SimpleNamespace
+
+import pandas as pd
+
+from src.utils.recommendations import price_recommendations
+
+_versions = itertools.count(1_000_000)
+
+
+class _Repository:
+    def lookup_many(self, fruit_names):
+        return pd.DataFrame({'calories': [50.0] * len(list(fruit_names))})
+
+
+def _snapshot(rows):
+    frame = pd.DataFrame(rows, columns=['id', 'Name', 'Kind', 'coupang_price', 'naver_price'])
+    return SimpleNamespace(version=next(_versions), frame=frame)
+
+
+def _recommend(budget):
+    snapshot = _snapshot([
+        (1, '바나나', 'banana', 300, 0),
+        (2, '수박', 'watermelon', 0, 250),
+        (3, '망고', 'mango', 900, 700),
+        (4, '토마토', 'tomato', 0, 0),
+    ])
+    return price_recommendations(['망고', '토마토', '바나나', '수박', '용과'], budget=budget, snapshot=snapshot, repository=_Repository())
+
+
+def test_budget_keeps_ties_and_reports_unpriced():
+    priced, unpriced = _recommend(300)
+    assert priced['Name'].tolist() == ['바나나', '수박']
+    assert priced['rank'].tolist() == [3, 4]
+    assert unpriced == ['토마토', '용과']
+
+
+def test_no_budget_keeps_unpriced_rows():
+    priced, unpriced = _recommend(0)
+    assert priced['Name'].tolist() == ['망고', '토마토', '바나나', '수박', '용과']
+    assert priced['best_price'].isna().tolist() == [False, True, False, False, True]
+    assert unpriced == ['토마토', '용과']
@@ -0,0 +1,37 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from src.utils.columnar import SNAPSHOT_DIR
+from src.utils.db import ConnectionManager
+from src.utils.snapshot import _load_columns, export_snapshot
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    db_path = tmp_path / 'a.sqlite3'
+    shutil.copyfile(os.path.join(ROOT, 'database', 'a.sqlite3'), db_path)
+    manager = ConnectionManager(str(db_path))
+    yield manager
+    manager.close_all()
+
+
+def test_read_path_does_not_write_export(manager, tmp_path):
+    columns = _load_columns(manager)
+    assert len(columns['id']) > 0
+    assert not (tmp_path / SNAPSHOT_DIR).exists()
+
+
+def test_exported_columns_match_sqlite(manager):
+    expected = _load_columns(manager)
+    export_snapshot(manager)
+    loaded = _load_columns(manager)
+    assert isinstance(loaded['coupang_price'], np.memmap)
+    assert list(loaded) == list(expected)
+    for name in expected:
+        assert np.asarray(loaded[name]).tolist() == np.asarray(expected[name]).tolist(), name
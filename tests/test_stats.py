@@ -0,0 +1,102 @@
+import os
+import random
+import shutil
+
+import numpy as np
+import pytest
+
+import src.utils.db as db
+import src.utils.stats as stats
+from src.utils.db import ConnectionManager
+from src.utils.taxonomy import CATEGORY_ORDER, DEFAULT_CATEGORY
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+EXPECTED_FRUIT_STATS = """SELECT Name, COUNT(*), SUM(coupang_price), SUM(coupang_price * coupang_price),
+        MIN(coupang_price), MAX(coupang_price)
+    FROM fruit WHERE coupang_price > 0 AND Name IS NOT NULL GROUP BY Name"""
+EXPECTED_CATEGORY_STATS = f"""SELECT IFNULL(c.category, '{DEFAULT_CATEGORY}') AS cat, COUNT(*), SUM(f.coupang_price),
+        SUM(f.coupang_price * f.coupang_price), MIN(f.coupang_price), MAX(f.coupang_price)
+    FROM fruit f LEFT JOIN fruit_category c ON c.Name = f.Name
+    WHERE f.coupang_price > 0 AND f.Name IS NOT NULL GROUP BY cat"""
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """요약 테이블/트리거를 설치한 DB 복사본을 프로세스 전역 연결 관리자로 사용"""
+    monkeypatch.chdir(ROOT)
+    db_path = tmp_path / 'a.sqlite3'
+    shutil.copyfile(os.path.join(ROOT, 'database', 'a.sqlite3'), db_path)
+    manager = ConnectionManager(str(db_path))
+    monkeypatch.setattr(db, '_manager', manager)
+    stats.install_stats(manager)
+    yield manager
+    manager.close_all()
+
+
+def _summary(conn, sql):
+    return {row[0]: tuple(row[1:]) for row in conn.execute(sql)}
+
+
+def _assert_matches_rebuild(conn):
+    for table, key, expected_sql in (
+        ('fruit_stats', 'Name', EXPECTED_FRUIT_STATS),
+        ('category_stats', 'category', EXPECTED_CATEGORY_STATS),
+    ):
+        actual = _summary(conn, f"SELECT {key}, n, total, sumsq, min_price, max_price FROM {table}")
+        expected = _summary(conn, expected_sql)
+        assert actual.keys() == expected.keys(), table
+        for name, (n, total, sumsq, low, high) in expected.items():
+            got = actual[name]
+            assert got[0] == n and got[3] == low and got[4] == high, (table, name, got, expected[name])
+            assert got[1] == pytest.approx(total) and got[2] == pytest.approx(sumsq, rel=1e-9), (table, name)
+
+
+def _random_price(rng):
+    return rng.choice([None, 0, rng.randint(1, 5000), rng.randint(1, 5000)])
+
+
+def test_triggers_match_full_rebuild_after_random_mutations(manager):
+    rng = random.Random(0)
+    names = [row[0] for row in manager.reader().execute("SELECT DISTINCT Name FROM fruit")] + ['새과일', '용과']
+    categories = list(CATEGORY_ORDER)
+    for step in range(400):
+        with manager.writer() as conn:
+            ids = [row[0] for row in conn.execute("SELECT id FROM fruit")]
+            action = rng.choice(['insert', 'price', 'price', 'rename', 'delete', 'category', 'category_delete'])
+            if action == 'insert':
+                conn.execute(
+                    "INSERT INTO fruit(Name, Kind, coupang_price, naver_price) VALUES (?, ?, ?, 0)",
+                    (rng.choice(names), f"kind_{step}", _random_price(rng)),
+                )
+            elif action == 'price' and ids:
+                conn.execute("UPDATE fruit SET coupang_price = ? WHERE id = ?", (_random_price(rng), rng.choice(ids)))
+            elif action == 'rename' and ids:
+                conn.execute("UPDATE fruit SET Name = ? WHERE id = ?", (rng.choice(names), rng.choice(ids)))
+            elif action == 'delete' and ids:
+                conn.execute("DELETE FROM fruit WHERE id = ?", (rng.choice(ids),))
+            elif action == 'category':
+                conn.execute(
+                    "INSERT INTO fruit_category(Name, category) VALUES (?, ?) ON CONFLICT(Name) DO UPDATE SET category = excluded.category",
+                    (rng.choice(names), rng.choice(categories)),
+                )
+            elif action == 'category_delete':
+                conn.execute("DELETE FROM fruit_category WHERE Name = ?", (rng.choice(names),))
+        if step % 20 == 0:
+            _assert_matches_rebuild(manager.reader())
+    _assert_matches_rebuild(manager.reader())
+
+
+def test_snapshot_fallback_matches_tables(manager, monkeypatch):
+    with manager.writer() as conn:
+        conn.execute("UPDATE fruit SET coupang_price = NULL WHERE id IN (SELECT id FROM fruit ORDER BY id LIMIT 5)")
+    from_tables = (stats.load_fruit_stats(), stats.load_category_stats())
+    monkeypatch.setattr(stats, 'has_stats_tables', lambda conn: False)
+    from_snapshot = (stats.load_fruit_stats(), stats.load_category_stats())
+    for table, fallback in zip(from_tables, from_snapshot):
+        key = table.columns[0]
+        table = table.sort_values(key).reset_index(drop=True)
+        fallback = fallback.sort_values(key).reset_index(drop=True)
+        assert table[key].tolist() == fallback[key].tolist()
+        for column in ('avg_price', 'min_price', 'max_price', 'count', 'std_price'):
+            assert np.allclose(table[column].to_numpy(dtype=float), fallback[column].to_numpy(dtype=float), equal_nan=True), column